@@ -165,3 +165,18 @@ REST_FRAMEWORK = {
         "rest_framework.throttling.UserRateThrottle",
     ],
 }
+
+# Lotes de problemas Simplex (api/simplex/lote/)
+SIMPLEX_LOTE_TRABAJADORES = env.int(
+    "SIMPLEX_LOTE_TRABAJADORES", default=os.cpu_count() or 1
+)
+SIMPLEX_LOTE_MAXIMO = env.int("SIMPLEX_LOTE_MAXIMO", default=1000)
+
+# Procesos para evaluar nodos de ramificación y acotamiento (1 = secuencial)
+SIMPLEX_RAMIFICACION_TRABAJADORES = env.int(
+    "SIMPLEX_RAMIFICACION_TRABAJADORES", default=1
+)
+
+# Tiempo máximo de una resolución Simplex en segundos, salvo que el problema
+# fije el suyo; al agotarse se devuelve la mejor base con estado advertencia
+SIMPLEX_TIEMPO_LIMITE = env.float("SIMPLEX_TIEMPO_LIMITE", default=30.0)
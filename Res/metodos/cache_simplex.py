@@ -0,0 +1,191 @@
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Número máximo de resultados que se mantienen en memoria por proceso
+TAMANO_CACHE_RESULTADOS = 256
+
+
+def _a_json(valor):
+    """Convierte tipos de NumPy a tipos nativos para serializar a JSON."""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def clave_canonica(
+    c: np.ndarray,
+    A: np.ndarray,
+    b: np.ndarray,
+    desigualdades: List[str],
+    tipo_optimizacion: str,
+    tolerancia: float,
+    version: str,
+    opciones: Optional[Dict] = None,
+) -> str:
+    """
+    Hash SHA-256 de la forma canónica del problema.
+
+    El mismo problema escrito con otro espaciado produce la misma clave. Las
+    restricciones se mantienen en el orden recibido: precios sombra, base,
+    tabla final y pasos dependen de ese orden, así que reordenarlas da otra
+    clave. Las opciones del solver que cambian el resultado (motor, regla de
+    pivoteo, etc.) y la versión del solver también forman parte de la clave.
+    """
+    # + 0.0 convierte -0.0 en 0.0 para que ambos produzcan el mismo texto
+    filas = [
+        (desigualdad, float(bi) + 0.0, tuple(float(a) + 0.0 for a in fila))
+        for fila, bi, desigualdad in zip(np.asarray(A), np.asarray(b), desigualdades)
+    ]
+    canonica = {
+        "version": version,
+        "tipo": tipo_optimizacion,
+        "tolerancia": float(tolerancia),
+        "c": [float(x) + 0.0 for x in np.asarray(c)],
+        "restricciones": filas,
+        "opciones": opciones or {},
+    }
+    texto = json.dumps(canonica, sort_keys=True, default=_a_json)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+class CacheResultados:
+    """
+    Caché de resultados de Simplex en dos niveles: un LRU acotado en memoria
+    y la tabla ``ResultadoSimplexCache`` compartida entre procesos.
+
+    Al primer acceso a la tabla se eliminan los resultados de otras
+    versiones del solver. Si la base de datos no está disponible (por
+    ejemplo, fuera de Django) la caché funciona solo en memoria.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        tamano: int = TAMANO_CACHE_RESULTADOS,
+        persistente: bool = True,
+    ):
+        self.version = version
+        self.tamano = tamano
+        self.persistente = persistente
+        self._memoria: "OrderedDict[str, Dict]" = OrderedDict()
+        self._candado = threading.Lock()
+        self._version_verificada = False
+        self.aciertos_memoria = 0
+        self.aciertos_persistentes = 0
+        self.fallos = 0
+
+    def obtener(self, clave: str) -> Optional[Dict]:
+        with self._candado:
+            if clave in self._memoria:
+                self._memoria.move_to_end(clave)
+                self.aciertos_memoria += 1
+                return copy.deepcopy(self._memoria[clave])
+
+        resultado = self._obtener_persistente(clave)
+        with self._candado:
+            if resultado is None:
+                self.fallos += 1
+                return None
+            self.aciertos_persistentes += 1
+            self._guardar_memoria(clave, resultado)
+            return copy.deepcopy(resultado)
+
+    def guardar(self, clave: str, resultado: Dict):
+        resultado = json.loads(json.dumps(resultado, default=_a_json))
+        with self._candado:
+            self._guardar_memoria(clave, resultado)
+        self._guardar_persistente(clave, resultado)
+
+    def invalidar(self):
+        """Vacía ambos niveles de la caché."""
+        with self._candado:
+            self._memoria.clear()
+        modelo = self._modelo()
+        if modelo is not None:
+            try:
+                modelo.objects.all().delete()
+            except Exception as e:
+                logger.warning("No se pudo vaciar la caché persistente: %s", e)
+
+    def estadisticas(self) -> Dict:
+        with self._candado:
+            return self._estadisticas()
+
+    def _estadisticas(self) -> Dict:
+        consultas = self.aciertos_memoria + self.aciertos_persistentes + self.fallos
+        aciertos = self.aciertos_memoria + self.aciertos_persistentes
+        return {
+            "version_solver": self.version,
+            "entradas_memoria": len(self._memoria),
+            "tamano_maximo": self.tamano,
+            "aciertos_memoria": self.aciertos_memoria,
+            "aciertos_persistentes": self.aciertos_persistentes,
+            "fallos": self.fallos,
+            "tasa_aciertos": aciertos / consultas if consultas else 0.0,
+        }
+
+    def _guardar_memoria(self, clave: str, resultado: Dict):
+        # Se llama con el candado tomado
+        self._memoria[clave] = resultado
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.tamano:
+            self._memoria.popitem(last=False)
+
+    def _modelo(self):
+        if not self.persistente:
+            return None
+        try:
+            from .models import ResultadoSimplexCache
+        except Exception:
+            # Django no configurado: solo caché en memoria
+            return None
+        if not self._version_verificada:
+            self._version_verificada = True
+            try:
+                ResultadoSimplexCache.objects.exclude(
+                    version_solver=self.version
+                ).delete()
+            except Exception as e:
+                logger.warning("Caché persistente no disponible: %s", e)
+                self.persistente = False
+                return None
+        return ResultadoSimplexCache
+
+    def _obtener_persistente(self, clave: str) -> Optional[Dict]:
+        modelo = self._modelo()
+        if modelo is None:
+            return None
+        try:
+            entrada = modelo.objects.filter(
+                clave=clave, version_solver=self.version
+            ).first()
+            if entrada is None:
+                return None
+            modelo.objects.filter(pk=entrada.pk).update(aciertos=entrada.aciertos + 1)
+            return entrada.resultado
+        except Exception as e:
+            logger.warning("Error al leer la caché persistente: %s", e)
+            return None
+
+    def _guardar_persistente(self, clave: str, resultado: Dict):
+        modelo = self._modelo()
+        if modelo is None:
+            return
+        try:
+            modelo.objects.update_or_create(
+                clave=clave,
+                defaults={"version_solver": self.version, "resultado": resultado},
+            )
+        except Exception as e:
+            logger.warning("Error al guardar en la caché persistente: %s", e)
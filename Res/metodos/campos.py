@@ -0,0 +1,205 @@
+import base64
+import json
+import struct
+import zlib
+from typing import Tuple
+
+import numpy as np
+from django.db import models
+
+# Cabeceras que identifican cada formato binario
+_MAGIA_TABLA = b"TBL1"
+_MAGIA_PASOS = b"PAS1"
+NIVEL_COMPRESION = 6
+
+# Tipos admitidos, siempre little-endian
+_TIPOS = {b"f": np.dtype("<f4"), b"d": np.dtype("<f8")}
+
+# Claves de los pasos cuyo valor es una tabla
+_CLAVES_TABLA = ("tabla", "tabla_inicial")
+
+
+def _empaquetar(tabla) -> bytes:
+    """
+    Serializa una tabla como tipo, dimensiones y datos crudos. Se guarda en
+    float32 solo si la conversión no pierde ningún valor.
+    """
+    tabla = np.asarray(tabla, dtype=np.float64)
+    reducida = tabla.astype("<f4")
+    if np.array_equal(reducida, tabla):
+        codigo, datos = b"f", reducida
+    else:
+        codigo, datos = b"d", tabla.astype("<f8", copy=False)
+    cabecera = struct.pack(f"<cB{tabla.ndim}I", codigo, tabla.ndim, *tabla.shape)
+    return cabecera + datos.tobytes()
+
+
+def _desempaquetar(buffer: bytes, inicio: int = 0) -> Tuple[np.ndarray, int]:
+    """Lee una tabla de ``buffer`` sin copiar los datos. Devuelve la tabla y el fin."""
+    codigo, ndim = struct.unpack_from("<cB", buffer, inicio)
+    forma = struct.unpack_from(f"<{ndim}I", buffer, inicio + 2)
+    tipo = _TIPOS[codigo]
+    inicio_datos = inicio + 2 + 4 * ndim
+    cantidad = int(np.prod(forma, dtype=np.int64))
+    tabla = np.frombuffer(
+        buffer, dtype=tipo, count=cantidad, offset=inicio_datos
+    ).reshape(forma)
+    return tabla, inicio_datos + cantidad * tipo.itemsize
+
+
+def codificar_tabla(tabla) -> bytes:
+    return _MAGIA_TABLA + zlib.compress(_empaquetar(tabla), NIVEL_COMPRESION)
+
+
+def decodificar_tabla(datos: bytes) -> np.ndarray:
+    """La tabla devuelta es de solo lectura; se copia antes de modificarla."""
+    datos = bytes(datos)
+    if not datos.startswith(_MAGIA_TABLA):
+        raise ValueError("Los datos no son una tabla codificada")
+    tabla, _ = _desempaquetar(zlib.decompress(datos[len(_MAGIA_TABLA) :]))
+    return tabla
+
+
+def codificar_pasos(pasos) -> bytes:
+    """
+    Codifica la lista de pasos (o el registro de pivotes): la estructura va
+    como JSON y cada tabla como bloque binario, todo en un solo flujo zlib.
+    """
+    tablas = []
+
+    def extraer(valor):
+        if isinstance(valor, dict):
+            return {
+                clave: (
+                    {"__tabla__": _agregar(tablas, v)}
+                    if clave in _CLAVES_TABLA and v is not None
+                    else extraer(v)
+                )
+                for clave, v in valor.items()
+            }
+        if isinstance(valor, (list, tuple)):
+            return [extraer(v) for v in valor]
+        return valor
+
+    estructura = json.dumps(extraer(pasos), default=_a_nativo).encode("utf-8")
+    cuerpo = b"".join(
+        [struct.pack("<I", len(estructura)), estructura]
+        + [_empaquetar(tabla) for tabla in tablas]
+    )
+    return _MAGIA_PASOS + zlib.compress(cuerpo, NIVEL_COMPRESION)
+
+
+def _agregar(tablas, tabla) -> int:
+    tablas.append(tabla)
+    return len(tablas) - 1
+
+
+def decodificar_pasos(datos: bytes):
+    datos = bytes(datos)
+    if not datos.startswith(_MAGIA_PASOS):
+        raise ValueError("Los datos no son pasos codificados")
+    cuerpo = zlib.decompress(datos[len(_MAGIA_PASOS) :])
+    (largo,) = struct.unpack_from("<I", cuerpo)
+    estructura = json.loads(cuerpo[4 : 4 + largo])
+
+    tablas = []
+    posicion = 4 + largo
+    while posicion < len(cuerpo):
+        tabla, posicion = _desempaquetar(cuerpo, posicion)
+        tablas.append(tabla)
+
+    def restaurar(valor):
+        if isinstance(valor, dict):
+            if set(valor) == {"__tabla__"}:
+                return tablas[valor["__tabla__"]]
+            return {clave: restaurar(v) for clave, v in valor.items()}
+        if isinstance(valor, list):
+            return [restaurar(v) for v in valor]
+        return valor
+
+    return restaurar(estructura)
+
+
+def _a_nativo(valor):
+    if isinstance(valor, np.generic):
+        return valor.item()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def a_listas(valor):
+    """Convierte las tablas NumPy de una estructura en listas (para JSON)."""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, dict):
+        return {clave: a_listas(v) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [a_listas(v) for v in valor]
+    return valor
+
+
+class _CampoBinarioComprimido(models.BinaryField):
+    """
+    Base de los campos que guardan valores NumPy comprimidos. En Python el
+    valor es el objeto decodificado; en la base de datos, bytes.
+    """
+
+    def codificar(self, valor) -> bytes:
+        raise NotImplementedError
+
+    def decodificar(self, datos: bytes):
+        raise NotImplementedError
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return self.decodificar(value)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, (np.ndarray, list, dict)):
+            return value
+        if isinstance(value, str):
+            # JSON de versiones anteriores o base64 de value_to_string
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                return self.decodificar(base64.b64decode(value))
+            # Valores guardados con json.dumps dentro de un JSONField
+            if isinstance(value, str):
+                value = json.loads(value)
+            return value
+        return self.decodificar(value)
+
+    def get_prep_value(self, value):
+        if value is None or isinstance(value, (bytes, memoryview)):
+            return value
+        return self.codificar(self.to_python(value))
+
+    def value_to_string(self, obj):
+        datos = self.get_prep_value(self.value_from_object(obj))
+        return None if datos is None else base64.b64encode(bytes(datos)).decode("ascii")
+
+
+class CampoTabla(_CampoBinarioComprimido):
+    """Tabla Simplex guardada como arreglo float64/float32 comprimido."""
+
+    def codificar(self, valor) -> bytes:
+        return codificar_tabla(valor)
+
+    def decodificar(self, datos: bytes) -> np.ndarray:
+        return decodificar_tabla(datos)
+
+    def to_python(self, value):
+        value = super().to_python(value)
+        if isinstance(value, list):
+            return np.asarray(value, dtype=np.float64)
+        return value
+
+
+class CampoPasos(_CampoBinarioComprimido):
+    """Pasos del Simplex (lista o registro de pivotes) con tablas binarias."""
+
+    def codificar(self, valor) -> bytes:
+        return codificar_pasos(valor)
+
+    def decodificar(self, datos: bytes):
+        return decodificar_pasos(datos)
@@ -0,0 +1,119 @@
+import numpy as np
+from typing import List, Optional
+
+# Un pivote del crash debe ser al menos esta fracción del mayor |a_ij| de su
+# fila (entre las columnas activas), para no elegir bases mal condicionadas
+UMBRAL_PIVOTE_CRASH = 0.1
+
+
+def base_crash(
+    A: np.ndarray,
+    b: np.ndarray,
+    desigualdades: List[str],
+    tolerancia: float = 1e-9,
+) -> Optional[List[int]]:
+    """
+    Base inicial (crash al estilo LTSF) que pone variables de decisión en
+    las filas ``>=`` y ``=``, que de otro modo empiezan con una artificial
+    básica, para acortar la Fase I.
+
+    Se elige repetidamente la fila activa con menos coeficientes no nulos
+    entre las columnas activas y, en ella, una variable de decisión con
+    coeficiente grande (positivo si lo hay), prefiriendo la que aparece en
+    menos filas activas. La variable se elimina de las demás filas como en
+    la eliminación gaussiana, así que la base es no singular. Al final se
+    devuelven a su artificial las filas que dejarían la base infactible.
+
+    Las columnas se numeran como en la tabla inicial (variables, holguras,
+    artificiales) y los signos deben estar normalizados (b >= 0). Devuelve
+    None si ninguna fila conserva una variable de decisión.
+    """
+    num_restr, num_vars = A.shape
+    num_holgura = sum(1 for d in desigualdades if d != "=")
+
+    # Base de la tabla inicial: holgura en "<=", artificial en el resto
+    unitarias = []
+    holgura = artificial = 0
+    for d in desigualdades:
+        if d == "<=":
+            unitarias.append(num_vars + holgura)
+        else:
+            unitarias.append(num_vars + num_holgura + artificial)
+            artificial += 1
+        if d != "=":
+            holgura += 1
+    base = list(unitarias)
+
+    # Eliminación restringida a las filas >= y =
+    trabajo = np.array(A, dtype=np.float64)
+    filas_activas = np.array([d != "<=" for d in desigualdades])
+    columnas_activas = np.ones(num_vars, dtype=bool)
+    asignadas = 0
+
+    while filas_activas.any() and columnas_activas.any():
+        no_nulos = (np.abs(trabajo) > tolerancia) & columnas_activas
+        conteo_filas = np.where(filas_activas, no_nulos.sum(axis=1), 0)
+        if not conteo_filas.any():
+            break
+        conteo_filas = np.where(conteo_filas > 0, conteo_filas, num_vars + 1)
+        fila = int(np.argmin(conteo_filas))
+        filas_activas[fila] = False
+
+        coeficientes = np.where(columnas_activas, trabajo[fila], 0.0)
+        mayor = np.abs(coeficientes).max()
+        candidatas = np.abs(coeficientes) >= max(
+            UMBRAL_PIVOTE_CRASH * mayor, tolerancia
+        )
+        positivas = candidatas & (coeficientes > 0)
+        candidatas = np.flatnonzero(positivas if positivas.any() else candidatas)
+
+        conteo_columnas = no_nulos[filas_activas][:, candidatas].sum(axis=0)
+        orden = np.lexsort((-np.abs(coeficientes[candidatas]), conteo_columnas))
+        columna = int(candidatas[orden[0]])
+        base[fila] = columna
+        asignadas += 1
+        columnas_activas[columna] = False
+        factores = trabajo[filas_activas, columna] / trabajo[fila, columna]
+        trabajo[filas_activas] -= np.outer(factores, trabajo[fila])
+
+    if not asignadas:
+        return None
+    return _hacer_factible(A, b, base, unitarias, num_vars, tolerancia)
+
+
+def _hacer_factible(
+    A: np.ndarray,
+    b: np.ndarray,
+    base: List[int],
+    unitarias: List[int],
+    num_vars: int,
+    tolerancia: float,
+) -> Optional[List[int]]:
+    """
+    Devuelve filas del crash a su holgura o artificial hasta que la base sea
+    primal factible: la de la variable de decisión con valor negativo o, si
+    queda negativa una holgura o artificial, la de la variable que más aporta
+    a esa fila. Con k variables de decisión en la base basta resolver un
+    sistema k x k (k <= número de variables). Devuelve None si ese sistema
+    es singular.
+    """
+    filas = [i for i, j in enumerate(base) if j < num_vars]
+    while filas:
+        columnas = [base[i] for i in filas]
+        try:
+            valores = np.linalg.solve(A[np.ix_(filas, columnas)], b[filas])
+        except np.linalg.LinAlgError:
+            # Al devolver filas el subsistema puede quedar singular
+            return None
+        residuos = b - A[:, columnas] @ valores
+        residuos[filas] = 0.0
+        if valores.min() < -tolerancia:
+            k = int(np.argmin(valores))
+        elif residuos.min() < -tolerancia:
+            i = int(np.argmin(residuos))
+            k = int(np.argmax(A[i, columnas] * valores))
+        else:
+            return base
+        base[filas[k]] = unitarias[filas[k]]
+        del filas[k]
+    return None
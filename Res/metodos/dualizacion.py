@@ -0,0 +1,116 @@
+import numpy as np
+from typing import Dict, List, Tuple
+
+# Se resuelve el dual solo si la tabla del primal tiene al menos estas filas
+# (en problemas chicos se muestran los pasos del primal) y si su trabajo
+# estimado es al menos este múltiplo del trabajo del dual
+RESTRICCIONES_MINIMAS_DUAL = 50
+VENTAJA_MINIMA_DUAL = 2.0
+
+
+def trabajo_tabla(num_vars: int, desigualdades: List[str]) -> float:
+    """
+    Trabajo estimado del Simplex por tablas con los signos normalizados:
+    tamaño de la tabla por número de pivotes, que se aproxima con uno por
+    artificial (Fase I) más el menor entre filas y variables (Fase II).
+    """
+    num_restr = len(desigualdades)
+    holguras = sum(1 for d in desigualdades if d != "=")
+    artificiales = sum(1 for d in desigualdades if d != "<=")
+    columnas = num_vars + holguras + artificiales + 1
+    pivotes = artificiales + min(num_restr, num_vars)
+    return float((num_restr + 1) * columnas * pivotes)
+
+
+class Dualizacion:
+    """
+    Formulación dual de un problema con muchas más restricciones que
+    variables: la tabla del dual tiene una fila por variable del primal.
+
+    Con el primal en forma de maximización ``max c'x, Āx <= b̄, Ex = e,
+    x >= 0`` (las filas ``>=`` se multiplican por -1), el dual es
+    ``min b̄'u + e'(v⁺ - v⁻), Ā'u + E'(v⁺ - v⁻) >= c', u, v⁺, v⁻ >= 0``. Su
+    valor óptimo es el del primal y la solución del primal son los precios
+    sombra de las restricciones del dual en su base óptima.
+    """
+
+    def __init__(self, tolerancia: float = 1e-9):
+        self.tolerancia = tolerancia
+
+    def conviene(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> bool:
+        """Compara el trabajo estimado de la tabla del primal y la del dual."""
+        num_restr, num_vars = A.shape
+        if num_restr < RESTRICCIONES_MINIMAS_DUAL or num_restr <= num_vars:
+            return False
+
+        invertida = {"<=": ">=", ">=": "<=", "=": "="}
+        sentidos = [invertida[d] if bi < 0 else d for d, bi in zip(desigualdades, b)]
+        self.trabajo_primal = trabajo_tabla(num_vars, sentidos)
+
+        # Las filas del dual son ">=" con lado derecho c': las de c' < 0 se
+        # invierten al normalizar
+        c_max = c if tipo_optimizacion == "maximizar" else -c
+        sentidos_dual = ["<=" if cj < 0 else ">=" for cj in c_max]
+        variables_dual = num_restr + sum(1 for d in desigualdades if d == "=")
+        self.trabajo_dual = trabajo_tabla(variables_dual, sentidos_dual)
+        return self.trabajo_primal >= VENTAJA_MINIMA_DUAL * self.trabajo_dual
+
+    def dualizar(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """
+        Devuelve el dual (c, A, b, desigualdades), a minimizar. Sus
+        variables son u (filas ``<=`` y ``>=``, en orden) y luego v⁺ y v⁻
+        (filas ``=``).
+        """
+        self.c = np.asarray(c, dtype=np.float64)
+        self.num_restr, self.num_vars = A.shape
+        c_max = self.c if tipo_optimizacion == "maximizar" else -self.c
+
+        signos = np.array([-1.0 if d == ">=" else 1.0 for d in desigualdades])
+        A_max = A * signos[:, np.newaxis]
+        b_max = b * signos
+        desigualdad = np.array([d != "=" for d in desigualdades])
+        igualdad = ~desigualdad
+
+        A_dual = np.hstack(
+            [A_max[desigualdad].T, A_max[igualdad].T, -A_max[igualdad].T]
+        )
+        c_dual = np.concatenate([b_max[desigualdad], b_max[igualdad], -b_max[igualdad]])
+        self.dimension_dual = A_dual.shape
+        return c_dual, A_dual, c_max.copy(), [">="] * self.num_vars
+
+    def recuperar(self, resultado: Dict, precios_sombra: np.ndarray) -> Dict:
+        """
+        Traduce el resultado del dual al primal. ``precios_sombra`` son los
+        de las restricciones del dual en su base óptima (uno por variable
+        del primal).
+        """
+        solucion = np.maximum(np.asarray(precios_sombra, dtype=np.float64), 0.0)
+        resultado["valor_dual"] = resultado["valor_optimo"]
+        resultado["solucion"] = solucion.tolist()
+        resultado["valor_optimo"] = float(self.c @ solucion)
+        resultado["dualizacion"] = self.resumen()
+        return resultado
+
+    def resumen(self) -> Dict:
+        return {
+            "restricciones_primal": int(self.num_restr),
+            "variables_primal": int(self.num_vars),
+            "restricciones_dual": int(self.dimension_dual[0]),
+            "variables_dual": int(self.dimension_dual[1]),
+            "trabajo_primal": self.trabajo_primal,
+            "trabajo_dual": self.trabajo_dual,
+        }
@@ -0,0 +1,91 @@
+import numpy as np
+from typing import Dict, Tuple
+
+METODOS_ESCALADO = ("geometrico", "equilibrio")
+
+
+class Escalado:
+    """
+    Escalado de filas y columnas del problema lineal.
+
+    Se resuelve ``max (S c)^T x'`` sujeto a ``(R A S) x' <= R b`` y se recupera
+    ``x = S x'``. Los factores se redondean a potencias de 2 para que escalar
+    y desescalar no introduzca errores de redondeo.
+
+    - ``geometrico``: divide cada fila y columna por la media geométrica de su
+      mayor y menor coeficiente no nulo, en varias pasadas alternadas.
+    - ``equilibrio``: lleva el mayor coeficiente de cada fila y luego de cada
+      columna a 1.
+    """
+
+    def __init__(self, metodo: str = "geometrico", pasadas: int = 4):
+        if metodo not in METODOS_ESCALADO:
+            raise ValueError(f"Método de escalado desconocido: {metodo}")
+        self.metodo = metodo
+        self.pasadas = pasadas if metodo == "geometrico" else 1
+
+    def escalar(
+        self, c: np.ndarray, A: np.ndarray, b: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        A = np.asarray(A, dtype=np.float64)
+        num_restr, num_vars = A.shape
+        self.filas = np.ones(num_restr)
+        self.columnas = np.ones(num_vars)
+        self.rango_original = self._rango(A)
+
+        magnitud = np.abs(A)
+        for _ in range(self.pasadas):
+            escalada = magnitud * self.filas[:, None] * self.columnas
+            self.filas /= self._factores(escalada, eje=1)
+            escalada = magnitud * self.filas[:, None] * self.columnas
+            self.columnas /= self._factores(escalada, eje=0)
+
+        self.filas = self._potencia_de_dos(self.filas)
+        self.columnas = self._potencia_de_dos(self.columnas)
+
+        A_escalada = A * self.filas[:, None] * self.columnas
+        self.rango_escalado = self._rango(A_escalada)
+        return (
+            np.asarray(c, dtype=np.float64) * self.columnas,
+            A_escalada,
+            np.asarray(b, dtype=np.float64) * self.filas,
+        )
+
+    def desescalar(self, resultado: Dict) -> Dict:
+        """
+        Devuelve la solución a las unidades originales de las variables. Los
+        pasos y la tabla final quedan en las del problema escalado.
+        """
+        solucion = np.asarray(resultado["solucion"], dtype=np.float64)
+        resultado["solucion"] = (solucion * self.columnas[: solucion.size]).tolist()
+        return resultado
+
+    def resumen(self) -> Dict:
+        return {
+            "metodo": self.metodo,
+            "rango_original": self.rango_original,
+            "rango_escalado": self.rango_escalado,
+        }
+
+    def _factores(self, magnitud: np.ndarray, eje: int) -> np.ndarray:
+        no_nulos = magnitud > 0
+        maximo = magnitud.max(axis=eje, initial=0.0)
+        if self.metodo == "equilibrio":
+            factores = maximo
+        else:
+            minimo = np.where(no_nulos, magnitud, np.inf).min(axis=eje)
+            factores = np.sqrt(maximo * minimo)
+        # Filas o columnas vacías no se escalan
+        return np.where(no_nulos.any(axis=eje), factores, 1.0)
+
+    @staticmethod
+    def _potencia_de_dos(factores: np.ndarray) -> np.ndarray:
+        return np.exp2(np.round(np.log2(factores)))
+
+    @staticmethod
+    def _rango(A: np.ndarray) -> float:
+        """Cociente entre el mayor y el menor coeficiente no nulo en valor absoluto."""
+        magnitud = np.abs(A[A != 0])
+        if magnitud.size == 0:
+            return 1.0
+        return float(magnitud.max() / magnitud.min())
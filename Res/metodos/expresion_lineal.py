@@ -0,0 +1,299 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# Tamaño de la caché de expresiones ya parseadas (por texto normalizado)
+TAMANO_CACHE_EXPRESIONES = 1024
+
+_TOKEN = re.compile(
+    r"""
+    (?P<espacio>\s+)
+  | (?P<numero>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<variable>[xX](?P<indice>\d+))
+  | (?P<comparador><=|>=|=<|=>|==|=|≤|≥)
+  | (?P<operador>[-+*/()])
+    """,
+    re.VERBOSE,
+)
+
+# Mismos comparadores que acepta el tokenizador, para separar los lados de
+# una restricción antes del respaldo con sympy
+_COMPARADOR = re.compile(r"<=|>=|=<|=>|==|=|≤|≥")
+
+_COMPARADORES = {
+    "<=": "<=",
+    "=<": "<=",
+    "≤": "<=",
+    ">=": ">=",
+    "=>": ">=",
+    "≥": ">=",
+    "=": "=",
+    "==": "=",
+}
+
+
+class ErrorExpresion(ValueError):
+    """Error de sintaxis en una expresión lineal, con la posición del problema."""
+
+    def __init__(self, mensaje: str, texto: str, posicion: int):
+        self.texto = texto
+        self.posicion = posicion
+        super().__init__(
+            f"{mensaje} en la posición {posicion + 1}: "
+            f"'{texto[:posicion]}»{texto[posicion:]}'"
+        )
+
+
+class _Parser:
+    """
+    Parser descendente recursivo para expresiones lineales.
+
+    Cada subexpresión se evalúa a un par (coeficientes, constante), de modo
+    que paréntesis, productos y divisiones por constantes se resuelven sin
+    construir un árbol simbólico. La multiplicación implícita ``3x1`` o
+    ``2(x1 + x2)`` está permitida, pero no entre dos números seguidos
+    (``2.5.3`` o ``1 000x1`` son errores, no productos).
+    """
+
+    def __init__(self, texto: str, num_vars: int):
+        self.texto = texto
+        self.num_vars = num_vars
+        self.tokens = self._tokenizar(texto)
+        self.actual = 0
+
+    def _tokenizar(self, texto: str) -> List[Tuple[str, str, int]]:
+        tokens = []
+        posicion = 0
+        while posicion < len(texto):
+            coincidencia = _TOKEN.match(texto, posicion)
+            if coincidencia is None:
+                raise ErrorExpresion(
+                    f"Carácter inesperado '{texto[posicion]}'", texto, posicion
+                )
+            tipo = coincidencia.lastgroup
+            if tipo == "indice":
+                tipo = "variable"
+            if tipo != "espacio":
+                tokens.append((tipo, coincidencia.group(), posicion))
+            posicion = coincidencia.end()
+        tokens.append(("fin", "", len(texto)))
+        return tokens
+
+    def _ver(self) -> Tuple[str, str, int]:
+        return self.tokens[self.actual]
+
+    def _avanzar(self) -> Tuple[str, str, int]:
+        token = self.tokens[self.actual]
+        self.actual += 1
+        return token
+
+    def _error(self, mensaje: str):
+        raise ErrorExpresion(mensaje, self.texto, self._ver()[2])
+
+    def restriccion(self) -> Tuple[Tuple[float, ...], str, float]:
+        izquierda = self.expresion()
+        tipo, valor, _ = self._ver()
+        if tipo != "comparador":
+            self._error("Se esperaba <=, >= o =")
+        self._avanzar()
+        derecha = self.expresion()
+        self._esperar_fin()
+
+        coeficientes = [0.0] * self.num_vars
+        for j, a in izquierda[0].items():
+            coeficientes[j] += a
+        for j, a in derecha[0].items():
+            coeficientes[j] -= a
+        return tuple(coeficientes), _COMPARADORES[valor], derecha[1] - izquierda[1]
+
+    def objetivo(self) -> Tuple[float, ...]:
+        coeficientes, _ = self.expresion()
+        self._esperar_fin()
+        vector = [0.0] * self.num_vars
+        for j, a in coeficientes.items():
+            vector[j] = a
+        return tuple(vector)
+
+    def _esperar_fin(self):
+        if self._ver()[0] != "fin":
+            self._error(f"Símbolo inesperado '{self._ver()[1]}'")
+
+    def expresion(self) -> Tuple[Dict[int, float], float]:
+        coeficientes, constante = self.termino()
+        while self._ver()[1] in ("+", "-") and self._ver()[0] == "operador":
+            signo = 1.0 if self._avanzar()[1] == "+" else -1.0
+            otros, otra_constante = self.termino()
+            for j, a in otros.items():
+                coeficientes[j] = coeficientes.get(j, 0.0) + signo * a
+            constante += signo * otra_constante
+        return coeficientes, constante
+
+    def termino(self) -> Tuple[Dict[int, float], float]:
+        izquierda = self.factor()
+        while True:
+            tipo, valor, posicion = self._ver()
+            if tipo == "operador" and valor in ("*", "/"):
+                self._avanzar()
+                derecha = self.factor()
+                izquierda = (
+                    self._multiplicar(izquierda, derecha, posicion)
+                    if valor == "*"
+                    else self._dividir(izquierda, derecha, posicion)
+                )
+            elif tipo in ("numero", "variable") or valor == "(":
+                # Multiplicación implícita: 3x1, 2(x1 + x2), x1 x2 (error)
+                if tipo == "numero" and self.tokens[self.actual - 1][0] == "numero":
+                    self._error("Falta un operador entre dos números")
+                izquierda = self._multiplicar(izquierda, self.factor(), posicion)
+            else:
+                return izquierda
+
+    def factor(self) -> Tuple[Dict[int, float], float]:
+        tipo, valor, posicion = self._ver()
+        if tipo == "operador" and valor in ("+", "-"):
+            self._avanzar()
+            coeficientes, constante = self.factor()
+            if valor == "-":
+                return {j: -a for j, a in coeficientes.items()}, -constante
+            return coeficientes, constante
+        if tipo == "numero":
+            self._avanzar()
+            return {}, float(valor)
+        if tipo == "variable":
+            self._avanzar()
+            indice = int(valor[1:])
+            if not 1 <= indice <= self.num_vars:
+                raise ErrorExpresion(
+                    f"La variable {valor.lower()} no existe (hay {self.num_vars} variables)",
+                    self.texto,
+                    posicion,
+                )
+            return {indice - 1: 1.0}, 0.0
+        if valor == "(":
+            self._avanzar()
+            resultado = self.expresion()
+            if self._ver()[1] != ")":
+                self._error("Falta cerrar el paréntesis")
+            self._avanzar()
+            return resultado
+        if tipo == "fin":
+            self._error("La expresión está incompleta")
+        self._error(f"Símbolo inesperado '{valor}'")
+
+    def _multiplicar(self, izquierda, derecha, posicion: int):
+        (ci, ki), (cd, kd) = izquierda, derecha
+        if ci and cd:
+            raise ErrorExpresion(
+                "La expresión no es lineal (producto de variables)",
+                self.texto,
+                posicion,
+            )
+        if ci:
+            return {j: a * kd for j, a in ci.items()}, ki * kd
+        return {j: a * ki for j, a in cd.items()}, ki * kd
+
+    def _dividir(self, izquierda, derecha, posicion: int):
+        (ci, ki), (cd, kd) = izquierda, derecha
+        if cd:
+            raise ErrorExpresion(
+                "La expresión no es lineal (división por una variable)",
+                self.texto,
+                posicion,
+            )
+        if kd == 0:
+            raise ErrorExpresion("División por cero", self.texto, posicion)
+        return {j: a / kd for j, a in ci.items()}, ki / kd
+
+
+def _normalizar(texto: str) -> str:
+    return " ".join(texto.split()).lower()
+
+
+@lru_cache(maxsize=TAMANO_CACHE_EXPRESIONES)
+def _objetivo_en_cache(texto: str, num_vars: int) -> Tuple[float, ...]:
+    return _Parser(texto, num_vars).objetivo()
+
+
+@lru_cache(maxsize=TAMANO_CACHE_EXPRESIONES)
+def _restriccion_en_cache(
+    texto: str, num_vars: int
+) -> Tuple[Tuple[float, ...], str, float]:
+    return _Parser(texto, num_vars).restriccion()
+
+
+def parsear_objetivo(texto: str, num_vars: int) -> List[float]:
+    """Devuelve el vector de costos de una función objetivo lineal."""
+    try:
+        return list(_objetivo_en_cache(_normalizar(texto), num_vars))
+    except ErrorExpresion as error:
+        try:
+            return _parsear_con_sympy(texto, num_vars)[0]
+        except Exception:
+            raise error from None
+
+
+def parsear_restriccion(texto: str, num_vars: int) -> Tuple[List[float], str, float]:
+    """Devuelve (coeficientes, desigualdad, término independiente) de una restricción."""
+    try:
+        coeficientes, desigualdad, rhs = _restriccion_en_cache(
+            _normalizar(texto), num_vars
+        )
+        return list(coeficientes), desigualdad, rhs
+    except ErrorExpresion as error:
+        comparador = _COMPARADOR.search(texto)
+        if comparador is None:
+            raise
+        izquierda, derecha = texto[: comparador.start()], texto[comparador.end() :]
+        # Desigualdades estrictas o más de un comparador: igual que el parser
+        if re.search(r"[<>=≤≥]", izquierda + derecha):
+            raise
+        try:
+            ci, ki = _parsear_con_sympy(izquierda, num_vars)
+            cd, kd = _parsear_con_sympy(derecha, num_vars)
+        except Exception:
+            raise error from None
+        return (
+            [a - d for a, d in zip(ci, cd)],
+            _COMPARADORES[comparador.group()],
+            kd - ki,
+        )
+
+
+def parsear_variables(texto: str, num_vars: int) -> List[bool]:
+    """
+    Convierte una lista de variables separadas por comas (``"x1, x3"``) en
+    una bandera por variable de decisión.
+    """
+    banderas = [False] * num_vars
+    for nombre in texto.replace(";", ",").split(","):
+        nombre = nombre.strip().lower()
+        if not nombre:
+            continue
+        if not re.fullmatch(r"x\d+", nombre):
+            raise ValueError(f"'{nombre}' no es una variable (use x1, x2, ...)")
+        indice = int(nombre[1:])
+        if not 1 <= indice <= num_vars:
+            raise ValueError(
+                f"La variable {nombre} no existe (hay {num_vars} variables)"
+            )
+        banderas[indice - 1] = True
+    return banderas
+
+
+def _parsear_con_sympy(texto: str, num_vars: int) -> Tuple[List[float], float]:
+    """
+    Respaldo para entradas que el parser propio no acepta (potencias,
+    funciones, constantes simbólicas). Sympy se importa solo aquí.
+    """
+    from sympy import Poly, expand, symbols, sympify
+
+    variables = symbols([f"x{i}" for i in range(1, num_vars + 1)])
+    nombres = {f"x{i}": v for i, v in enumerate(variables, start=1)}
+    expresion = expand(sympify(texto.lower().replace("^", "**"), locals=nombres))
+    if expresion.free_symbols - set(variables):
+        raise ValueError("La expresión contiene símbolos desconocidos")
+    if expresion.free_symbols and Poly(expresion, *variables).total_degree() > 1:
+        raise ValueError("La expresión no es lineal")
+    coeficientes = [float(expresion.coeff(v)) for v in variables]
+    constante = float(expresion.subs({v: 0 for v in variables}))
+    return coeficientes, constante
@@ -8,6 +8,7 @@ from .models import (
     DiferenciacionFinita,
     InterpolacionNewton,
 )
+from .expresion_lineal import parsear_variables
 import re
 
 
@@ -21,6 +22,11 @@ class SimplexForm(forms.ModelForm):
             "variables_decision",
             "tolerancia",
             "max_iteraciones",
+            "tiempo_limite",
+            "motor",
+            "regla_pivoteo",
+            "escalado",
+            "variables_enteras",
         ]
         widgets = {
             "objetivo": forms.TextInput(
@@ -67,6 +73,24 @@ class SimplexForm(forms.ModelForm):
                     "title": "Entre 10 y 1000 iteraciones",
                 }
             ),
+            "tiempo_limite": forms.NumberInput(
+                attrs={
+                    "step": "any",
+                    "min": "0.01",
+                    "class": "form-control",
+                    "title": "Segundos; vacío usa el límite configurado",
+                }
+            ),
+            "motor": forms.Select(attrs={"class": "form-control"}),
+            "regla_pivoteo": forms.Select(attrs={"class": "form-control"}),
+            "escalado": forms.Select(attrs={"class": "form-control"}),
+            "variables_enteras": forms.TextInput(
+                attrs={
+                    "placeholder": "Ej: x1, x3",
+                    "class": "form-control",
+                    "title": "Variables separadas por comas",
+                }
+            ),
         }
         help_texts = {
             "objetivo": "Ingrese la función objetivo usando variables como x1, x2, etc. Ej: 3x1 + 2x2 - 4x3",
@@ -74,6 +98,11 @@ class SimplexForm(forms.ModelForm):
             "variables_decision": "Número de variables en el problema (entre 1 y 10)",
             "tolerancia": "Valor mínimo para considerar un número como cero (≥ 1e-9)",
             "max_iteraciones": "Número máximo de iteraciones permitidas (entre 10 y 1000)",
+            "tiempo_limite": "Al agotarse se devuelve la mejor base encontrada, con estado de advertencia",
+            "motor": "El Simplex revisado y el punto interior escalan mejor en problemas grandes; el automático usa el método geométrico con dos variables, Vogel + MODI o el método húngaro en problemas de transporte o asignación, punto interior desde 150 restricciones y el Simplex revisado desde 200 en problemas con muchas más restricciones que variables",
+            "regla_pivoteo": "Devex y máxima pendiente suelen requerir menos iteraciones",
+            "escalado": "Útil cuando los coeficientes tienen órdenes de magnitud muy distintos",
+            "variables_enteras": "Deje vacío para un problema continuo; con variables enteras se usa ramificación y acotamiento",
         }
 
     def __init__(self, *args, **kwargs):
@@ -152,6 +181,18 @@ class SimplexForm(forms.ModelForm):
                     f"Ajuste el número de variables o las expresiones."
                 )
 
+        if (
+            cleaned_data.get("variables_enteras")
+            and "variables_decision" in cleaned_data
+        ):
+            try:
+                parsear_variables(
+                    cleaned_data["variables_enteras"],
+                    cleaned_data["variables_decision"],
+                )
+            except ValueError as e:
+                self.add_error("variables_enteras", str(e))
+
         return cleaned_data
 
 
@@ -2,11 +2,67 @@ import numpy as np
 import matplotlib.pyplot as plt
 from io import BytesIO
 import base64
-import re
-from sympy import symbols, sympify, SympifyError
 from typing import List, Tuple, Dict, Optional
 import warnings
 
+from .cache_simplex import CacheResultados, clave_canonica
+from .crash import base_crash
+from .escalado import Escalado
+from .expresion_lineal import parsear_objetivo, parsear_restriccion, parsear_variables
+from .presolucion import Presolucion
+from .presupuesto import Presupuesto, tiempo_limite_por_defecto
+from .punto_interior import PuntoInterior, identificar_base
+from .ramificacion import MAX_NODOS, RamificacionAcotamiento
+from .reoptimizacion import columnas_base, etiquetar_base
+from .sensibilidad import AnalisisSensibilidad
+from .dualizacion import Dualizacion
+from .region_plana import RegionPlana
+from .transporte import ProblemaTransporte
+from .registro_pasos import (
+    NIVELES_REGISTRO,
+    EspacioPivoteo,
+    cambiar_base,
+    crear_registro,
+    pivotear_tabla,
+    reparar_base,
+    restaurar_objetivo,
+)
+from .simplex_dual import simplex_dual
+from .simplex_revisado import SimplexRevisado
+from .pivoteo import (
+    PRUEBAS_RAZON,
+    ReglaBland,
+    crear_regla,
+    razon_harris,
+    razon_minima,
+)
+
+# Cambiar al modificar el solver: invalida los resultados guardados en caché
+VERSION_SOLVER = "2.13"
+
+# Pivotes degenerados consecutivos tras los cuales la fase se considera
+# estancada: se perturba el lado derecho y, si vuelve a estancarse con la
+# perturbación activa, se usa la regla de Bland
+LIMITE_PIVOTES_DEGENERADOS = 20
+
+# La perturbación de cada fila es un múltiplo aleatorio de la tolerancia en
+# este intervalo, escalado por 1 + |lado derecho|
+RANGO_PERTURBACION = (10.0, 100.0)
+SEMILLA_PERTURBACION = 0
+
+# Con motor "automatico", número de restricciones a partir del cual se deja
+# la tabla Simplex por el Simplex revisado (con la base factorizada solo en
+# las columnas estructurales, que crecen con las variables y no con las filas)
+RESTRICCIONES_REVISADO = 200
+
+# Con motor "automatico", número de restricciones a partir del cual se usa
+# punto interior con crossover, salvo en problemas con más de
+# FILAS_POR_VARIABLE_REVISADO restricciones por variable: ahí domina el
+# crossover, que expresa la tabla de m filas en la base, y el revisado es más
+# rápido
+RESTRICCIONES_PUNTO_INTERIOR = 150
+FILAS_POR_VARIABLE_REVISADO = 16
+
 # Configuración de warnings
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
@@ -14,12 +70,94 @@ warnings.filterwarnings("ignore", category=RuntimeWarning)
 class SimplexSolver:
     """Clase optimizada para resolver problemas de programación lineal usando el método Simplex."""
 
+    MOTORES = (
+        "tabla",
+        "revisado",
+        "punto_interior",
+        "geometrico",
+        "transporte",
+        "automatico",
+    )
+
     def __init__(
-        self, tolerancia: float = 1e-6, max_iter: int = 1000, verbose: bool = False
+        self,
+        tolerancia: float = 1e-6,
+        max_iter: int = 1000,
+        verbose: bool = False,
+        motor: str = "tabla",
+        disperso: Optional[bool] = None,
+        regla_pivoteo: str = "dantzig",
+        prueba_razon: str = "harris",
+        presolve: bool = True,
+        escalado: Optional[str] = None,
+        medir_escalado: bool = False,
+        cache: Optional[CacheResultados] = None,
+        generar_grafico: bool = True,
+        registro: str = "completo",
+        registro_cada: int = 10,
+        max_nodos: int = MAX_NODOS,
+        trabajadores_ramificacion: Optional[int] = None,
+        base_anterior: Optional[List[str]] = None,
+        sensibilidad: bool = False,
+        tiempo_limite: Optional[float] = None,
+        cancelacion=None,
+        crash: bool = True,
+        dual_automatico: bool = True,
     ):
+        if motor not in self.MOTORES:
+            raise ValueError(f"Motor Simplex desconocido: {motor}")
+        if prueba_razon not in PRUEBAS_RAZON:
+            raise ValueError(f"Prueba de razón desconocida: {prueba_razon}")
+        if registro not in NIVELES_REGISTRO:
+            raise ValueError(f"Nivel de registro desconocido: {registro}")
         self.tolerancia = tolerancia
         self.max_iter = max_iter
         self.verbose = verbose
+        self.motor = motor
+        # Solo aplica al motor revisado; None lo decide según la densidad de A
+        self.disperso = disperso
+        self.regla_pivoteo = regla_pivoteo
+        self.regla = crear_regla(regla_pivoteo, tolerancia)
+        # Bland solo se usa como respaldo ante pivotes degenerados repetidos
+        self.regla_bland = ReglaBland(tolerancia)
+        self.espacio = EspacioPivoteo()
+        self.prueba_razon = prueba_razon
+        self.presolve = presolve
+        # None desactiva el escalado; "geometrico" o "equilibrio" lo activan
+        self.escalado = Escalado(escalado) if escalado else None
+        # Resuelve también sin escalar para informar los pivotes ahorrados
+        self.medir_escalado = medir_escalado
+        self.cache = cache
+        self.generar_grafico = generar_grafico
+        # Nivel de registro de pasos: ninguno, resumen, muestreo o completo
+        self.nivel_registro = registro
+        self.registro_cada = registro_cada
+        # Ramificación y acotamiento (solo con variables enteras)
+        self.max_nodos = max_nodos
+        self.trabajadores_ramificacion = trabajadores_ramificacion
+        # Base óptima de una resolución anterior (etiquetas de etiquetar_base)
+        self.base_anterior = base_anterior
+        # Precios sombra, costos reducidos e intervalos de la base óptima
+        self.sensibilidad = sensibilidad
+        # Tiempo límite en segundos y token de cancelación (atributo
+        # ``cancelado``), consultados en cada pivote de la Fase I y II
+        self.presupuesto = Presupuesto(tiempo_limite, cancelacion)
+        # Base inicial triangular con variables de decisión en las filas >= y =
+        self.crash = crash
+        # Resolver el dual cuando las restricciones superan ampliamente a las
+        # variables y su tabla es mucho más chica
+        self.dual_automatico = dual_automatico
+        self.degenerados_consecutivos = 0
+        self.pivotes_bland = 0
+        self.pivotes_degenerados = 0
+        self.pivotes_estancados = 0
+        self.perturbaciones = 0
+        # Perturbación del lado derecho activa, expresada en la base actual
+        self.perturbacion = None
+        self.aleatorio = np.random.default_rng(SEMILLA_PERTURBACION)
+        self.base_cruzada = False
+        self.arranque = None
+        self.pivotes_duales = 0
 
     def resolver_problema(self, simplex_problem) -> Dict:
         """
@@ -31,6 +169,7 @@ class SimplexSolver:
         Returns:
             dict: Resultados con solución, valor óptimo, iteraciones y gráfico
         """
+        self.presupuesto.reiniciar()
         try:
             # Validación inicial
             if not simplex_problem.objetivo or not simplex_problem.restricciones:
@@ -50,26 +189,96 @@ class SimplexSolver:
 
             # 3. Validar dimensiones
             self._validar_dimensiones(c, A, b)
-
-            # 4. Ejecutar Simplex
-            resultado = self._ejecutar_simplex(
-                c, A, b, desigualdades, simplex_problem.tipo_optimizacion
+            enteras = parsear_variables(
+                getattr(simplex_problem, "variables_enteras", "") or "", len(c)
             )
 
-            # 5. Generar gráfico si es 2D
-            if len(c) == 2:
-                resultado["grafico"] = self._generar_grafico(
+            # 4. Consultar la caché por la forma canónica del problema. Una
+            # reoptimización no la usa: su resultado (base de arranque,
+            # pivotes ahorrados) depende de ``base_anterior``
+            clave = None
+            if self.cache is not None and not self.base_anterior:
+                clave = clave_canonica(
                     c,
                     A,
                     b,
                     desigualdades,
                     simplex_problem.tipo_optimizacion,
-                    resultado["solucion"],
-                    resultado["valor_optimo"],
+                    self.tolerancia,
+                    VERSION_SOLVER,
+                    {**self._opciones_cache(), "enteras": enteras},
                 )
+                resultado = self.cache.obtener(clave)
+                if resultado is not None:
+                    resultado["desde_cache"] = True
+                    resultado["tiempo_resolucion"] = self.presupuesto.transcurrido()
+                    return resultado
+
+            # 5. Ejecutar Simplex con el motor seleccionado. Con variables
+            # enteras se ramifica sobre el problema original: el presolve y
+            # el escalado no conservan la integralidad
+            if any(enteras):
+                resultado = RamificacionAcotamiento(
+                    self, enteras, self.max_nodos, self.trabajadores_ramificacion
+                ).resolver(c, A, b, desigualdades, simplex_problem.tipo_optimizacion)
             else:
-                resultado["grafico"] = None
+                if self.base_anterior:
+                    resultado = self._reoptimizar(
+                        c, A, b, desigualdades, simplex_problem.tipo_optimizacion
+                    )
+                else:
+                    resultado = self._resolver_con_motor(
+                        c, A, b, desigualdades, simplex_problem.tipo_optimizacion
+                    )
+                # Base en términos del problema original, para reoptimizar
+                # después de editarlo
+                resultado["base"] = etiquetar_base(
+                    resultado["solucion"], A, b, desigualdades, self.tolerancia
+                )
+                interrupcion = self.presupuesto.motivo
+                if self.sensibilidad and interrupcion is None:
+                    try:
+                        resultado["sensibilidad"] = self._analisis_sensibilidad(
+                            c,
+                            A,
+                            b,
+                            desigualdades,
+                            simplex_problem.tipo_optimizacion,
+                            resultado["base"],
+                        ).resumen()
+                    except (ValueError, np.linalg.LinAlgError):
+                        resultado["sensibilidad"] = None
+                    self.presupuesto.motivo = interrupcion
+
+            # El gráfico no cuenta como tiempo de resolución
+            resultado["tiempo_resolucion"] = self.presupuesto.transcurrido()
+
+            # 6. Región factible exacta y gráfico si es 2D
+            resultado["grafico"] = None
+            if len(c) == 2:
+                region = RegionPlana(A, b, desigualdades, self.tolerancia)
+                resultado["region_factible"] = region.resumen()
+                if self.generar_grafico:
+                    resultado["grafico"] = self._generar_grafico(
+                        c,
+                        A,
+                        b,
+                        desigualdades,
+                        simplex_problem.tipo_optimizacion,
+                        resultado["solucion"],
+                        resultado["valor_optimo"],
+                        region,
+                    )
 
+            if self.presupuesto.motivo is not None:
+                # Resultado parcial: no se guarda en la caché
+                resultado["warning"] = self.presupuesto.advertencia()
+                resultado["interrupcion"] = {
+                    "motivo": self.presupuesto.motivo,
+                    "tiempo": resultado["tiempo_resolucion"],
+                }
+            elif clave is not None:
+                self.cache.guardar(clave, resultado)
             return resultado
 
         except Exception as e:
@@ -83,40 +292,101 @@ class SimplexSolver:
                 "grafico": None,
             }
 
-    def _preprocesar_expresion(self, expr: str, num_vars: int) -> str:
-        """Versión corregida del preprocesamiento de expresiones"""
-        try:
-            # Paso 1: Eliminar espacios y convertir potencias
-            expr_limpia = expr.replace(" ", "").replace("^", "**")
+    def _opciones_cache(self) -> Dict:
+        """Opciones del solver que pueden cambiar el resultado guardado."""
+        return {
+            "motor": self.motor,
+            "regla_pivoteo": self.regla_pivoteo,
+            "prueba_razon": self.prueba_razon,
+            "presolve": self.presolve,
+            "escalado": self.escalado.metodo if self.escalado else None,
+            "medir_escalado": self.medir_escalado,
+            "max_iter": self.max_iter,
+            "grafico": self.generar_grafico,
+            "registro": self.nivel_registro,
+            "registro_cada": self.registro_cada,
+            "max_nodos": self.max_nodos,
+            "sensibilidad": self.sensibilidad,
+            "crash": self.crash,
+            "dual_automatico": self.dual_automatico,
+        }
 
-            # Paso 2: Manejar coeficientes implícitos (como 'x1' -> '1*x1')
-            expr_limpia = re.sub(
-                r"(^|\+|-)(x\d+)", lambda m: f"{m.group(1)}1*{m.group(2)}", expr_limpia
+    def barrido_parametrico(
+        self,
+        simplex_problem,
+        parametro: str,
+        indice: int,
+        hasta: float,
+        desde: Optional[float] = None,
+    ) -> Dict:
+        """
+        Recorre un lado derecho (``parametro="rhs"``, ``indice`` = número de
+        restricción) o un costo (``"costo"``, número de variable) hasta
+        ``hasta``, partiendo de su valor actual o de ``desde``. Devuelve los
+        tramos en los que la base óptima no cambia, con el valor óptimo en
+        sus extremos; entre tramos la base se actualiza con un pivote en
+        lugar de resolver de nuevo.
+        """
+        if parametro not in ("rhs", "costo"):
+            raise ValueError(f"Parámetro de barrido desconocido: {parametro}")
+        c, A, b, desigualdades = self._parsear_problema(
+            simplex_problem.objetivo,
+            simplex_problem.restricciones,
+            simplex_problem.variables_decision,
+        )
+        c = np.array(c, dtype=np.float64)
+        A = np.array(A, dtype=np.float64)
+        b = np.array(b, dtype=np.float64)
+        self._validar_dimensiones(c, A, b)
+        limite = len(b) if parametro == "rhs" else len(c)
+        if not 1 <= indice <= limite:
+            raise ValueError(f"Índice fuera de rango para el barrido: {indice}")
+
+        etiquetas = self.base_anterior
+        if not etiquetas:
+            resultado = self._resolver_con_motor(
+                c, A, b, desigualdades, simplex_problem.tipo_optimizacion
             )
+            etiquetas = etiquetar_base(
+                resultado["solucion"], A, b, desigualdades, self.tolerancia
+            )
+        analisis = self._analisis_sensibilidad(
+            c, A, b, desigualdades, simplex_problem.tipo_optimizacion, etiquetas
+        )
+        if parametro == "rhs":
+            return analisis.barrido_rhs(indice - 1, hasta, desde)
+        return analisis.barrido_costo(indice - 1, hasta, desde)
 
-            # Paso 3: Agregar multiplicación entre coeficientes y variables
-            for i in range(
-                num_vars, 0, -1
-            ):  # Procesar de mayor a menor (x11 antes que x1)
-                var = f"x{i}"
-                # Reemplazar patrones como 3x1 -> 3*x1
-                expr_limpia = re.sub(
-                    r"(\d)({})(\D|$)".format(var), r"\1*\2\3", expr_limpia
-                )
-                # Manejar variables solas al inicio [+-]x1 -> [+-]1*x1
-                expr_limpia = re.sub(
-                    r"(^|[+\-*/])({})(\D|$)".format(var), r"\g<1>1*\2\3", expr_limpia
-                )
-
-            # Paso 4: Normalizar formato de variables (X1 -> x1)
-            expr_limpia = expr_limpia.lower()
-
-            if self.verbose:
-                print(f"Expresión preprocesada: {expr_limpia}")
-
-            return expr_limpia
-        except Exception as e:
-            raise ValueError(f"Error al preprocesar expresión: {str(e)}")
+    def _analisis_sensibilidad(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+        etiquetas: List[str],
+    ) -> AnalisisSensibilidad:
+        """
+        Expresa el problema original (sin presolve ni escalado) en su base
+        óptima reoptimizando desde ``etiquetas``, lo que normalmente no
+        requiere pivotes, y prepara el análisis sobre esa base.
+        """
+        nivel, base_anterior = self.nivel_registro, self.base_anterior
+        self.nivel_registro, self.base_anterior = "ninguno", etiquetas
+        try:
+            self._reoptimizar(c, A, b, desigualdades, tipo_optimizacion)
+        finally:
+            self.nivel_registro, self.base_anterior = nivel, base_anterior
+        if self.presupuesto.motivo is not None:
+            raise ValueError(self.presupuesto.advertencia())
+
+        # Las columnas anteriores a las artificiales conservan su índice en
+        # la tabla final; las artificiales básicas se completan en el análisis
+        inicio_artificiales = len(c) + sum(1 for d in desigualdades if d != "=")
+        base = [j for j in self.basicas_finales if j < inicio_artificiales]
+        return AnalisisSensibilidad(
+            c, A, b, desigualdades, tipo_optimizacion, base, self.tolerancia
+        )
 
     def _parsear_problema(
         self, objetivo: str, restricciones: str, num_vars: int
@@ -128,78 +398,30 @@ class SimplexSolver:
             raise ValueError("El número máximo de variables es 20")
 
         try:
-            # Preprocesar función objetivo
-            objetivo_limpio = self._preprocesar_expresion(objetivo, num_vars)
+            c = parsear_objetivo(objetivo, num_vars)
+        except ValueError as e:
+            raise ValueError(f"Función objetivo inválida: {str(e)}")
 
-            # Crear variables simbólicas
-            vars = symbols([f"x{i}" for i in range(1, num_vars + 1)])
+        # Parsear restricciones
+        A, b, desigualdades = [], [], []
+        restr_list = [r.strip() for r in restricciones.split(";") if r.strip()]
 
-            # Parsear función objetivo
-            try:
-                expr_obj = sympify(
-                    objetivo_limpio,
-                    locals={f"x{i}": vars[i - 1] for i in range(1, num_vars + 1)},
-                )
-            except SympifyError:
-                raise ValueError(
-                    "Formato de función objetivo inválido. Use formato como '3*x1 + 2*x2' o '3x1 + 2x2'"
-                )
-
-            c = [
-                float(expr_obj.coeff(vars[i])) if vars[i] in expr_obj.args else 0.0
-                for i in range(num_vars)
-            ]
-
-            # Parsear restricciones
-            A, b, desigualdades = [], [], []
-            restr_list = [r.strip() for r in restricciones.split(";") if r.strip()]
-
-            if not restr_list:
-                raise ValueError("Debe proporcionar al menos una restricción")
-
-            for restr in restr_list:
-                try:
-                    # Normalizar la restricción
-                    restr_limpia = self._preprocesar_expresion(restr, num_vars)
-
-                    # Dividir en LHS y RHS
-                    if "<=" in restr_limpia:
-                        lhs, rhs = restr_limpia.split("<=", 1)
-                        desigualdad = "<="
-                    elif ">=" in restr_limpia:
-                        lhs, rhs = restr_limpia.split(">=", 1)
-                        desigualdad = ">="
-                    elif "=" in restr_limpia:
-                        lhs, rhs = restr_limpia.split("=", 1)
-                        desigualdad = "="
-                    else:
-                        raise ValueError(f"Restricción mal formada: {restr}")
-
-                    expr_restr = sympify(
-                        lhs,
-                        locals={f"x{i}": vars[i - 1] for i in range(1, num_vars + 1)},
-                    )
-
-                    fila_A = [
-                        (
-                            float(expr_restr.coeff(vars[i]))
-                            if vars[i] in expr_restr.args
-                            else 0.0
-                        )
-                        for i in range(num_vars)
-                    ]
+        if not restr_list:
+            raise ValueError("Debe proporcionar al menos una restricción")
 
-                    A.append(fila_A)
-                    b.append(float(rhs.strip()))
-                    desigualdades.append(desigualdad)
-
-                except Exception as e:
-                    raise ValueError(f"Error en restricción '{restr}': {str(e)}")
+        for restr in restr_list:
+            try:
+                fila_A, desigualdad, rhs = parsear_restriccion(restr, num_vars)
+            except ValueError as e:
+                raise ValueError(f"Error en restricción '{restr}': {str(e)}")
+            A.append(fila_A)
+            b.append(rhs)
+            desigualdades.append(desigualdad)
 
-            return c, A, b, desigualdades
+        if self.verbose:
+            print(f"Problema parseado: c={c}, A={A}, b={b}, {desigualdades}")
 
-        except Exception as e:
-            raise ValueError(f"Error al parsear el problema: {str(e)}")
+        return c, A, b, desigualdades
 
     def _validar_dimensiones(self, c: np.ndarray, A: np.ndarray, b: np.ndarray):
         """Valida las dimensiones de las matrices de entrada."""
@@ -212,6 +434,378 @@ class SimplexSolver:
                 "Número de variables en restricciones no coincide con función objetivo"
             )
 
+    def _normalizar_signos(
+        self, A: np.ndarray, b: np.ndarray, desigualdades: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Multiplica por -1 las restricciones con término independiente negativo."""
+        negativos = b < 0
+        if not negativos.any():
+            return A, b, desigualdades
+
+        A = A.copy()
+        b = b.copy()
+        A[negativos] *= -1
+        b[negativos] *= -1
+        invertida = {"<=": ">=", ">=": "<=", "=": "="}
+        desigualdades = [
+            invertida[d] if negativos[i] else d for i, d in enumerate(desigualdades)
+        ]
+        return A, b, desigualdades
+
+    def _resolver_con_motor(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> Dict:
+        """Despacha la resolución al motor Simplex configurado."""
+        # Transporte y asignación se detectan sobre el problema original: el
+        # presolve puede romper la estructura
+        if self.motor in ("automatico", "transporte"):
+            transporte = ProblemaTransporte(self.tolerancia)
+            if transporte.detectar(c, A, b, desigualdades, tipo_optimizacion):
+                resultado = transporte.resolver(
+                    self.max_iter,
+                    self.presupuesto,
+                    self.nivel_registro,
+                    self.registro_cada,
+                )
+                resultado["motor"] = "transporte"
+                return resultado
+
+        # Con el registro completo los pasos deben mostrar las tablas del
+        # problema original, así que no se reduce
+        presolucion = None
+        if self.presolve and self.nivel_registro != "completo":
+            presolucion = Presolucion(self.tolerancia)
+            c, A, b, desigualdades = presolucion.reducir(
+                c, A, b, desigualdades, tipo_optimizacion
+            )
+            if presolucion.sin_cambios:
+                presolucion = None
+            elif presolucion.es_trivial:
+                return presolucion.resolver_trivial(tipo_optimizacion)
+
+        resultado = None
+        motor = self._seleccionar_motor(len(c), len(b))
+        if (
+            self.dual_automatico
+            and self.escalado is None
+            and self.motor in ("tabla", "automatico")
+            # El punto interior supera a la tabla del dual y, sin
+            # artificiales, también el revisado
+            and (
+                motor == "tabla"
+                or (
+                    motor == "revisado"
+                    and self._requiere_artificiales(b, desigualdades)
+                )
+            )
+        ):
+            dualizacion = Dualizacion(self.tolerancia)
+            if dualizacion.conviene(c, A, b, desigualdades, tipo_optimizacion):
+                resultado = self._resolver_dual(
+                    dualizacion, c, A, b, desigualdades, tipo_optimizacion
+                )
+
+        if resultado is None and self.escalado is not None:
+            resultado = self._resolver_escalado(
+                c, A, b, desigualdades, tipo_optimizacion
+            )
+        elif resultado is None:
+            resultado = self._despachar_motor(c, A, b, desigualdades, tipo_optimizacion)
+
+        if presolucion is not None:
+            resultado = presolucion.postresolver(resultado)
+        return resultado
+
+    def _seleccionar_motor(self, num_vars: int, num_restr: int) -> str:
+        """
+        Motor efectivo: el automático usa el método geométrico con dos
+        variables si no se registran pasos (no deja tablas que mostrar),
+        punto interior desde RESTRICCIONES_PUNTO_INTERIOR restricciones y,
+        con muchas más filas que variables, el Simplex revisado desde
+        RESTRICCIONES_REVISADO; el geométrico solo se aplica con dos
+        variables. Si el problema no tiene estructura de transporte, ese
+        motor usa la tabla.
+        """
+        motor = self.motor
+        if motor == "transporte":
+            return "tabla"
+        if motor == "automatico":
+            if num_vars == 2 and self.nivel_registro == "ninguno":
+                return "geometrico"
+            if (
+                num_restr >= RESTRICCIONES_PUNTO_INTERIOR
+                and num_restr <= FILAS_POR_VARIABLE_REVISADO * num_vars
+            ):
+                return "punto_interior"
+            if num_restr >= RESTRICCIONES_REVISADO:
+                return "revisado"
+            return "tabla"
+        if motor == "geometrico" and num_vars != 2:
+            return "tabla"
+        return motor
+
+    @staticmethod
+    def _requiere_artificiales(b: np.ndarray, desigualdades: List[str]) -> bool:
+        """Indica si alguna fila lleva artificial tras normalizar los signos."""
+        return any(
+            d == "=" or (d == ">=") == (bi >= 0) for d, bi in zip(desigualdades, b)
+        )
+
+    def _resolver_dual(
+        self,
+        dualizacion: Dualizacion,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> Optional[Dict]:
+        """
+        Resuelve el dual con la tabla y recupera la solución del primal de
+        los precios sombra de la base final. Si el dual es infactible o no
+        acotado, o se interrumpe, devuelve None y se resuelve el primal, que
+        informa el error que corresponde (infactible o no acotado).
+        """
+        c_dual, A_dual, b_dual, desigualdades_dual = dualizacion.dualizar(
+            c, A, b, desigualdades, tipo_optimizacion
+        )
+        A_norm, b_norm, desigualdades_norm = self._normalizar_signos(
+            A_dual, b_dual, desigualdades_dual
+        )
+        try:
+            resultado = self._ejecutar_simplex(
+                c_dual, A_norm, b_norm, desigualdades_norm, "minimizar"
+            )
+        except ValueError:
+            return None
+        if self.presupuesto.motivo is not None:
+            # Una base del dual sin terminar no da una solución del primal:
+            # el primal devuelve su base actual o el error que corresponda
+            return None
+
+        # Todas las filas del dual son desigualdades: las artificiales
+        # empiezan después de una holgura por fila
+        inicio_artificiales = len(c_dual) + len(b_dual)
+        base = [j for j in self.basicas_finales if j < inicio_artificiales]
+        precios = AnalisisSensibilidad(
+            c_dual,
+            A_dual,
+            b_dual,
+            desigualdades_dual,
+            "minimizar",
+            base,
+            self.tolerancia,
+        ).precios_sombra()
+        resultado["motor"] = "tabla"
+        return dualizacion.recuperar(resultado, precios)
+
+    def _despachar_motor(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+        con_tabla: bool = False,
+    ) -> Dict:
+        """
+        Resuelve con el motor configurado. ``con_tabla`` exige un motor que
+        deje la tabla final en ``tabla_final``/``basicas_finales`` (el
+        revisado y el geométrico se reemplazan por la tabla).
+        """
+        A, b, desigualdades = self._normalizar_signos(A, b, desigualdades)
+
+        motor = self._seleccionar_motor(len(c), len(b))
+        if motor in ("revisado", "geometrico") and con_tabla:
+            motor = "tabla"
+
+        resultado = None
+        if motor == "geometrico":
+            resultado = RegionPlana(A, b, desigualdades, self.tolerancia).optimo(
+                c, tipo_optimizacion
+            )
+            if resultado is None:
+                # Región vacía o sin área, u óptimo no certificado: tabla
+                motor = "tabla"
+
+        if motor == "revisado":
+            resultado = self._ejecutar_simplex_revisado(
+                c, A, b, desigualdades, tipo_optimizacion
+            )
+        elif motor == "punto_interior":
+            resultado = self._ejecutar_punto_interior(
+                c, A, b, desigualdades, tipo_optimizacion
+            )
+        elif motor == "tabla":
+            resultado = self._ejecutar_simplex(
+                c, A, b, desigualdades, tipo_optimizacion
+            )
+        resultado["motor"] = motor
+        return resultado
+
+    def _reoptimizar(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> Dict:
+        """
+        Resuelve partiendo de ``base_anterior`` en lugar de la base de
+        holguras. Si la base sigue siendo primal factible se continúa con la
+        Fase II; si solo es dual factible (p. ej. tras ajustar un lado
+        derecho o agregar un corte) se recupera la factibilidad con el
+        Simplex dual. Si no sirve, se resuelve desde cero.
+        """
+        A, b, desigualdades = self._normalizar_signos(A, b, desigualdades)
+        base = columnas_base(self.base_anterior, desigualdades, len(c))
+        resultado = self._ejecutar_simplex(
+            c,
+            A,
+            b,
+            desigualdades,
+            tipo_optimizacion,
+            base_inicial=base,
+            origen_base="reoptimizacion",
+        )
+        resultado["motor"] = "tabla"
+        resultado["reoptimizacion"] = {
+            "arranque": self.arranque,
+            "pivotes_duales": self.pivotes_duales,
+        }
+        return resultado
+
+    def _ejecutar_punto_interior(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> Dict:
+        """
+        Punto interior de Mehrotra seguido de crossover: con el punto
+        interior se identifica una base, la tabla se expresa en ella con una
+        sola factorización y la Fase I/II termina desde ahí, de modo que la
+        solución, la base y la tabla final son las de un vértice.
+        """
+        c_max = -c if tipo_optimizacion == "minimizar" else c
+        try:
+            interior = PuntoInterior(presupuesto=self.presupuesto).resolver(
+                c_max, A, b, desigualdades
+            )
+        except np.linalg.LinAlgError:
+            interior = {"iteraciones": 0, "convergio": False, "brecha": None}
+
+        base_inicial = None
+        if interior["convergio"]:
+            base_inicial = identificar_base(
+                interior["x"], interior["z"], desigualdades, len(c)
+            )
+
+        # Si el punto interior no converge (infactible, no acotado, mal
+        # condicionado o interrumpido) el Simplex parte de la base de
+        # holguras; con el presupuesto agotado se detiene en ella
+        resultado = self._ejecutar_simplex(
+            c, A, b, desigualdades, tipo_optimizacion, base_inicial=base_inicial
+        )
+        # Las iteraciones informadas suman las del punto interior y los
+        # pivotes del crossover
+        resultado["punto_interior"] = {
+            "iteraciones": interior["iteraciones"],
+            "pivotes_crossover": resultado["iteraciones"],
+            "convergio": interior["convergio"],
+            "brecha": interior["brecha"],
+            "crossover": self.base_cruzada,
+        }
+        resultado["iteraciones"] += interior["iteraciones"]
+        return resultado
+
+    def _resolver_escalado(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> Dict:
+        """
+        Resuelve el problema escalado y devuelve la solución sin escalar. Con
+        ``medir_escalado`` lo resuelve también sin escalar para informar los
+        pivotes ahorrados.
+        """
+        c_esc, A_esc, b_esc = self.escalado.escalar(c, A, b)
+        resultado = self._despachar_motor(
+            c_esc, A_esc, b_esc, desigualdades, tipo_optimizacion
+        )
+        resultado = self.escalado.desescalar(resultado)
+
+        # La medición no debe consumir el presupuesto de la resolución ni
+        # marcarla como interrumpida
+        iteraciones_sin_escalar = None
+        if self.medir_escalado and not self.presupuesto.agotado():
+            try:
+                iteraciones_sin_escalar = self._despachar_motor(
+                    c, A, b, desigualdades, tipo_optimizacion
+                )["iteraciones"]
+            except ValueError:
+                pass
+            if self.presupuesto.motivo is not None:
+                iteraciones_sin_escalar = None
+                self.presupuesto.motivo = None
+
+        resumen = self.escalado.resumen()
+        # Los pasos y la tabla final son los del problema escalado
+        resumen["tablas_escaladas"] = bool(
+            resultado.get("pasos")
+            or resultado.get("registro_pasos")
+            or resultado.get("tabla_final") is not None
+        )
+        if self.medir_escalado:
+            resumen["iteraciones_sin_escalar"] = iteraciones_sin_escalar
+            resumen["pivotes_ahorrados"] = (
+                iteraciones_sin_escalar - resultado["iteraciones"]
+                if iteraciones_sin_escalar is not None
+                else None
+            )
+        resultado["escalado"] = resumen
+        return resultado
+
+    def _ejecutar_simplex_revisado(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> Dict:
+        """Simplex revisado: mantiene una factorización LU de la base."""
+        if tipo_optimizacion == "minimizar":
+            c = -c.copy()
+
+        motor = SimplexRevisado(
+            tolerancia=self.tolerancia,
+            max_iter=self.max_iter,
+            verbose=self.verbose,
+            disperso=self.disperso,
+            regla_pivoteo=self.regla_pivoteo,
+            prueba_razon=self.prueba_razon,
+            registro=self.nivel_registro,
+            presupuesto=self.presupuesto,
+        )
+        resultado = motor.resolver(c, A, b, desigualdades)
+
+        if tipo_optimizacion == "minimizar":
+            resultado["valor_optimo"] = -resultado["valor_optimo"]
+
+        return resultado
+
     def _ejecutar_simplex(
         self,
         c: np.ndarray,
@@ -219,85 +813,151 @@ class SimplexSolver:
         b: np.ndarray,
         desigualdades: List[str],
         tipo_optimizacion: str,
+        base_inicial: Optional[List[int]] = None,
+        origen_base: str = "crossover",
     ) -> Dict:
-        """Implementación optimizada del algoritmo Simplex."""
+        """
+        Implementación optimizada del algoritmo Simplex.
+
+        ``base_inicial`` es una base (una columna de la tabla por fila) desde
+        la que se parte si es primal factible, o dual factible con el Simplex
+        dual; si no es ninguna de las dos, se repara con artificiales en las
+        filas infactibles. Si es singular se usa la base de holguras.
+        ``self.arranque`` indica el arranque usado ("primal", "dual",
+        "reparada" o None).
+        """
         # Convertir a problema de maximización
         if tipo_optimizacion == "minimizar":
             c = -c.copy()
 
         num_vars = len(c)
         num_restr = len(b)
+        self.pivotes_bland = 0
+        self.pivotes_degenerados = 0
+        self.pivotes_estancados = 0
+        self.perturbaciones = 0
+        self.perturbacion = None
+        self.aleatorio = np.random.default_rng(SEMILLA_PERTURBACION)
 
         # 1. Inicializar tabla
         tabla, variables_basicas = self._inicializar_tabla(c, A, b, desigualdades)
-        pasos = [
-            {
-                "titulo": "Tabla inicial",
-                "tabla": tabla.copy().tolist(),
-                "variables_basicas": variables_basicas.copy(),
-                "explicacion": "Tabla inicial con variables de holgura/exceso/artificiales",
+        self.registro = crear_registro(
+            self.nivel_registro, tabla, variables_basicas, c, self.registro_cada
+        )
+        inicio_artificiales = num_vars + sum(
+            1 for d in desigualdades if d in ["<=", ">="]
+        )
+        self.pivotes_duales = 0
+        self.arranque = None
+        hay_artificiales = inicio_artificiales < tabla.shape[1] - 1
+        if base_inicial is None and self.crash and hay_artificiales:
+            base_inicial = base_crash(A, b, desigualdades, self.tolerancia)
+            origen_base = "crash"
+        if base_inicial is not None:
+            if self._cambiar_base(tabla, variables_basicas, base_inicial, origen_base):
+                self.arranque = "primal"
+            else:
+                arranque_dual = self._arranque_dual(
+                    tabla,
+                    variables_basicas,
+                    base_inicial,
+                    c,
+                    inicio_artificiales,
+                    origen_base,
+                )
+                if arranque_dual is not None:
+                    tabla, variables_basicas = arranque_dual
+                    self.arranque = "dual"
+                else:
+                    reparada = self._reparar_base(
+                        tabla, base_inicial, inicio_artificiales
+                    )
+                    if reparada is not None:
+                        tabla, variables_basicas = reparada
+                        self.arranque = "reparada"
+        self.base_cruzada = self.arranque is not None and origen_base != "crash"
+        crash = None
+        if origen_base == "crash" and base_inicial is not None:
+            crash = {
+                "variables": sum(1 for j in base_inicial if j < num_vars),
+                "arranque": self.arranque,
             }
-        ]
 
-        # 2. Fase I (si hay restricciones >= o =)
-        if any(d in [">=", "="] for d in desigualdades):
+        # 2. Fase I (si hay restricciones >= o =). El arranque dual ya deja
+        # la tabla en Fase II; la base reparada tiene artificiales nuevas
+        if self.arranque == "dual":
+            pivotes_fase_I = self.pivotes_duales
+        elif self.arranque == "reparada" or any(
+            d in [">=", "="] for d in desigualdades
+        ):
             if self.verbose:
                 print("\nIniciando Fase I...")
-            tabla, variables_basicas, pasos_faseI = self._fase_I(
-                tabla, variables_basicas, num_vars
+            tabla, variables_basicas, pivotes_fase_I = self._fase_I(
+                tabla, variables_basicas, inicio_artificiales
             )
-            pasos.extend(pasos_faseI)
 
             # Verificar factibilidad
             if not np.allclose(tabla[-1, -1], 0, atol=self.tolerancia):
                 raise ValueError("El problema no tiene solución factible")
 
+            # Restaurar la función objetivo original expresada en la base actual
+            self._restaurar_objetivo(tabla, variables_basicas, c)
+            self.registro.restaurar_objetivo()
+        else:
+            pivotes_fase_I = 0
+
         # 3. Fase II (optimización)
         if self.verbose:
             print("\nIniciando Fase II...")
+        self._iniciar_fase(tabla)
         iteracion = 0
-        while iteracion < self.max_iter:
-            iteracion += 1
-
+        while True:
             # Verificar optimalidad
             if self._es_optimo(tabla):
                 if self.verbose:
                     print(f"Solución óptima encontrada en {iteracion} iteraciones")
                 break
 
+            if iteracion >= self.max_iter:
+                warnings.warn(
+                    "Máximo número de iteraciones alcanzado. Solución puede no ser óptima."
+                )
+                break
+            # Fuera de tiempo o cancelado: la base actual es factible
+            if self.presupuesto.agotado():
+                break
+            iteracion += 1
+
             # Seleccionar pivote
+            self._perturbar_si_estancado(tabla, variables_basicas)
             col_pivote = self._seleccionar_columna_pivote(tabla)
-            fila_pivote = self._seleccionar_fila_pivote(tabla, col_pivote)
+            fila_pivote = self._seleccionar_fila_pivote(
+                tabla, col_pivote, variables_basicas
+            )
 
             if fila_pivote == -1:
                 raise ValueError("El problema es no acotado")
 
+            saliente = variables_basicas[fila_pivote]
+            self._registrar_pivote(tabla, fila_pivote, col_pivote, saliente)
+
             # Actualizar variables básicas
             variables_basicas[fila_pivote] = col_pivote
 
             # Operación de pivote
             self._pivotear(tabla, fila_pivote, col_pivote)
+            self.registro.pivote(
+                tabla, variables_basicas, fila_pivote, col_pivote, saliente, "II"
+            )
 
             if self.verbose:
                 print(
                     f"Iteración {iteracion}: Pivote en fila {fila_pivote}, columna {col_pivote}"
                 )
 
-            pasos.append(
-                {
-                    "titulo": f"Iteración {iteracion}",
-                    "tabla": tabla.copy().tolist(),
-                    "variables_basicas": variables_basicas.copy(),
-                    "pivote": {"fila": fila_pivote, "columna": col_pivote},
-                    "explicacion": f"Pivote en fila {fila_pivote}, columna {col_pivote}",
-                }
-            )
-
-        # Verificar convergencia
-        if iteracion >= self.max_iter:
-            warnings.warn(
-                "Máximo número de iteraciones alcanzado. Solución puede no ser óptima."
-            )
+        iteracion += self._limpiar_perturbacion(
+            tabla, variables_basicas, inicio_artificiales, "II"
+        )
 
         # Extraer resultados
         solucion = self._extraer_solucion(tabla, variables_basicas, num_vars)
@@ -306,14 +966,134 @@ class SimplexSolver:
         if tipo_optimizacion == "minimizar":
             valor_optimo = -valor_optimo
 
+        # Para reoptimizar desde esta base (ramificación y acotamiento)
+        self.tabla_final = tabla
+        self.basicas_finales = variables_basicas
+
         return {
             "solucion": solucion,
             "valor_optimo": float(valor_optimo),
-            "iteraciones": iteracion,
-            "pasos": pasos,
-            "tabla_final": tabla.tolist(),
+            "iteraciones": pivotes_fase_I + iteracion,
+            **self.registro.resultado(tabla, variables_basicas),
+            "variables_basicas": list(variables_basicas),
+            "regla_pivoteo": self.regla.nombre,
+            "pivotes_bland": self.pivotes_bland,
+            "pivotes_degenerados": self.pivotes_degenerados,
+            "pivotes_estancados": self.pivotes_estancados,
+            "perturbaciones": self.perturbaciones,
+            "crash": crash,
         }
 
+    def _cambiar_base(
+        self,
+        tabla: np.ndarray,
+        variables_basicas: List[int],
+        base: List[int],
+        origen: str = "crossover",
+    ) -> bool:
+        """
+        Expresa la tabla en la base dada si es no singular y primal factible.
+        Devuelve False (sin modificar la tabla) en caso contrario.
+        """
+        candidata = tabla.copy()
+        try:
+            cambiar_base(candidata, base)
+        except np.linalg.LinAlgError:
+            return False
+        if not np.all(np.isfinite(candidata)) or np.any(
+            candidata[:-1, -1] < -self.tolerancia
+        ):
+            return False
+
+        tabla[:] = candidata
+        variables_basicas[:] = base
+        self.registro.cambiar_base(tabla, variables_basicas, origen)
+        return True
+
+    def _reparar_base(
+        self, tabla: np.ndarray, base: List[int], inicio_artificiales: int
+    ) -> Optional[Tuple[np.ndarray, List[int]]]:
+        """
+        Parte de ``base`` aunque no sea factible: las filas con lado derecho
+        negativo reciben una artificial nueva y la Fase I empieza desde ahí,
+        en lugar de hacerlo desde la base de todas las artificiales.
+        """
+        candidata = tabla.copy()
+        try:
+            cambiar_base(candidata, base)
+        except np.linalg.LinAlgError:
+            return None
+        if not np.all(np.isfinite(candidata)):
+            return None
+
+        filas = np.flatnonzero(candidata[:-1, -1] < -self.tolerancia).tolist()
+        reparada, variables_basicas = reparar_base(
+            candidata, base, filas, inicio_artificiales
+        )
+        self.registro.reparar_base(
+            reparada, variables_basicas, base, filas, inicio_artificiales
+        )
+        return reparada, variables_basicas
+
+    def _arranque_dual(
+        self,
+        tabla: np.ndarray,
+        variables_basicas: List[int],
+        base: List[int],
+        c: np.ndarray,
+        inicio_artificiales: int,
+        origen: str,
+    ) -> Optional[Tuple[np.ndarray, List[int]]]:
+        """
+        Expresa la tabla de Fase II en ``base`` aunque no sea primal factible
+        y, si es dual factible, recupera la factibilidad con el Simplex dual.
+        Devuelve la tabla sin artificiales no básicas y la base, o None (sin
+        modificar ``tabla``) si la base no sirve.
+        """
+        candidata = tabla.copy()
+        candidata[-1] = 0
+        candidata[-1, : len(c)] = -c
+        try:
+            cambiar_base(candidata, base)
+        except np.linalg.LinAlgError:
+            return None
+        # Las artificiales no pueden volver a entrar a la base
+        permitidas = np.arange(candidata.shape[1] - 1) < inicio_artificiales
+        if not np.all(np.isfinite(candidata)) or np.any(
+            candidata[-1, :-1][permitidas] < -self.tolerancia
+        ):
+            return None
+
+        registro = self.registro
+        basicas = list(base)
+        registro.restaurar_objetivo()
+        registro.cambiar_base(candidata, basicas, origen)
+        self.pivotes_duales = simplex_dual(
+            candidata,
+            basicas,
+            self.tolerancia,
+            self.max_iter,
+            permitidas,
+            lambda fila, columna, sale: registro.pivote(
+                candidata, basicas, fila, columna, sale, "dual"
+            ),
+            self.presupuesto,
+        )
+
+        # Si se agotaron las iteraciones o queda una artificial básica con
+        # valor no nulo se resuelve con la Fase I completa
+        if np.any(candidata[:-1, -1] < -self.tolerancia) or any(
+            j >= inicio_artificiales and abs(candidata[i, -1]) > self.tolerancia
+            for i, j in enumerate(basicas)
+        ):
+            self.registro = crear_registro(
+                self.nivel_registro, tabla, variables_basicas, c, self.registro_cada
+            )
+            self.pivotes_duales = 0
+            return None
+
+        return self._eliminar_artificiales(candidata, basicas, inicio_artificiales)
+
     def _inicializar_tabla(
         self, c: np.ndarray, A: np.ndarray, b: np.ndarray, desigualdades: List[str]
     ) -> Tuple[np.ndarray, List[int]]:
@@ -357,75 +1137,129 @@ class SimplexSolver:
 
             tabla[i, -1] = b[i]
 
-        # Función objetivo original (para Fase II)
-        tabla[-1, :num_vars] = -c  # Negativo porque maximizamos
-
-        # Para Fase I (si hay artificiales)
         if num_artificiales > 0:
-            # Crear función objetivo de Fase I (minimizar suma de variables artificiales)
-            tabla_aux = tabla.copy()
-            tabla_aux[-1, :] = 0
-            for i in range(num_restr):
-                if desigualdades[i] in [">=", "="]:
-                    # Restar filas con variables artificiales para obtener 0 en columna
-                    tabla_aux[-1] -= tabla_aux[i]
-            return tabla_aux, variables_basicas
+            # Función objetivo de Fase I (minimizar suma de variables
+            # artificiales); la original se restaura al terminarla. Se restan
+            # las filas con artificial para obtener 0 en sus columnas
+            tabla[-1, num_vars + num_holgura : -1] = 1
+            filas_artificiales = [
+                i for i in range(num_restr) if desigualdades[i] in [">=", "="]
+            ]
+            tabla[-1] -= tabla[filas_artificiales].sum(axis=0)
         else:
-            return tabla, variables_basicas
+            # Función objetivo original (para Fase II)
+            tabla[-1, :num_vars] = -c  # Negativo porque maximizamos
+        return tabla, variables_basicas
 
     def _fase_I(
-        self, tabla: np.ndarray, variables_basicas: List[int], num_vars: int
-    ) -> Tuple[np.ndarray, List[int], List[Dict]]:
-        """Implementación de la Fase I para problemas con restricciones >= o =."""
-        pasos = []
-        iteracion = 0
+        self,
+        tabla: np.ndarray,
+        variables_basicas: List[int],
+        inicio_artificiales: int,
+    ) -> Tuple[np.ndarray, List[int], int]:
+        """
+        Implementación de la Fase I para problemas con restricciones >= o =.
 
-        while iteracion < self.max_iter:
-            iteracion += 1
+        Devuelve la tabla sin columnas artificiales no básicas, la base
+        reindexada y el número de pivotes realizados.
+        """
+        iteracion = 0
+        self._iniciar_fase(tabla)
 
+        while True:
             if self._es_optimo_faseI(tabla):
                 if self.verbose:
                     print(f"Fase I completada en {iteracion} iteraciones")
                 break
 
+            if iteracion >= self.max_iter:
+                warnings.warn("Máximo número de iteraciones alcanzado en Fase I.")
+                break
+            if self.presupuesto.agotado():
+                raise ValueError(self.presupuesto.error_sin_base())
+            iteracion += 1
+
+            self._perturbar_si_estancado(tabla, variables_basicas)
             col_pivote = self._seleccionar_columna_pivote(tabla)
-            fila_pivote = self._seleccionar_fila_pivote(tabla, col_pivote)
+            fila_pivote = self._seleccionar_fila_pivote(
+                tabla, col_pivote, variables_basicas
+            )
 
             if fila_pivote == -1:
                 raise ValueError("Problema no factible (Fase I no acotada)")
 
+            saliente = variables_basicas[fila_pivote]
+            self._registrar_pivote(tabla, fila_pivote, col_pivote, saliente)
             variables_basicas[fila_pivote] = col_pivote
             self._pivotear(tabla, fila_pivote, col_pivote)
+            self.registro.pivote(
+                tabla, variables_basicas, fila_pivote, col_pivote, saliente, "I"
+            )
 
             if self.verbose:
                 print(
                     f"Fase I - Iteración {iteracion}: Pivote en fila {fila_pivote}, columna {col_pivote}"
                 )
 
-            pasos.append(
-                {
-                    "titulo": f"Fase I - Iteración {iteracion}",
-                    "tabla": tabla.copy().tolist(),
-                    "variables_basicas": variables_basicas.copy(),
-                    "pivote": {"fila": fila_pivote, "columna": col_pivote},
-                    "explicacion": "Pivote en Fase I para eliminar variables artificiales",
-                }
+        iteracion += self._limpiar_perturbacion(
+            tabla, variables_basicas, inicio_artificiales, "I"
+        )
+
+        # Sacar de la base las artificiales que quedaron en nivel cero
+        no_basicas = np.ones(inicio_artificiales, dtype=bool)
+        no_basicas[[j for j in variables_basicas if j < inicio_artificiales]] = False
+        for fila, j in enumerate(variables_basicas):
+            if j < inicio_artificiales or abs(tabla[fila, -1]) > self.tolerancia:
+                continue
+            candidatas = np.flatnonzero(
+                no_basicas
+                & (np.abs(tabla[fila, :inicio_artificiales]) > self.tolerancia)
             )
+            if len(candidatas):
+                entrante = int(candidatas[0])
+                no_basicas[entrante] = False
+                variables_basicas[fila] = entrante
+                self._pivotear(tabla, fila, entrante)
+                self.registro.pivote(
+                    tabla, variables_basicas, fila, entrante, j, "expulsion"
+                )
 
-        # Eliminar columnas de variables artificiales para Fase II
-        mask = [
-            i
-            for i in range(tabla.shape[1])
-            if i not in variables_basicas
-            or i < num_vars
-            or tabla[-1, i] >= -self.tolerancia
+        # Eliminar columnas de variables artificiales no básicas para Fase II
+        tabla, variables_basicas = self._eliminar_artificiales(
+            tabla, variables_basicas, inicio_artificiales
+        )
+        return tabla, variables_basicas, iteracion
+
+    def _eliminar_artificiales(
+        self,
+        tabla: np.ndarray,
+        variables_basicas: List[int],
+        inicio_artificiales: int,
+    ) -> Tuple[np.ndarray, List[int]]:
+        """
+        Quita las columnas artificiales no básicas sin copiar la tabla: las
+        conservadas se desplazan a la izquierda y se devuelve la vista de las
+        primeras columnas, con la base reindexada.
+        """
+        basicas = set(variables_basicas)
+        mask = list(range(inicio_artificiales))
+        mask += [
+            j for j in range(inicio_artificiales, tabla.shape[1] - 1) if j in basicas
         ]
-        tabla = tabla[:, mask]
+        mask.append(tabla.shape[1] - 1)
+        for k in range(inicio_artificiales, len(mask)):
+            tabla[:, k] = tabla[:, mask[k]]
+        self.registro.eliminar_columnas(mask)
 
-        # Actualizar variables básicas
-        variables_basicas = [i for i in variables_basicas if i in mask]
+        # Actualizar variables básicas con los nuevos índices de columna
+        posicion = {j: k for k, j in enumerate(mask)}
+        return tabla[:, : len(mask)], [posicion[j] for j in variables_basicas]
 
-        return tabla, variables_basicas, pasos
+    def _restaurar_objetivo(
+        self, tabla: np.ndarray, variables_basicas: List[int], c: np.ndarray
+    ):
+        """Reemplaza la fila objetivo de Fase I por la original (Fase II)."""
+        restaurar_objetivo(tabla, variables_basicas, c)
 
     def _es_optimo(self, tabla: np.ndarray) -> bool:
         """Determina si la solución actual es óptima."""
@@ -435,44 +1269,137 @@ class SimplexSolver:
         """Determina si la Fase I ha terminado."""
         return np.all(tabla[-1, :-1] >= -self.tolerancia)
 
-    def _seleccionar_columna_pivote(self, tabla: np.ndarray) -> int:
-        """Selecciona la variable entrante usando la regla de Bland para evitar ciclado."""
-        # Regla de Bland: selecciona la primera variable con coeficiente negativo
-        for j in range(tabla.shape[1] - 1):
-            if tabla[-1, j] < -self.tolerancia:
-                return j
-        return -1
-
-    def _seleccionar_fila_pivote(self, tabla: np.ndarray, col_pivote: int) -> int:
-        """Selecciona la variable saliente usando la regla de la razón mínima."""
-        ratios = []
-        for i in range(tabla.shape[0] - 1):
-            if tabla[i, col_pivote] > self.tolerancia:
-                ratio = tabla[i, -1] / tabla[i, col_pivote]
-                ratios.append(ratio if ratio >= 0 else np.inf)
-            else:
-                ratios.append(np.inf)
+    def _iniciar_fase(self, tabla: np.ndarray):
+        """Reinicia la regla de pivoteo con las normas de las columnas actuales."""
+        cuerpo = tabla[:-1, :-1]
+        self.regla.reiniciar(np.einsum("ij,ij->j", cuerpo, cuerpo))
+        self.degenerados_consecutivos = 0
 
-        if all(np.isinf(r) for r in ratios):
-            return -1
+    def _perturbar_si_estancado(self, tabla: np.ndarray, variables_basicas: List[int]):
+        """
+        Si la fase está estancada (demasiados pivotes degenerados seguidos)
+        y no hay una perturbación activa, suma al lado derecho un valor
+        aleatorio pequeño y positivo por fila para deshacer los empates de
+        la prueba de razón. La perturbación se sigue a través de los pivotes
+        y se quita al terminar la fase.
+        """
+        if (
+            self.degenerados_consecutivos < LIMITE_PIVOTES_DEGENERADOS
+            or self.perturbacion is not None
+        ):
+            return
+        rhs = tabla[:-1, -1]
+        delta = np.zeros(tabla.shape[0])
+        delta[:-1] = (
+            self.tolerancia
+            * self.aleatorio.uniform(*RANGO_PERTURBACION, len(rhs))
+            * (1.0 + np.abs(rhs))
+        )
+        tabla[:, -1] += delta
+        self.perturbacion = delta
+        self.perturbaciones += 1
+        self.degenerados_consecutivos = 0
+        self.registro.ajustar_rhs(tabla, variables_basicas, delta, "perturbacion")
 
-        # Regla de Bland: selecciona la fila con índice más pequeño en caso de empate
-        min_ratio = min(ratios)
-        candidatos = [
-            i for i, r in enumerate(ratios) if abs(r - min_ratio) < self.tolerancia
-        ]
-        return min(candidatos)
+    def _limpiar_perturbacion(
+        self,
+        tabla: np.ndarray,
+        variables_basicas: List[int],
+        inicio_artificiales: int,
+        fase: str,
+    ) -> int:
+        """
+        Quita la perturbación activa del lado derecho. Los costos reducidos
+        no dependen de él, así que si la base queda primal infactible se
+        recupera con el Simplex dual. Devuelve el número de pivotes duales.
+        """
+        if self.perturbacion is None:
+            return 0
+        delta = -self.perturbacion
+        self.perturbacion = None
+        tabla[:, -1] += delta
+        self.registro.ajustar_rhs(tabla, variables_basicas, delta, "limpieza")
+
+        # En Fase II las artificiales no pueden volver a entrar a la base
+        permitidas = None
+        if fase == "II":
+            permitidas = np.arange(tabla.shape[1] - 1) < inicio_artificiales
+        registro = self.registro
+        return simplex_dual(
+            tabla,
+            variables_basicas,
+            self.tolerancia,
+            self.max_iter,
+            permitidas,
+            lambda fila, columna, sale: registro.pivote(
+                tabla, variables_basicas, fila, columna, sale, "dual"
+            ),
+            self.presupuesto,
+        )
 
-    def _pivotear(self, tabla: np.ndarray, fila_pivote: int, col_pivote: int):
-        """Operación de pivote optimizada con operaciones vectorizadas."""
-        pivote_val = tabla[fila_pivote, col_pivote]
-        tabla[fila_pivote] /= pivote_val
+    def _seleccionar_columna_pivote(self, tabla: np.ndarray) -> int:
+        """Selecciona la variable entrante con la regla de pivoteo configurada."""
+        if self.degenerados_consecutivos >= LIMITE_PIVOTES_DEGENERADOS:
+            # Respaldo anti-ciclado: Bland hasta el próximo pivote no degenerado
+            self.pivotes_bland += 1
+            return self.regla_bland.seleccionar(tabla[-1, :-1])
+        return self.regla.seleccionar(tabla[-1, :-1])
+
+    def _registrar_pivote(
+        self, tabla: np.ndarray, fila_pivote: int, col_pivote: int, saliente: int
+    ):
+        """Actualiza la regla de pivoteo y el contador de degeneración antes de pivotear."""
+        if self.regla.requiere_fila_pivote:
+            cuerpo = tabla[:-1, :-1]
+            self.regla.actualizar(
+                cuerpo[fila_pivote].copy(),
+                cuerpo[:, col_pivote].copy(),
+                col_pivote,
+                saliente,
+                fila_pivote,
+                lambda v: v @ cuerpo,
+            )
+
+        paso = tabla[fila_pivote, -1] / tabla[fila_pivote, col_pivote]
+        if paso <= self.tolerancia:
+            self.degenerados_consecutivos += 1
+            self.pivotes_degenerados += 1
+            # Los pivotes de una racha que llega al límite son estancados
+            if self.degenerados_consecutivos == LIMITE_PIVOTES_DEGENERADOS:
+                self.pivotes_estancados += LIMITE_PIVOTES_DEGENERADOS
+            elif self.degenerados_consecutivos > LIMITE_PIVOTES_DEGENERADOS:
+                self.pivotes_estancados += 1
+        else:
+            self.degenerados_consecutivos = 0
 
-        mask = np.ones(tabla.shape[0], dtype=bool)
-        mask[fila_pivote] = False
-        factores = tabla[mask, col_pivote, np.newaxis]
+    def _seleccionar_fila_pivote(
+        self,
+        tabla: np.ndarray,
+        col_pivote: int,
+        variables_basicas: Optional[List[int]] = None,
+    ) -> int:
+        """Selecciona la variable saliente con la prueba de razón configurada."""
+        rhs = tabla[:-1, -1]
+        columna = tabla[:-1, col_pivote]
+
+        if self.degenerados_consecutivos >= LIMITE_PIVOTES_DEGENERADOS:
+            # Bland completo: empates por menor índice de variable básica
+            return razon_minima(rhs, columna, self.tolerancia, variables_basicas)
+        if self.prueba_razon == "estandar":
+            return razon_minima(rhs, columna, self.tolerancia)
+        return razon_harris(rhs, columna, self.tolerancia)
 
-        tabla[mask] -= factores * tabla[fila_pivote]
+    def _pivotear(self, tabla: np.ndarray, fila_pivote: int, col_pivote: int):
+        """Operación de pivote in situ, reutilizando el espacio de trabajo."""
+        if self.perturbacion is not None:
+            # La perturbación sigue las mismas operaciones de fila que la tabla
+            columna = tabla[:, col_pivote]
+            delta = self.perturbacion
+            delta[fila_pivote] /= columna[fila_pivote]
+            paso = delta[fila_pivote]
+            delta -= columna * paso
+            delta[fila_pivote] = paso
+        pivotear_tabla(tabla, fila_pivote, col_pivote, self.espacio)
 
     def _extraer_solucion(
         self, tabla: np.ndarray, variables_basicas: List[int], num_vars: int
@@ -495,15 +1422,34 @@ class SimplexSolver:
         tipo_optimizacion: str,
         solucion: List[float],
         valor_optimo: float,
+        region: Optional[RegionPlana] = None,
     ) -> str:
-        """Genera un gráfico de la región factible para problemas 2D."""
+        """
+        Genera un gráfico de la región factible para problemas 2D. La región
+        se sombrea con el polígono exacto (recortado a la ventana) y cada
+        restricción se dibuja como una recta de dos puntos.
+        """
+        if region is None:
+            region = RegionPlana(A, b, desigualdades, self.tolerancia)
         plt.figure(figsize=(10, 8))
         plt.grid(True, linestyle="--", alpha=0.7)
 
-        # Configurar ejes
-        x_vals = np.linspace(0, max(b) * 1.5, 500)
-        plt.xlim(0, max(b) * 1.5)
-        plt.ylim(0, max(b) * 1.5)
+        # Configurar ejes: la ventana cubre los vértices reales y la solución
+        puntos = [
+            vertice
+            for k, vertice in enumerate(
+                region.poligono if region.poligono is not None else []
+            )
+            if not region.en_caja(k)
+        ]
+        if solucion and len(solucion) == 2:
+            puntos.append(solucion)
+        limite = 1.5 * float(np.max(puntos)) if puntos else 0.0
+        if limite <= 0:
+            limite = max(float(np.max(b)) * 1.5, 1.0)
+        x_vals = np.array([0.0, limite])
+        plt.xlim(0, limite)
+        plt.ylim(0, limite)
         plt.xlabel("$x_1$", fontsize=12)
         plt.ylabel("$x_2$", fontsize=12)
 
@@ -516,23 +1462,21 @@ class SimplexSolver:
                 y = (bi - a1 * x_vals) / a2
                 label = f"{a1:.2f}x₁ + {a2:.2f}x₂ {des} {bi:.2f}"
                 plt.plot(x_vals, y, label=label, linewidth=2)
-
-                # Sombrear región factible
-                if des == "<=":
-                    plt.fill_between(x_vals, 0, y, alpha=0.1)
-                elif des == ">=":
-                    plt.fill_between(x_vals, y, plt.ylim()[1], alpha=0.1)
-            else:
+            elif a1 != 0:
                 # Restricción vertical (x1 = constante)
                 x_val = bi / a1
                 plt.axvline(x=x_val, label=f"{a1:.2f}x₁ {des} {bi:.2f}", linewidth=2)
 
-                if des == "<=":
-                    plt.fill_betweenx([0, plt.ylim()[1]], 0, x_val, alpha=0.1)
-                elif des == ">=":
-                    plt.fill_betweenx(
-                        [0, plt.ylim()[1]], x_val, plt.xlim()[1], alpha=0.1
-                    )
+        # Sombrear región factible
+        poligono = region.recortar(limite, limite)
+        if poligono is not None:
+            plt.fill(
+                poligono[:, 0],
+                poligono[:, 1],
+                color="tab:blue",
+                alpha=0.2,
+                label="Región factible",
+            )
 
         # Graficar solución óptima
         if solucion and len(solucion) == 2:
@@ -572,12 +1516,31 @@ class SimplexSolver:
         return img_base64
 
 
+# Caché compartida por todas las resoluciones del proceso
+cache_resultados = CacheResultados(VERSION_SOLVER)
+
+
 # Función de conveniencia para mantener compatibilidad
-def resolver_simplex(simplex_problem):
+def resolver_simplex(simplex_problem, **opciones):
+    """
+    Resuelve un ProblemaSimplex con sus opciones guardadas. ``opciones``
+    permite ajustar otros parámetros de SimplexSolver (p. ej. generar_grafico).
+    Sin ``tiempo_limite`` propio se usa ``settings.SIMPLEX_TIEMPO_LIMITE``.
+    """
+    escalado = getattr(simplex_problem, "escalado", "ninguno")
+    opciones.setdefault(
+        "tiempo_limite",
+        getattr(simplex_problem, "tiempo_limite", None) or tiempo_limite_por_defecto(),
+    )
     solver = SimplexSolver(
         tolerancia=float(simplex_problem.tolerancia),
         max_iter=int(simplex_problem.max_iteraciones),
         verbose=False,
+        motor=getattr(simplex_problem, "motor", "tabla"),
+        regla_pivoteo=getattr(simplex_problem, "regla_pivoteo", "dantzig"),
+        escalado=escalado if escalado != "ninguno" else None,
+        cache=cache_resultados,
+        **opciones,
     )
     resultado = solver.resolver_problema(simplex_problem)
 
@@ -598,3 +1561,20 @@ def resolver_simplex(simplex_problem):
         ]
 
     return resultado
+
+
+def barrido_simplex(simplex_problem, parametro, indice, hasta, desde=None, base=None):
+    """
+    Barrido paramétrico de un ProblemaSimplex (ver
+    ``SimplexSolver.barrido_parametrico``) desde su base óptima guardada.
+    """
+    solver = SimplexSolver(
+        tolerancia=float(simplex_problem.tolerancia),
+        max_iter=int(simplex_problem.max_iteraciones),
+        motor=getattr(simplex_problem, "motor", "tabla"),
+        regla_pivoteo=getattr(simplex_problem, "regla_pivoteo", "dantzig"),
+        generar_grafico=False,
+        registro="ninguno",
+        base_anterior=base,
+    )
+    return solver.barrido_parametrico(simplex_problem, parametro, indice, hasta, desde)
@@ -0,0 +1,359 @@
+import os
+import threading
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import islice
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Optional
+
+from .formula import SimplexSolver, resolver_simplex
+from .presupuesto import Presupuesto, tiempo_limite_por_defecto
+from .simplex_apilado import resolver_apilado
+
+# Opciones de un problema del lote que pueden omitirse; sus valores por
+# omisión son los de ProblemaSimplex
+CAMPOS_OPCIONES = (
+    "variables_decision",
+    "tipo_optimizacion",
+    "tolerancia",
+    "max_iteraciones",
+    "tiempo_limite",
+    "motor",
+    "regla_pivoteo",
+    "escalado",
+    "variables_enteras",
+)
+
+# Opciones con las que un problema puede resolverse en la tabla apilada: es
+# el mismo Simplex de tabla con Dantzig (y Bland ante degeneración), sin
+# escalado ni variables enteras
+MOTORES_APILABLES = ("automatico", "tabla")
+
+# Tamaño máximo de los problemas que se apilan: la tabla apilada solo
+# compensa en problemas pequeños; los demás se resuelven uno por uno con el
+# solver completo (presolve, prueba de Harris, selección de motor)
+MAXIMO_VARIABLES_APILADAS = 10
+MAXIMO_RESTRICCIONES_APILADAS = 20
+
+# Problemas por grupo apilado; los grupos más grandes se parten para que la
+# tabla (K, m + 2, n + 2m + 1) no crezca sin límite y se reparta en el pool
+MAXIMO_APILADO = 256
+
+
+@lru_cache(maxsize=None)
+def _opciones_por_defecto() -> tuple:
+    from .models import ProblemaSimplex
+
+    return tuple(
+        (campo, ProblemaSimplex._meta.get_field(campo).get_default())
+        for campo in CAMPOS_OPCIONES
+    )
+
+
+def completar_opciones(datos: Dict) -> Dict:
+    """Completa las opciones omitidas con los valores por omisión del modelo."""
+    return {**dict(_opciones_por_defecto()), **datos}
+
+
+def estado_resultado(resultado: Dict, advertencias: List[str]) -> str:
+    """Traduce un resultado del solver a los estados de ProblemaSimplex."""
+    error = resultado.get("error")
+    if error:
+        if "no acotado" in error:
+            return "no_acotado"
+        if "factible" in error:
+            return "infactible"
+        return "error"
+    if advertencias or resultado.get("warning"):
+        return "advertencia"
+    return "optimo"
+
+
+def resolver_item(indice: int, datos: Dict, incluir_pasos: bool = False) -> Dict:
+    """
+    Resuelve un problema del lote. Se ejecuta en un proceso del pool, por lo
+    que recibe y devuelve solo tipos serializables; ``datos`` ya trae todas
+    las opciones (ver ``completar_opciones``).
+    """
+    inicio = time.perf_counter()
+    problema = SimpleNamespace(**datos)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        try:
+            resultado = resolver_simplex(
+                problema,
+                generar_grafico=False,
+                registro="completo" if incluir_pasos else "ninguno",
+                # El lote ya reparte los problemas entre procesos
+                trabajadores_ramificacion=1,
+            )
+        except Exception as e:
+            resultado = {"error": str(e)}
+    # Los RuntimeWarning de NumPy no son advertencias del método
+    advertencias = [
+        str(warn.message) for warn in w if not issubclass(warn.category, RuntimeWarning)
+    ]
+
+    item = {
+        "indice": indice,
+        "estado": estado_resultado(resultado, advertencias),
+        "error": resultado.get("error"),
+        "advertencias": advertencias,
+        "solucion": resultado.get("solucion"),
+        "valor_optimo": resultado.get("valor_optimo"),
+        "iteraciones": resultado.get("iteraciones", 0),
+        "desde_cache": resultado.get("desde_cache", False),
+        "tiempo_resolucion": time.perf_counter() - inicio,
+    }
+    if incluir_pasos:
+        item["pasos"] = resultado.get("registro_pasos") or resultado.get("pasos", [])
+        item["tabla_final"] = resultado.get("tabla_final")
+    return item
+
+
+def resolver_grupo(indices: List[int], grupo: List[Dict]) -> List[Dict]:
+    """
+    Resuelve con ``resolver_apilado`` problemas ya parseados de la misma forma
+    y opciones. El tiempo límite de los problemas se aplica al grupo, que
+    los resuelve a la vez; el tiempo empleado se reparte por igual entre
+    sus problemas.
+    """
+    inicio = time.perf_counter()
+    opciones = grupo[0]["opciones"]
+    tiempo_limite = opciones["tiempo_limite"]
+    presupuesto = Presupuesto(
+        tiempo_limite if tiempo_limite is not None else tiempo_limite_por_defecto()
+    )
+    try:
+        resultados = resolver_apilado(
+            grupo, opciones["tolerancia"], opciones["max_iteraciones"], presupuesto
+        )
+    except Exception as e:
+        resultados = [{"error": str(e)} for _ in grupo]
+    tiempo = (time.perf_counter() - inicio) / len(grupo)
+
+    items = []
+    for indice, resultado in zip(indices, resultados):
+        advertencias = [resultado["warning"]] if resultado.get("warning") else []
+        items.append(
+            {
+                "indice": indice,
+                "estado": estado_resultado(resultado, advertencias),
+                "error": resultado.get("error"),
+                "advertencias": advertencias,
+                "solucion": resultado.get("solucion"),
+                "valor_optimo": resultado.get("valor_optimo"),
+                "iteraciones": resultado.get("iteraciones", 0),
+                "desde_cache": False,
+                "tiempo_resolucion": tiempo,
+            }
+        )
+    return items
+
+
+def _parsear_apilable(datos: Dict) -> Optional[Dict]:
+    """
+    Devuelve el problema parseado para ``resolver_apilado`` o None si sus
+    opciones no admiten la tabla apilada, si es demasiado grande para ella o
+    si no se puede parsear (en ese caso ``resolver_item`` informa el error).
+    """
+    problema = datos
+    if (
+        (problema["variables_enteras"] or "").strip()
+        or problema["motor"] not in MOTORES_APILABLES
+        or problema["regla_pivoteo"] != "dantzig"
+        or problema["escalado"] != "ninguno"
+    ):
+        return None
+    try:
+        c, A, b, desigualdades = SimplexSolver()._parsear_problema(
+            problema["objetivo"],
+            problema["restricciones"],
+            problema["variables_decision"],
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+    if len(c) > MAXIMO_VARIABLES_APILADAS or len(b) > MAXIMO_RESTRICCIONES_APILADAS:
+        return None
+    return {
+        "c": c,
+        "A": A,
+        "b": b,
+        "desigualdades": desigualdades,
+        "tipo_optimizacion": problema["tipo_optimizacion"],
+        "opciones": {
+            "tolerancia": float(problema["tolerancia"]),
+            "max_iteraciones": int(problema["max_iteraciones"]),
+            "tiempo_limite": (
+                float(problema["tiempo_limite"])
+                if problema["tiempo_limite"] is not None
+                else None
+            ),
+        },
+    }
+
+
+def agrupar_lote(problemas: List[Dict], incluir_pasos: bool = False):
+    """
+    Separa el lote en grupos para la tabla apilada (misma forma y opciones,
+    al menos dos problemas) y problemas sueltos.
+
+    Returns:
+        tuple: lista de grupos ``(indices, problemas parseados)`` y lista de
+        índices a resolver uno por uno con ``resolver_item``.
+    """
+    if incluir_pasos:
+        # La tabla apilada no registra pasos
+        return [], list(range(len(problemas)))
+
+    candidatos: Dict[tuple, List[int]] = {}
+    parseados: Dict[int, Dict] = {}
+    sueltos = []
+    for indice, datos in enumerate(problemas):
+        parseado = _parsear_apilable(datos)
+        if parseado is None:
+            sueltos.append(indice)
+            continue
+        parseados[indice] = parseado
+        clave = (
+            len(parseado["b"]),
+            len(parseado["c"]),
+            parseado["opciones"]["tolerancia"],
+            parseado["opciones"]["max_iteraciones"],
+            parseado["opciones"]["tiempo_limite"],
+        )
+        candidatos.setdefault(clave, []).append(indice)
+
+    grupos = []
+    for indices in candidatos.values():
+        if len(indices) < 2:
+            sueltos.extend(indices)
+            continue
+        for inicio in range(0, len(indices), MAXIMO_APILADO):
+            parte = indices[inicio : inicio + MAXIMO_APILADO]
+            grupos.append((parte, [parseados[i] for i in parte]))
+    return grupos, sorted(sueltos)
+
+
+def _inicializar_trabajador():
+    # Las conexiones heredadas del proceso padre no se pueden compartir
+    try:
+        from django.db import connections
+
+        connections.close_all()
+    except Exception:
+        pass
+
+
+def trabajadores_maximos() -> int:
+    try:
+        from django.conf import settings
+
+        configurado = getattr(settings, "SIMPLEX_LOTE_TRABAJADORES", None)
+    except Exception:
+        configurado = None
+    return configurado or os.cpu_count() or 1
+
+
+# Pool compartido por todos los lotes del proceso: arrancar los trabajadores
+# (cada uno importa Django y NumPy) cuesta más que resolver un lote chico
+_pool: Optional[ProcessPoolExecutor] = None
+_candado_pool = threading.Lock()
+
+
+def pool_lote() -> ProcessPoolExecutor:
+    """
+    Devuelve el pool de ``trabajadores_maximos()`` procesos, creándolo en el
+    primer lote. Cada lote limita cuántas tareas tiene en curso a la vez.
+    """
+    global _pool
+    with _candado_pool:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=trabajadores_maximos(),
+                initializer=_inicializar_trabajador,
+            )
+        return _pool
+
+
+def _descartar_pool(pool: ProcessPoolExecutor):
+    """Descarta un pool roto (un trabajador murió) para que se cree otro."""
+    global _pool
+    with _candado_pool:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def resolver_lote(
+    problemas: List[Dict],
+    trabajadores: Optional[int] = None,
+    incluir_pasos: bool = False,
+) -> Iterator[Dict]:
+    """
+    Resuelve una lista de problemas en un pool de procesos y entrega cada
+    resultado en cuanto termina (orden de finalización, no de entrada).
+    Cada resultado lleva el ``indice`` del problema en la lista original.
+
+    Los problemas continuos de la misma forma y opciones se resuelven juntos
+    en la tabla apilada (ver ``agrupar_lote``); cada grupo es una sola tarea.
+    """
+    problemas = [completar_opciones(datos) for datos in problemas]
+    grupos, sueltos = agrupar_lote(problemas, incluir_pasos)
+    tareas = [(resolver_grupo, (indices, grupo), indices) for indices, grupo in grupos]
+    tareas += [
+        (resolver_item, (indice, problemas[indice], incluir_pasos), [indice])
+        for indice in sueltos
+    ]
+    maximo = trabajadores_maximos()
+    trabajadores = min(trabajadores or maximo, maximo, max(len(tareas), 1))
+
+    if trabajadores <= 1:
+        for funcion, argumentos, _ in tareas:
+            resultado = funcion(*argumentos)
+            yield from [resultado] if isinstance(resultado, dict) else resultado
+        return
+
+    pool = pool_lote()
+    pendientes = iter(tareas)
+    futuros: Dict[Future, List[int]] = {}
+
+    def enviar():
+        for funcion, argumentos, indices in islice(pendientes, 1):
+            try:
+                futuro = pool.submit(funcion, *argumentos)
+            except Exception as e:
+                futuro = Future()
+                futuro.set_exception(e)
+            futuros[futuro] = indices
+
+    try:
+        # Como mucho ``trabajadores`` tareas del lote en curso a la vez
+        for _ in range(trabajadores):
+            enviar()
+        while futuros:
+            hechos, _ = wait(futuros, return_when=FIRST_COMPLETED)
+            for futuro in hechos:
+                indices = futuros.pop(futuro)
+                try:
+                    resultado = futuro.result()
+                except Exception as e:
+                    # Fallo del proceso trabajador (no del solver)
+                    if isinstance(e, BrokenProcessPool):
+                        _descartar_pool(pool)
+                    for indice in indices:
+                        yield {
+                            "indice": indice,
+                            "estado": "error",
+                            "error": f"Error del proceso trabajador: {e}",
+                        }
+                else:
+                    yield from [resultado] if isinstance(resultado, dict) else resultado
+                enviar()
+    finally:
+        # Lote abandonado (p. ej. el cliente cortó la respuesta)
+        for futuro in futuros:
+            futuro.cancel()
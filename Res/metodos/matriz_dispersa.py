@@ -0,0 +1,107 @@
+import numpy as np
+from typing import List, Tuple
+
+
+class MatrizCSC:
+    """
+    Matriz dispersa en formato CSC (columnas comprimidas) implementada con NumPy.
+
+    Solo guarda los elementos no nulos: ``datos[k]`` está en la fila
+    ``indices[k]`` y la columna ``j`` ocupa ``indptr[j]:indptr[j + 1]``.
+    """
+
+    def __init__(
+        self,
+        datos: np.ndarray,
+        indices: np.ndarray,
+        indptr: np.ndarray,
+        forma: Tuple[int, int],
+    ):
+        self.datos = np.asarray(datos, dtype=np.float64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.forma = (int(forma[0]), int(forma[1]))
+        # Columna de cada elemento no nulo, usada por los productos vectorizados
+        self._columna_de = np.repeat(np.arange(self.forma[1]), np.diff(self.indptr))
+
+    @classmethod
+    def desde_densa(cls, A: np.ndarray, tolerancia: float = 0.0) -> "MatrizCSC":
+        A = np.asarray(A, dtype=np.float64)
+        # nonzero sobre A^T devuelve los elementos ya ordenados por columna de A
+        columnas, filas = np.nonzero(np.abs(A.T) > tolerancia)
+        datos = A.T[columnas, filas]
+        indptr = np.zeros(A.shape[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(columnas, minlength=A.shape[1]), out=indptr[1:])
+        return cls(datos, filas, indptr, A.shape)
+
+    @classmethod
+    def desde_tripletas(
+        cls,
+        filas: List[int],
+        columnas: List[int],
+        valores: List[float],
+        forma: Tuple[int, int],
+    ) -> "MatrizCSC":
+        """Construye la matriz a partir de tripletas (fila, columna, valor)."""
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=np.float64)
+        orden = np.lexsort((filas, columnas))
+        indptr = np.zeros(forma[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(columnas, minlength=forma[1]), out=indptr[1:])
+        return cls(valores[orden], filas[orden], indptr, forma)
+
+    @property
+    def nnz(self) -> int:
+        return int(self.datos.size)
+
+    @property
+    def densidad(self) -> float:
+        total = self.forma[0] * self.forma[1]
+        return self.nnz / total if total else 0.0
+
+    def columna(self, j: int) -> np.ndarray:
+        """Devuelve la columna ``j`` como vector denso."""
+        v = np.zeros(self.forma[0])
+        inicio, fin = self.indptr[j], self.indptr[j + 1]
+        v[self.indices[inicio:fin]] = self.datos[inicio:fin]
+        return v
+
+    def producto(self, x: np.ndarray) -> np.ndarray:
+        """Calcula A @ x."""
+        return np.bincount(
+            self.indices,
+            weights=self.datos * x[self._columna_de],
+            minlength=self.forma[0],
+        )
+
+    def producto_transpuesto(self, y: np.ndarray) -> np.ndarray:
+        """Calcula A^T @ y (un producto punto por columna)."""
+        return np.bincount(
+            self._columna_de,
+            weights=self.datos * y[self.indices],
+            minlength=self.forma[1],
+        )
+
+    def submatriz_columnas(self, columnas) -> "MatrizCSC":
+        columnas = np.asarray(columnas, dtype=np.int64)
+        inicios = self.indptr[columnas]
+        largos = self.indptr[columnas + 1] - inicios
+        posiciones = (
+            np.concatenate([np.arange(i, i + l) for i, l in zip(inicios, largos)])
+            if columnas.size
+            else np.zeros(0, dtype=np.int64)
+        )
+        indptr = np.zeros(columnas.size + 1, dtype=np.int64)
+        np.cumsum(largos, out=indptr[1:])
+        return MatrizCSC(
+            self.datos[posiciones],
+            self.indices[posiciones],
+            indptr,
+            (self.forma[0], columnas.size),
+        )
+
+    def a_densa(self) -> np.ndarray:
+        A = np.zeros(self.forma)
+        A[self.indices, self._columna_de] = self.datos
+        return A
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-18 18:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0007_diferenciacionfinita_explicacion_chatgpt_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='motor',
+            field=models.CharField(choices=[('tabla', 'Tabla Simplex'), ('revisado', 'Simplex revisado (factorización LU)')], default='tabla', help_text='Motor de resolución: tabla completa o Simplex revisado', max_length=20),
+        ),
+    ]
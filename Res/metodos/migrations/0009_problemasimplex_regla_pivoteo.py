@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-18 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0008_problemasimplex_motor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='regla_pivoteo',
+            field=models.CharField(choices=[('dantzig', 'Dantzig (costo reducido más negativo)'), ('parcial', 'Pricing parcial'), ('devex', 'Devex'), ('steepest_edge', 'Máxima pendiente (steepest edge)')], default='dantzig', help_text='Regla para elegir la variable entrante (Bland se usa solo como respaldo anti-ciclado)', max_length=20),
+        ),
+    ]
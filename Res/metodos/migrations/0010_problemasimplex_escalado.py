@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-18 18:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0009_problemasimplex_regla_pivoteo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='escalado',
+            field=models.CharField(choices=[('ninguno', 'Sin escalado'), ('geometrico', 'Media geométrica'), ('equilibrio', 'Equilibrado')], default='ninguno', help_text='Escalado de filas y columnas antes de resolver', max_length=20),
+        ),
+    ]
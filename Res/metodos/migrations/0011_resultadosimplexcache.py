@@ -0,0 +1,29 @@
+# Generated by Django 5.2.2 on 2026-10-18 18:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0010_problemasimplex_escalado'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResultadoSimplexCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clave', models.CharField(help_text='Hash SHA-256 de la forma canónica del problema', max_length=64, unique=True)),
+                ('version_solver', models.CharField(db_index=True, help_text='Versión del solver que produjo el resultado', max_length=20)),
+                ('resultado', models.JSONField(help_text='Resultado completo del solver')),
+                ('aciertos', models.PositiveIntegerField(default=0, help_text='Veces que el resultado se sirvió desde la caché')),
+                ('creado', models.DateTimeField(auto_now_add=True)),
+                ('actualizado', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Resultado Simplex en caché',
+                'verbose_name_plural': 'Resultados Simplex en caché',
+            },
+        ),
+    ]
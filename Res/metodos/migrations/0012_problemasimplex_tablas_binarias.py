@@ -0,0 +1,90 @@
+# Generated by Django 5.2.2 on 2026-10-18 19:02
+
+import json
+
+import metodos.campos
+from django.db import migrations
+
+
+CAMPOS = ("tabla_inicial", "tabla_final", "pasos")
+
+
+def _desde_json(valor):
+    # Algunas tablas se guardaron con json.dumps dentro del JSONField
+    if isinstance(valor, str):
+        valor = json.loads(valor)
+    return valor
+
+
+def a_binario(apps, schema_editor):
+    ProblemaSimplex = apps.get_model("metodos", "ProblemaSimplex")
+    for problema in ProblemaSimplex.objects.only("pk", *CAMPOS).iterator():
+        for campo in CAMPOS:
+            setattr(problema, f"{campo}_binaria", _desde_json(getattr(problema, campo)))
+        problema.save(update_fields=[f"{campo}_binaria" for campo in CAMPOS])
+
+
+def a_json(apps, schema_editor):
+    ProblemaSimplex = apps.get_model("metodos", "ProblemaSimplex")
+    campos_binarios = [f"{campo}_binaria" for campo in CAMPOS]
+    for problema in ProblemaSimplex.objects.only("pk", *campos_binarios).iterator():
+        for campo in CAMPOS:
+            setattr(
+                problema,
+                campo,
+                metodos.campos.a_listas(getattr(problema, f"{campo}_binaria")),
+            )
+        problema.save(update_fields=list(CAMPOS))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0011_resultadosimplexcache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='tabla_inicial_binaria',
+            field=metodos.campos.CampoTabla(blank=True, null=True, help_text='Tabla inicial del simplex (comprimida)'),
+        ),
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='tabla_final_binaria',
+            field=metodos.campos.CampoTabla(blank=True, null=True, help_text='Tabla final del simplex (comprimida)'),
+        ),
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='pasos_binaria',
+            field=metodos.campos.CampoPasos(blank=True, null=True, help_text='Todos los pasos intermedios del método Simplex (comprimidos)'),
+        ),
+        migrations.RunPython(a_binario, a_json),
+        migrations.RemoveField(
+            model_name='problemasimplex',
+            name='tabla_inicial',
+        ),
+        migrations.RemoveField(
+            model_name='problemasimplex',
+            name='tabla_final',
+        ),
+        migrations.RemoveField(
+            model_name='problemasimplex',
+            name='pasos',
+        ),
+        migrations.RenameField(
+            model_name='problemasimplex',
+            old_name='tabla_inicial_binaria',
+            new_name='tabla_inicial',
+        ),
+        migrations.RenameField(
+            model_name='problemasimplex',
+            old_name='tabla_final_binaria',
+            new_name='tabla_final',
+        ),
+        migrations.RenameField(
+            model_name='problemasimplex',
+            old_name='pasos_binaria',
+            new_name='pasos',
+        ),
+    ]
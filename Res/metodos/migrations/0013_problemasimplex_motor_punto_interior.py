@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0012_problemasimplex_tablas_binarias'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='problemasimplex',
+            name='motor',
+            field=models.CharField(choices=[('tabla', 'Tabla Simplex'), ('revisado', 'Simplex revisado (factorización LU)'), ('punto_interior', 'Punto interior con crossover'), ('automatico', 'Automático según el tamaño')], default='automatico', help_text='Motor de resolución: tabla completa, Simplex revisado, punto interior o automático', max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-18 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0013_problemasimplex_motor_punto_interior'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='variables_enteras',
+            field=models.CharField(blank=True, default='', help_text='Variables que deben tomar valores enteros, ej: x1, x3', max_length=255),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.2 on 2026-10-18 18:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0014_problemasimplex_variables_enteras'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='iteraciones_evitadas',
+            field=models.IntegerField(default=0, help_text='Iteraciones ahorradas al partir de una base anterior (estimadas respecto a resolver desde cero)'),
+        ),
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='problema_origen',
+            field=models.ForeignKey(blank=True, help_text='Problema del que se clonó; su base óptima es la base inicial', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='clones', to='metodos.problemasimplex'),
+        ),
+    ]
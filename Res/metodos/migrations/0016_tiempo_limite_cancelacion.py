@@ -0,0 +1,29 @@
+# Generated by Django 5.2.2 on 2026-10-18 18:59
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0015_problemasimplex_arranque_en_caliente'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='cancelacion_solicitada',
+            field=models.BooleanField(default=False, help_text='Se pidió cancelar la resolución en curso desde la API'),
+        ),
+        migrations.AddField(
+            model_name='problemasimplex',
+            name='tiempo_limite',
+            field=models.FloatField(blank=True, help_text='Tiempo máximo de resolución en segundos (vacío: el configurado)', null=True, validators=[django.core.validators.MinValueValidator(0.01)]),
+        ),
+        migrations.AlterField(
+            model_name='problemasimplex',
+            name='estado',
+            field=models.CharField(choices=[('optimo', 'Óptimo'), ('advertencia', 'Advertencia'), ('no_acotado', 'No acotado'), ('infactible', 'Infactible'), ('error', 'Error'), ('procesando', 'Procesando'), ('cancelado', 'Cancelado')], default='procesando', help_text='Estado actual del problema', max_length=20),
+        ),
+    ]
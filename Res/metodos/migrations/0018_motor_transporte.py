@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-18 19:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('metodos', '0017_motor_geometrico'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='problemasimplex',
+            name='motor',
+            field=models.CharField(choices=[('tabla', 'Tabla Simplex'), ('revisado', 'Simplex revisado (factorización LU)'), ('punto_interior', 'Punto interior con crossover'), ('geometrico', 'Geométrico (dos variables)'), ('transporte', 'Transporte y asignación (Vogel + MODI, húngaro)'), ('automatico', 'Automático según el tamaño')], default='automatico', help_text='Motor de resolución: tabla completa, Simplex revisado, punto interior, geométrico, transporte o automático', max_length=20),
+        ),
+    ]
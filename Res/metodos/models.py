@@ -5,6 +5,8 @@ from django.core.validators import (
     MaxValueValidator,
 )  # Importación añadida
 
+from .campos import CampoPasos, CampoTabla
+
 
 class ProblemaSimplex(models.Model):
     TIPO_OPTIMIZACION = [
@@ -19,6 +21,29 @@ class ProblemaSimplex(models.Model):
         ("infactible", "Infactible"),
         ("error", "Error"),
         ("procesando", "Procesando"),
+        ("cancelado", "Cancelado"),
+    ]
+
+    MOTOR_CHOICES = [
+        ("tabla", "Tabla Simplex"),
+        ("revisado", "Simplex revisado (factorización LU)"),
+        ("punto_interior", "Punto interior con crossover"),
+        ("geometrico", "Geométrico (dos variables)"),
+        ("transporte", "Transporte y asignación (Vogel + MODI, húngaro)"),
+        ("automatico", "Automático según el tamaño"),
+    ]
+
+    REGLA_PIVOTEO_CHOICES = [
+        ("dantzig", "Dantzig (costo reducido más negativo)"),
+        ("parcial", "Pricing parcial"),
+        ("devex", "Devex"),
+        ("steepest_edge", "Máxima pendiente (steepest edge)"),
+    ]
+
+    ESCALADO_CHOICES = [
+        ("ninguno", "Sin escalado"),
+        ("geometrico", "Media geométrica"),
+        ("equilibrio", "Equilibrado"),
     ]
 
     usuario = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -60,11 +85,41 @@ class ProblemaSimplex(models.Model):
         help_text="Número máximo de iteraciones",
         validators=[MinValueValidator(10), MaxValueValidator(1000)],
     )
-    tabla_inicial = models.JSONField(
-        blank=True, null=True, help_text="Tabla inicial del simplex"
+    tiempo_limite = models.FloatField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(0.01)],
+        help_text="Tiempo máximo de resolución en segundos (vacío: el configurado)",
+    )
+    motor = models.CharField(
+        max_length=20,
+        choices=MOTOR_CHOICES,
+        default="automatico",
+        help_text="Motor de resolución: tabla completa, Simplex revisado, punto interior, geométrico, transporte o automático",
+    )
+    regla_pivoteo = models.CharField(
+        max_length=20,
+        choices=REGLA_PIVOTEO_CHOICES,
+        default="dantzig",
+        help_text="Regla para elegir la variable entrante (Bland se usa solo como respaldo anti-ciclado)",
+    )
+    escalado = models.CharField(
+        max_length=20,
+        choices=ESCALADO_CHOICES,
+        default="ninguno",
+        help_text="Escalado de filas y columnas antes de resolver",
+    )
+    variables_enteras = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="Variables que deben tomar valores enteros, ej: x1, x3",
+    )
+    tabla_inicial = CampoTabla(
+        blank=True, null=True, help_text="Tabla inicial del simplex (comprimida)"
     )
-    tabla_final = models.JSONField(
-        blank=True, null=True, help_text="Tabla final del simplex"
+    tabla_final = CampoTabla(
+        blank=True, null=True, help_text="Tabla final del simplex (comprimida)"
     )
     solucion = models.JSONField(
         blank=True, null=True, help_text="Solución encontrada con metadatos"
@@ -92,16 +147,32 @@ class ProblemaSimplex(models.Model):
     tiempo_resolucion = models.FloatField(
         blank=True, null=True, help_text="Tiempo de resolución en segundos"
     )
-    pasos = models.JSONField(
+    cancelacion_solicitada = models.BooleanField(
+        default=False,
+        help_text="Se pidió cancelar la resolución en curso desde la API",
+    )
+    pasos = CampoPasos(
         blank=True,
         null=True,
-        help_text="Todos los pasos intermedios del método Simplex",
+        help_text="Todos los pasos intermedios del método Simplex (comprimidos)",
     )
     explicacion_chatgpt = models.TextField(
         blank=True,
         null=True,
         help_text="Explicación generada automáticamente por ChatGPT del procedimiento simplex",
     )
+    problema_origen = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="clones",
+        help_text="Problema del que se clonó; su base óptima es la base inicial",
+    )
+    iteraciones_evitadas = models.IntegerField(
+        default=0,
+        help_text="Iteraciones ahorradas al partir de una base anterior (estimadas respecto a resolver desde cero)",
+    )
     creado = models.DateTimeField(auto_now_add=True)
     actualizado = models.DateTimeField(auto_now=True)
 
@@ -128,6 +199,34 @@ class ProblemaSimplex(models.Model):
         super().save(*args, **kwargs)
 
 
+class ResultadoSimplexCache(models.Model):
+    """Resultado de Simplex guardado por la forma canónica del problema."""
+
+    clave = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="Hash SHA-256 de la forma canónica del problema",
+    )
+    version_solver = models.CharField(
+        max_length=20,
+        db_index=True,
+        help_text="Versión del solver que produjo el resultado",
+    )
+    resultado = models.JSONField(help_text="Resultado completo del solver")
+    aciertos = models.PositiveIntegerField(
+        default=0, help_text="Veces que el resultado se sirvió desde la caché"
+    )
+    creado = models.DateTimeField(auto_now_add=True)
+    actualizado = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.clave[:12]} (v{self.version_solver})"
+
+    class Meta:
+        verbose_name = "Resultado Simplex en caché"
+        verbose_name_plural = "Resultados Simplex en caché"
+
+
 class FalsaPosicion(models.Model):
     usuario = models.ForeignKey(User, on_delete=models.CASCADE)
     funcion = models.CharField(
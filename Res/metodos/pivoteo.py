@@ -0,0 +1,256 @@
+import numpy as np
+from typing import Callable, Dict, Optional
+
+
+class ReglaPivoteo:
+    """
+    Estrategia de selección de la variable entrante (pricing).
+
+    Los costos reducidos se reciben con la convención de la fila objetivo de
+    la tabla Simplex: un valor negativo indica que la columna mejora el
+    objetivo. ``seleccionar`` devuelve -1 cuando la solución es óptima.
+    """
+
+    nombre = ""
+    # Indica si ``actualizar`` necesita la fila del pivote (alpha_r)
+    requiere_fila_pivote = False
+
+    def __init__(self, tolerancia: float = 1e-6):
+        self.tolerancia = tolerancia
+
+    def reiniciar(self, normas: np.ndarray):
+        """Se llama al inicio de cada fase con ||B^-1 a_j||^2 por columna."""
+
+    def seleccionar(
+        self, reducidos: np.ndarray, permitidas: Optional[np.ndarray] = None
+    ) -> int:
+        raise NotImplementedError
+
+    def actualizar(
+        self,
+        fila: np.ndarray,
+        columna: np.ndarray,
+        entrante: int,
+        saliente: int,
+        fila_pivote: int,
+        producto_columnas: Callable[[np.ndarray], np.ndarray],
+    ):
+        """
+        Actualiza el estado de la regla tras un pivote.
+
+        Args:
+            fila: Fila del pivote antes de pivotear (alpha_r, todas las columnas)
+            columna: Columna entrante en la base actual (alpha_q = B^-1 a_q)
+            entrante: Índice de la variable que entra
+            saliente: Índice de la variable que sale
+            fila_pivote: Posición del pivote dentro de ``columna``
+            producto_columnas: Calcula v^T B^-1 a_j para todas las columnas
+        """
+
+    def _candidatas(self, reducidos: np.ndarray, permitidas: Optional[np.ndarray]):
+        mejora = reducidos < -self.tolerancia
+        if permitidas is not None:
+            mejora &= permitidas
+        return np.flatnonzero(mejora)
+
+
+class ReglaBland(ReglaPivoteo):
+    """Primera columna con costo reducido negativo; evita el ciclado."""
+
+    nombre = "bland"
+
+    def seleccionar(self, reducidos, permitidas=None) -> int:
+        candidatas = self._candidatas(reducidos, permitidas)
+        return int(candidatas[0]) if candidatas.size else -1
+
+
+class ReglaDantzig(ReglaPivoteo):
+    """Costo reducido más negativo (regla clásica de Dantzig)."""
+
+    nombre = "dantzig"
+
+    def seleccionar(self, reducidos, permitidas=None) -> int:
+        candidatas = self._candidatas(reducidos, permitidas)
+        if not candidatas.size:
+            return -1
+        return int(candidatas[np.argmin(reducidos[candidatas])])
+
+
+class ReglaParcial(ReglaPivoteo):
+    """
+    Pricing parcial: recorre las columnas por segmentos de forma cíclica y
+    elige la mejor (Dantzig) del primer segmento que tenga candidatas.
+    """
+
+    nombre = "parcial"
+
+    def __init__(self, tolerancia: float = 1e-6, segmentos: int = 8):
+        super().__init__(tolerancia)
+        self.segmentos = segmentos
+        self.segmento_actual = 0
+
+    def reiniciar(self, normas: np.ndarray):
+        self.segmento_actual = 0
+
+    def seleccionar(self, reducidos, permitidas=None) -> int:
+        n = reducidos.size
+        tamano = max(-(-n // self.segmentos), 1)
+        num_segmentos = -(-n // tamano)
+        for k in range(num_segmentos):
+            s = (self.segmento_actual + k) % num_segmentos
+            inicio, fin = s * tamano, min((s + 1) * tamano, n)
+            segmento = reducidos[inicio:fin]
+            mejora = segmento < -self.tolerancia
+            if permitidas is not None:
+                mejora &= permitidas[inicio:fin]
+            if mejora.any():
+                self.segmento_actual = s
+                locales = np.flatnonzero(mejora)
+                return inicio + int(locales[np.argmin(segmento[locales])])
+        return -1
+
+
+class ReglaDevex(ReglaPivoteo):
+    """
+    Devex (Forrest-Goldfarb): aproxima los pesos de máxima pendiente respecto
+    a un marco de referencia que se reinicia cuando los pesos crecen demasiado.
+    """
+
+    nombre = "devex"
+    requiere_fila_pivote = True
+    PESO_MAXIMO = 1e6
+
+    def __init__(self, tolerancia: float = 1e-6):
+        super().__init__(tolerancia)
+        self.pesos = None
+
+    def reiniciar(self, normas: np.ndarray):
+        self.pesos = np.ones(normas.size)
+
+    def seleccionar(self, reducidos, permitidas=None) -> int:
+        candidatas = self._candidatas(reducidos, permitidas)
+        if not candidatas.size:
+            return -1
+        if self.pesos is None or self.pesos.size != reducidos.size:
+            self.pesos = np.ones(reducidos.size)
+        puntaje = reducidos[candidatas] ** 2 / self.pesos[candidatas]
+        return int(candidatas[np.argmax(puntaje)])
+
+    def actualizar(
+        self, fila, columna, entrante, saliente, fila_pivote, producto_columnas
+    ):
+        razon = fila / fila[entrante]
+        peso_entrante = self.pesos[entrante]
+        np.maximum(self.pesos, razon**2 * peso_entrante, out=self.pesos)
+        self.pesos[saliente] = max(peso_entrante / fila[entrante] ** 2, 1.0)
+        if self.pesos.max() > self.PESO_MAXIMO:
+            self.pesos[:] = 1.0
+
+
+class ReglaMaximaPendiente(ReglaPivoteo):
+    """
+    Máxima pendiente (steepest edge) con la recurrencia de Goldfarb-Reid
+    para gamma_j = 1 + ||B^-1 a_j||^2.
+    """
+
+    nombre = "steepest_edge"
+    requiere_fila_pivote = True
+
+    def __init__(self, tolerancia: float = 1e-6):
+        super().__init__(tolerancia)
+        self.pesos = None
+
+    def reiniciar(self, normas: np.ndarray):
+        self.pesos = 1.0 + normas
+
+    def seleccionar(self, reducidos, permitidas=None) -> int:
+        candidatas = self._candidatas(reducidos, permitidas)
+        if not candidatas.size:
+            return -1
+        puntaje = reducidos[candidatas] ** 2 / self.pesos[candidatas]
+        return int(candidatas[np.argmax(puntaje)])
+
+    def actualizar(
+        self, fila, columna, entrante, saliente, fila_pivote, producto_columnas
+    ):
+        pivote = fila[entrante]
+        razon = fila / pivote
+        # gamma_q se recalcula exacto con la columna entrante disponible
+        peso_entrante = 1.0 + columna @ columna
+        v = producto_columnas(columna)
+        nuevos = self.pesos - 2.0 * razon * v + razon**2 * peso_entrante
+        np.maximum(nuevos, 1.0 + razon**2, out=nuevos)
+        self.pesos = nuevos
+        self.pesos[saliente] = max(peso_entrante / pivote**2, 1.0)
+
+
+REGLAS_PIVOTEO: Dict[str, type] = {
+    ReglaDantzig.nombre: ReglaDantzig,
+    ReglaParcial.nombre: ReglaParcial,
+    ReglaDevex.nombre: ReglaDevex,
+    ReglaMaximaPendiente.nombre: ReglaMaximaPendiente,
+    ReglaBland.nombre: ReglaBland,
+}
+
+
+def crear_regla(nombre: str, tolerancia: float = 1e-6) -> ReglaPivoteo:
+    """Instancia la regla de pivoteo indicada por nombre."""
+    if nombre not in REGLAS_PIVOTEO:
+        raise ValueError(f"Regla de pivoteo desconocida: {nombre}")
+    return REGLAS_PIVOTEO[nombre](tolerancia=tolerancia)
+
+
+PRUEBAS_RAZON = ("harris", "estandar")
+
+
+def razon_minima(
+    rhs: np.ndarray,
+    columna: np.ndarray,
+    tolerancia: float,
+    basicas: Optional[np.ndarray] = None,
+) -> int:
+    """
+    Prueba de la razón mínima vectorizada.
+
+    Los empates (dentro de la tolerancia) se resuelven por el menor índice de
+    variable básica si se proporciona ``basicas`` (regla de Bland), o por la
+    menor fila en caso contrario. Devuelve -1 si la columna no está acotada.
+    """
+    positivos = np.flatnonzero(columna > tolerancia)
+    if positivos.size == 0:
+        return -1
+    razones = np.maximum(rhs[positivos], 0.0) / columna[positivos]
+    empatadas = positivos[razones <= razones.min() + tolerancia]
+    if basicas is not None:
+        return int(empatadas[np.argmin(np.asarray(basicas)[empatadas])])
+    return int(empatadas[0])
+
+
+def razon_harris(
+    rhs: np.ndarray,
+    columna: np.ndarray,
+    tolerancia: float,
+    tolerancia_factibilidad: Optional[float] = None,
+) -> int:
+    """
+    Prueba de razón de Harris en dos pasadas.
+
+    La primera pasada calcula el paso máximo permitiendo una violación de
+    ``tolerancia_factibilidad`` en las variables básicas; la segunda elige,
+    entre las filas cuya razón no supera ese paso, la de mayor elemento
+    pivote. Así los casi-empates se deciden por estabilidad numérica.
+    """
+    if tolerancia_factibilidad is None:
+        tolerancia_factibilidad = tolerancia
+    positivos = np.flatnonzero(columna > tolerancia)
+    if positivos.size == 0:
+        return -1
+    alpha = columna[positivos]
+    valores = np.maximum(rhs[positivos], 0.0)
+
+    # Pasada 1: paso máximo con holgura de factibilidad
+    paso_maximo = ((valores + tolerancia_factibilidad) / alpha).min()
+
+    # Pasada 2: entre las filas admisibles, el mayor pivote
+    admisibles = valores / alpha <= paso_maximo
+    return int(positivos[admisibles][np.argmax(alpha[admisibles])])
@@ -0,0 +1,409 @@
+import numpy as np
+from typing import List, Tuple, Dict
+
+
+class Presolucion:
+    """
+    Reduce un problema lineal antes de construir la tabla Simplex.
+
+    Reducciones aplicadas hasta que no haya cambios: filas vacías, filas con
+    una sola variable (pasan a cotas), variables fijas, columnas vacías,
+    restricciones duplicadas o proporcionales, restricciones redundantes por
+    actividad y ajuste de cotas implícitas. Las cotas inferiores se eliminan
+    desplazando la variable; las superiores que no estén implicadas por otras
+    filas vuelven al modelo como restricciones ``x_j <= u_j``.
+    """
+
+    def __init__(self, tolerancia: float = 1e-9, max_pasadas: int = 10):
+        self.tolerancia = tolerancia
+        self.max_pasadas = max_pasadas
+
+    def reducir(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """Devuelve el problema reducido (c, A, b, desigualdades)."""
+        self.c = np.asarray(c, dtype=np.float64)
+        self.c_max = self.c if tipo_optimizacion == "maximizar" else -self.c
+        self.A = np.array(A, dtype=np.float64, copy=True)
+        self.b = np.array(b, dtype=np.float64, copy=True)
+        self.sentidos = list(desigualdades)
+        num_restr, num_vars = self.A.shape
+
+        self.filas = np.ones(num_restr, dtype=bool)
+        self.columnas = np.ones(num_vars, dtype=bool)
+        self.inferior = np.zeros(num_vars)
+        self.superior = np.full(num_vars, np.inf)
+        self.fijas: Dict[int, float] = {}
+        self.no_acotado = False
+        self.reducciones: List[str] = []
+
+        for _ in range(self.max_pasadas):
+            antes = (self.filas.sum(), self.columnas.sum(), len(self.reducciones))
+            self._filas_vacias()
+            self._filas_unitarias()
+            self._fijar_variables()
+            self._columnas_vacias()
+            self._filas_duplicadas()
+            self._filas_redundantes()
+            self._ajustar_cotas()
+            self._fijar_variables()
+            if (self.filas.sum(), self.columnas.sum(), len(self.reducciones)) == antes:
+                break
+
+        self.sin_cambios = not self.reducciones
+        if self.sin_cambios:
+            return c, A, b, desigualdades
+        return self._problema_reducido()
+
+    def postresolver(self, resultado: Dict) -> Dict:
+        """
+        Traduce la solución del problema reducido a las variables originales.
+        Los pasos y la tabla final siguen siendo los del problema reducido:
+        ``presolve["tablas_reducidas"]`` lo indica.
+        """
+        if self.no_acotado:
+            raise ValueError("El problema es no acotado")
+
+        solucion = np.zeros(self.A.shape[1])
+        for j, valor in self.fijas.items():
+            solucion[j] = valor
+        columnas = np.flatnonzero(self.columnas)
+        solucion[columnas] = (
+            np.asarray(resultado["solucion"], dtype=np.float64)[: columnas.size]
+            + self.inferior[columnas]
+        )
+
+        resultado["solucion"] = solucion.tolist()
+        resultado["valor_optimo"] = float(
+            resultado["valor_optimo"] + self.desplazamiento
+        )
+        resultado["presolve"] = self.resumen()
+        resultado["presolve"]["tablas_reducidas"] = bool(
+            resultado.get("pasos") or resultado.get("tabla_final") is not None
+        )
+        return resultado
+
+    def resolver_trivial(self, tipo_optimizacion: str) -> Dict:
+        """Resuelve el caso en que la reducción elimina todas las filas o columnas."""
+        if self.columnas.any():
+            # Sin restricciones: cualquier costo que mejore hace al problema no acotado
+            if (self.c_max[self.columnas] > self.tolerancia).any():
+                raise ValueError("El problema es no acotado")
+        resultado = {
+            "solucion": [0.0] * int(self.columnas.sum()),
+            "valor_optimo": 0.0,
+            "iteraciones": 0,
+            "pasos": [],
+            "tabla_final": None,
+            "variables_basicas": [],
+        }
+        return self.postresolver(resultado)
+
+    def resumen(self) -> Dict:
+        return {
+            "filas_eliminadas": int(self.A.shape[0] - self.filas.sum()),
+            "columnas_eliminadas": int(self.A.shape[1] - self.columnas.sum()),
+            "cotas_superiores": int(np.isfinite(self.superior[self.columnas]).sum()),
+            "reducciones": self.reducciones,
+        }
+
+    @property
+    def es_trivial(self) -> bool:
+        return not self.sin_cambios and (
+            not self.filas_reducidas or not self.columnas.any()
+        )
+
+    # ------------------------------------------------------------------
+    # Reducciones
+    # ------------------------------------------------------------------
+
+    def _submatriz(self) -> Tuple[np.ndarray, np.ndarray]:
+        filas = np.flatnonzero(self.filas)
+        return filas, self.A[np.ix_(filas, np.flatnonzero(self.columnas))]
+
+    def _verificar(self, valor: float, sentido: str, rhs: float, i: int):
+        tol = self.tolerancia
+        if (
+            (sentido == "<=" and valor > rhs + tol)
+            or (sentido == ">=" and valor < rhs - tol)
+            or (sentido == "=" and abs(valor - rhs) > tol)
+        ):
+            raise ValueError(
+                f"El problema no tiene solución factible (restricción {i + 1})"
+            )
+
+    def _filas_vacias(self):
+        filas, sub = self._submatriz()
+        vacias = filas[~(np.abs(sub) > self.tolerancia).any(axis=1)]
+        for i in vacias:
+            self._verificar(0.0, self.sentidos[i], self.b[i], i)
+            self.filas[i] = False
+            self.reducciones.append(f"Fila {i + 1} vacía eliminada")
+
+    def _filas_unitarias(self):
+        columnas = np.flatnonzero(self.columnas)
+        for i in np.flatnonzero(self.filas):
+            fila = self.A[i, columnas]
+            no_nulos = np.flatnonzero(np.abs(fila) > self.tolerancia)
+            if no_nulos.size != 1:
+                continue
+            j = columnas[no_nulos[0]]
+            a = self.A[i, j]
+            cota = self.b[i] / a
+            sentido = self.sentidos[i]
+            if a < 0 and sentido != "=":
+                sentido = "<=" if sentido == ">=" else ">="
+
+            if sentido in ["<=", "="]:
+                self.superior[j] = min(self.superior[j], cota)
+            if sentido in [">=", "="]:
+                self.inferior[j] = max(self.inferior[j], cota)
+            if self.inferior[j] > self.superior[j] + self.tolerancia:
+                raise ValueError(
+                    f"El problema no tiene solución factible (cotas de x{j + 1})"
+                )
+            self.filas[i] = False
+            self.reducciones.append(f"Fila {i + 1} convertida en cota de x{j + 1}")
+
+    def _fijar(self, j: int, valor: float, motivo: str):
+        filas = np.flatnonzero(self.filas)
+        self.b[filas] -= self.A[filas, j] * valor
+        self.fijas[j] = valor
+        self.columnas[j] = False
+        self.reducciones.append(f"x{j + 1} = {valor:g} ({motivo})")
+
+    def _fijar_variables(self):
+        for j in np.flatnonzero(self.columnas):
+            if self.superior[j] - self.inferior[j] <= self.tolerancia:
+                self._fijar(j, self.inferior[j], "variable fija")
+
+    def _columnas_vacias(self):
+        filas = np.flatnonzero(self.filas)
+        for j in np.flatnonzero(self.columnas):
+            if (np.abs(self.A[filas, j]) > self.tolerancia).any():
+                continue
+            if self.c_max[j] > self.tolerancia:
+                if np.isinf(self.superior[j]):
+                    # Se confirma como no acotado solo si el resto es factible
+                    self.no_acotado = True
+                    self._fijar(j, self.inferior[j], "columna vacía no acotada")
+                else:
+                    self._fijar(j, self.superior[j], "columna vacía")
+            else:
+                self._fijar(j, self.inferior[j], "columna vacía")
+
+    def _filas_duplicadas(self):
+        filas, sub = self._submatriz()
+        if filas.size < 2:
+            return
+        grupos: Dict[tuple, List[Tuple[int, float]]] = {}
+        for k, i in enumerate(filas):
+            fila = sub[k]
+            no_nulos = np.flatnonzero(np.abs(fila) > self.tolerancia)
+            if no_nulos.size == 0:
+                continue
+            escala = np.abs(fila).max() * np.sign(fila[no_nulos[0]])
+            clave = tuple(np.round(fila / escala, 9))
+            grupos.setdefault(clave, []).append((i, escala))
+
+        for miembros in grupos.values():
+            if len(miembros) < 2:
+                continue
+            menor, mayor = -np.inf, np.inf
+            for i, escala in miembros:
+                rhs = self.b[i] / escala
+                sentido = self.sentidos[i]
+                if escala < 0 and sentido != "=":
+                    sentido = "<=" if sentido == ">=" else ">="
+                if sentido in ["<=", "="]:
+                    mayor = min(mayor, rhs)
+                if sentido in [">=", "="]:
+                    menor = max(menor, rhs)
+            if menor > mayor + self.tolerancia:
+                raise ValueError(
+                    "El problema no tiene solución factible (restricciones paralelas incompatibles)"
+                )
+
+            # Normalizar la primera fila y reutilizar la segunda si hace falta
+            i0, escala0 = miembros[0]
+            i1, escala1 = miembros[1]
+            self.A[i0] /= escala0
+            if abs(mayor - menor) <= self.tolerancia:
+                self.b[i0], self.sentidos[i0] = mayor, "="
+                usadas = [i0]
+            elif np.isinf(menor):
+                self.b[i0], self.sentidos[i0] = mayor, "<="
+                usadas = [i0]
+            elif np.isinf(mayor):
+                self.b[i0], self.sentidos[i0] = menor, ">="
+                usadas = [i0]
+            else:
+                self.A[i1] /= escala1
+                self.b[i0], self.sentidos[i0] = mayor, "<="
+                self.b[i1], self.sentidos[i1] = menor, ">="
+                usadas = [i0, i1]
+
+            for i, _ in miembros:
+                if i not in usadas:
+                    self.filas[i] = False
+                    self.reducciones.append(f"Fila {i + 1} duplicada eliminada")
+
+    def _actividades(self, filas: np.ndarray, columnas: np.ndarray):
+        """Actividad mínima y máxima de cada fila según las cotas explícitas."""
+        sub = self.A[np.ix_(filas, columnas)]
+        inf, sup = self.inferior[columnas], self.superior[columnas]
+        with np.errstate(invalid="ignore"):
+            por_inf = sub * inf
+            por_sup = np.where(sub != 0, sub * sup, 0.0)
+        return (
+            np.minimum(por_inf, por_sup).sum(axis=1),
+            np.maximum(por_inf, por_sup).sum(axis=1),
+            sub,
+        )
+
+    def _filas_redundantes(self):
+        filas = np.flatnonzero(self.filas)
+        columnas = np.flatnonzero(self.columnas)
+        if filas.size == 0 or columnas.size == 0:
+            return
+        minima, maxima, _ = self._actividades(filas, columnas)
+        tol = self.tolerancia
+        for k, i in enumerate(filas):
+            sentido, rhs = self.sentidos[i], self.b[i]
+            if (sentido in ["<=", "="] and minima[k] > rhs + tol) or (
+                sentido in [">=", "="] and maxima[k] < rhs - tol
+            ):
+                raise ValueError(
+                    f"El problema no tiene solución factible (restricción {i + 1})"
+                )
+            if (sentido == "<=" and maxima[k] <= rhs + tol) or (
+                sentido == ">=" and minima[k] >= rhs - tol
+            ):
+                self.filas[i] = False
+                self.reducciones.append(f"Fila {i + 1} redundante eliminada")
+
+    def _aportes(self, sub: np.ndarray, inferior, superior):
+        """
+        Aporte de cada elemento a la actividad mínima y máxima de su fila.
+        Las cotas inferiores son finitas; las superiores pueden ser infinitas.
+        """
+        with np.errstate(invalid="ignore"):
+            minimo = np.where(
+                sub > 0, sub * inferior, np.where(sub < 0, sub * superior, 0.0)
+            )
+            maximo = np.where(
+                sub > 0, sub * superior, np.where(sub < 0, sub * inferior, 0.0)
+            )
+        return minimo, maximo
+
+    @staticmethod
+    def _acumular(
+        aporte: np.ndarray, suma: np.ndarray, infinitos: np.ndarray, signo: int
+    ):
+        """Suma (o resta) a cada fila la parte finita y la cuenta de infinitos."""
+        es_infinito = np.isinf(aporte)
+        suma += signo * np.where(es_infinito, 0.0, aporte).sum(axis=1)
+        infinitos += signo * es_infinito.sum(axis=1)
+
+    def _ajustar_cotas(self):
+        """
+        Calcula la cota superior implícita de cada variable a partir de las filas.
+
+        Si la cota explícita queda implicada se descarta (no hará falta como
+        restricción) y si la cota implícita coincide con la inferior la
+        variable se fija. Se procesa una variable a la vez para no usar una
+        cota para justificarse a sí misma: las actividades de las filas se
+        calculan una vez por pasada (parte finita y número de aportes
+        infinitos) y se actualizan con la columna cuya cota cambia.
+        """
+        filas = np.flatnonzero(self.filas)
+        if filas.size == 0:
+            return
+        columnas = np.flatnonzero(self.columnas)
+        sub = self.A[np.ix_(filas, columnas)]
+        rhs = self.b[filas]
+        menor_igual = np.array([self.sentidos[i] in ["<=", "="] for i in filas])
+        mayor_igual = np.array([self.sentidos[i] in [">=", "="] for i in filas])
+
+        suma_min, suma_max = np.zeros(filas.size), np.zeros(filas.size)
+        infinitos_min = np.zeros(filas.size, dtype=np.int64)
+        infinitos_max = np.zeros(filas.size, dtype=np.int64)
+        minimo, maximo = self._aportes(
+            sub, self.inferior[columnas], self.superior[columnas]
+        )
+        self._acumular(minimo, suma_min, infinitos_min, 1)
+        self._acumular(maximo, suma_max, infinitos_max, 1)
+
+        tol = self.tolerancia
+        for k, j in enumerate(columnas):
+            a = sub[:, k]
+            inf_j, sup_j = self.inferior[j], self.superior[j]
+            # En las filas que acotan a x_j su propio aporte usa la cota
+            # inferior (finita): el resto es finito si la fila no tiene
+            # aportes infinitos
+            por_min = (a > tol) & menor_igual & (infinitos_min == 0)
+            por_max = (a < -tol) & mayor_igual & (infinitos_max == 0)
+            limites = np.concatenate(
+                [
+                    (rhs[por_min] - (suma_min[por_min] - a[por_min] * inf_j))
+                    / a[por_min],
+                    (rhs[por_max] - (suma_max[por_max] - a[por_max] * inf_j))
+                    / a[por_max],
+                ]
+            )
+            implicita = limites.min() if limites.size else np.inf
+
+            if implicita <= inf_j + tol:
+                self.superior[j] = inf_j
+                self.reducciones.append(f"Cota implícita fija x{j + 1} en {inf_j:g}")
+            elif np.isfinite(sup_j) and implicita <= sup_j + tol:
+                self.superior[j] = np.inf
+                self.reducciones.append(
+                    f"Cota superior de x{j + 1} implicada por las filas"
+                )
+            else:
+                continue
+
+            anterior = self._aportes(sub[:, k : k + 1], inf_j, sup_j)
+            nuevo = self._aportes(sub[:, k : k + 1], inf_j, self.superior[j])
+            self._acumular(anterior[0], suma_min, infinitos_min, -1)
+            self._acumular(anterior[1], suma_max, infinitos_max, -1)
+            self._acumular(nuevo[0], suma_min, infinitos_min, 1)
+            self._acumular(nuevo[1], suma_max, infinitos_max, 1)
+
+    # ------------------------------------------------------------------
+    # Problema reducido
+    # ------------------------------------------------------------------
+
+    def _problema_reducido(self):
+        filas = np.flatnonzero(self.filas)
+        columnas = np.flatnonzero(self.columnas)
+        self.filas_reducidas = filas.size
+
+        inferior = self.inferior[columnas]
+        A = self.A[np.ix_(filas, columnas)]
+        b = self.b[filas] - A @ inferior
+        desigualdades = [self.sentidos[i] for i in filas]
+
+        # Cotas superiores que siguen siendo necesarias
+        acotadas = np.flatnonzero(np.isfinite(self.superior[columnas]))
+        if acotadas.size:
+            filas_cota = np.zeros((acotadas.size, columnas.size))
+            filas_cota[np.arange(acotadas.size), acotadas] = 1.0
+            A = np.vstack([A, filas_cota])
+            b = np.concatenate(
+                [b, self.superior[columnas[acotadas]] - inferior[acotadas]]
+            )
+            desigualdades += ["<="] * acotadas.size
+            self.filas_reducidas += acotadas.size
+
+        self.desplazamiento = float(
+            self.c[columnas] @ inferior
+            + sum(self.c[j] * valor for j, valor in self.fijas.items())
+        )
+        return self.c[columnas], A, b, desigualdades
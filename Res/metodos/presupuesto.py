@@ -0,0 +1,61 @@
+import time
+from typing import Optional
+
+# Motivos de interrupción de una resolución
+MOTIVOS_INTERRUPCION = {
+    "tiempo": "Tiempo límite de resolución alcanzado",
+    "cancelado": "Resolución cancelada",
+}
+
+
+def tiempo_limite_por_defecto() -> Optional[float]:
+    try:
+        from django.conf import settings
+
+        return getattr(settings, "SIMPLEX_TIEMPO_LIMITE", None)
+    except Exception:
+        return None
+
+
+class Presupuesto:
+    """
+    Tiempo límite (segundos de reloj) y token de cancelación de una
+    resolución. ``cancelacion`` es cualquier objeto con un atributo
+    ``cancelado``; los bucles de pivoteo llaman a ``agotado()`` en cada
+    iteración y se detienen cuando devuelve True.
+    """
+
+    def __init__(self, tiempo_limite: Optional[float] = None, cancelacion=None):
+        self.tiempo_limite = tiempo_limite
+        self.cancelacion = cancelacion
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.inicio = time.perf_counter()
+        self.motivo = None
+
+    def transcurrido(self) -> float:
+        return time.perf_counter() - self.inicio
+
+    def agotado(self) -> bool:
+        if self.motivo is None:
+            if self.cancelacion is not None and self.cancelacion.cancelado:
+                self.motivo = "cancelado"
+            elif (
+                self.tiempo_limite is not None
+                and self.transcurrido() >= self.tiempo_limite
+            ):
+                self.motivo = "tiempo"
+        return self.motivo is not None
+
+    def advertencia(self) -> str:
+        return (
+            f"{MOTIVOS_INTERRUPCION[self.motivo]} tras {self.transcurrido():.2f} s. "
+            "Se devuelve la mejor base encontrada, que puede no ser óptima."
+        )
+
+    def error_sin_base(self) -> str:
+        return (
+            f"{MOTIVOS_INTERRUPCION[self.motivo]} antes de encontrar una base "
+            "válida (Fase I sin terminar)."
+        )
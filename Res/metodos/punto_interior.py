@@ -0,0 +1,276 @@
+import numpy as np
+from typing import Dict, List
+
+from .dualizacion import Dualizacion
+
+# Tamaño de los bloques de las sustituciones triangulares
+TAMANO_BLOQUE = 64
+
+# Fracción del paso hasta la frontera que se avanza en cada iteración
+FRACCION_PASO = 0.99
+
+# Normas a partir de las cuales se considera que el método diverge
+# (problema infactible o no acotado)
+NORMA_DIVERGENCIA = 1e12
+
+
+def _sustitucion(L: np.ndarray, v: np.ndarray, transpuesta: bool = False) -> np.ndarray:
+    """
+    Resuelve L x = v (o L^T x = v) por bloques: cada bloque diagonal se
+    resuelve con un sistema pequeño y el resto se actualiza con un producto
+    matriz-vector, de modo que solo hay m / TAMANO_BLOQUE pasos en Python.
+    """
+    m = len(v)
+    x = v.astype(np.float64, copy=True)
+    if not transpuesta:
+        for inicio in range(0, m, TAMANO_BLOQUE):
+            fin = min(inicio + TAMANO_BLOQUE, m)
+            x[inicio:fin] = np.linalg.solve(L[inicio:fin, inicio:fin], x[inicio:fin])
+            x[fin:] -= L[fin:, inicio:fin] @ x[inicio:fin]
+    else:
+        for fin in range(m, 0, -TAMANO_BLOQUE):
+            inicio = max(fin - TAMANO_BLOQUE, 0)
+            x[inicio:fin] = np.linalg.solve(L[inicio:fin, inicio:fin].T, x[inicio:fin])
+            x[:inicio] -= L[inicio:fin, :inicio].T @ x[inicio:fin]
+    return x
+
+
+class PuntoInterior:
+    """
+    Método de punto interior primal-dual predictor-corrector de Mehrotra.
+
+    Trabaja sobre la forma estándar min -c^T x, [A | E] (x, w) = b,
+    x, w >= 0, donde E tiene una columna +1 (holgura) o -1 (exceso) por cada
+    desigualdad, en el mismo orden que las holguras de la tabla Simplex. Cada
+    iteración factoriza las ecuaciones normales A D A^T con Cholesky; como
+    las columnas de E son unitarias, su aporte es solo la diagonal.
+
+    Si hay más filas que variables más igualdades, se resuelve el dual, cuyas
+    ecuaciones normales son n x n en lugar de m x m, y el punto del primal
+    se lee de sus precios duales y costos reducidos.
+    """
+
+    def __init__(self, tolerancia: float = 1e-8, max_iter: int = 100, presupuesto=None):
+        self.tolerancia = tolerancia
+        self.max_iter = max_iter
+        # Presupuesto de tiempo/cancelación de SimplexSolver (opcional): al
+        # agotarse se devuelve el punto actual sin convergencia
+        self.presupuesto = presupuesto
+
+    def resolver(
+        self, c: np.ndarray, A: np.ndarray, b: np.ndarray, desigualdades: List[str]
+    ) -> Dict:
+        """
+        Maximiza c^T x sujeto a las restricciones dadas.
+
+        Returns:
+            dict: ``x`` y ``z`` (primal y costos reducidos de la forma
+            estándar, variables originales seguidas de las holguras), ``y``
+            (precios duales), ``iteraciones``, ``convergio`` y ``brecha``.
+        """
+        m, n = A.shape
+        self.A = A
+        self.n = n
+        self.filas_holgura = np.array(
+            [i for i, d in enumerate(desigualdades) if d != "="], dtype=int
+        )
+        self.signos = np.array(
+            [1.0 if d == "<=" else -1.0 for d in desigualdades if d != "="]
+        )
+        self.filas_igualdad = np.array(
+            [i for i, d in enumerate(desigualdades) if d == "="], dtype=int
+        )
+        if n + len(self.filas_igualdad) < m:
+            return self._resolver_dual(c, b, desigualdades)
+
+        costo = np.concatenate(
+            [-np.asarray(c, dtype=np.float64), np.zeros(len(self.signos))]
+        )
+        x, y, z = self._punto_inicial(costo, b)
+
+        norma_b = 1.0 + np.linalg.norm(b)
+        norma_c = 1.0 + np.linalg.norm(costo)
+        convergio = False
+        iteracion = 0
+        for iteracion in range(1, self.max_iter + 1):
+            r_primal = b - self._A_por(x)
+            r_dual = costo - self._At_por(y) - z
+            brecha = x @ z
+            if (
+                np.linalg.norm(r_primal) / norma_b <= self.tolerancia
+                and np.linalg.norm(r_dual) / norma_c <= self.tolerancia
+                and abs(brecha) / (1.0 + abs(costo @ x)) <= self.tolerancia
+            ):
+                convergio = True
+                iteracion -= 1
+                break
+            if max(np.abs(x).max(), np.abs(y).max(initial=0.0)) > NORMA_DIVERGENCIA:
+                break
+            if self.presupuesto is not None and self.presupuesto.agotado():
+                break
+
+            mu = brecha / len(x)
+            d = x / z
+            L = self._cholesky(self._normal(d))
+
+            def direccion(r_xz):
+                # Z dx + X dz = r_xz, A dx = r_primal, A^T dy + dz = r_dual
+                derecha = r_primal - self._A_por(r_xz / z - d * r_dual)
+                dy = _sustitucion(L, _sustitucion(L, derecha), transpuesta=True)
+                dz = r_dual - self._At_por(dy)
+                dx = (r_xz - x * dz) / z
+                return dx, dy, dz
+
+            # Predictor (afín)
+            dx, dy, dz = direccion(-x * z)
+            paso_p = min(1.0, self._paso_maximo(x, dx))
+            paso_d = min(1.0, self._paso_maximo(z, dz))
+            mu_afin = (x + paso_p * dx) @ (z + paso_d * dz) / len(x)
+            sigma = (mu_afin / mu) ** 3
+
+            # Corrector con centrado
+            dx, dy, dz = direccion(-x * z - dx * dz + sigma * mu)
+            paso_p = min(1.0, FRACCION_PASO * self._paso_maximo(x, dx))
+            paso_d = min(1.0, FRACCION_PASO * self._paso_maximo(z, dz))
+            x = x + paso_p * dx
+            y = y + paso_d * dy
+            z = z + paso_d * dz
+
+        return {
+            "x": x,
+            "y": y,
+            "z": z,
+            "iteraciones": iteracion,
+            "convergio": convergio,
+            "brecha": float(x @ z),
+            "valor": float(-(costo @ x)),
+        }
+
+    def _resolver_dual(
+        self, c: np.ndarray, b: np.ndarray, desigualdades: List[str]
+    ) -> Dict:
+        """
+        Resuelve ``min b'u, A'u >= c`` (ver ``Dualizacion``): sus precios
+        duales son x, sus costos reducidos las holguras del primal y sus
+        variables u los costos reducidos de esas holguras.
+        """
+        c_dual, A_dual, b_dual, desigualdades_dual = Dualizacion().dualizar(
+            c, self.A, b, desigualdades, "maximizar"
+        )
+        dual = PuntoInterior(self.tolerancia, self.max_iter, self.presupuesto).resolver(
+            -c_dual, A_dual, b_dual, desigualdades_dual
+        )
+        # Variables del dual: u (una por fila con holgura), v⁺ y v⁻ (una por
+        # igualdad) y los excesos de sus filas, uno por variable del primal
+        holguras = len(self.filas_holgura)
+        igualdades = len(self.filas_igualdad)
+        u = dual["x"][:holguras]
+        v = dual["x"][holguras : holguras + igualdades]
+        v -= dual["x"][holguras + igualdades : holguras + 2 * igualdades]
+        excesos = dual["x"][len(c_dual) :]
+
+        y = np.zeros(len(b))
+        y[self.filas_holgura] = -self.signos * u
+        y[self.filas_igualdad] = -v
+        return {
+            "x": np.concatenate([dual["y"], dual["z"][:holguras]]),
+            "y": y,
+            "z": np.concatenate([excesos, u]),
+            "iteraciones": dual["iteraciones"],
+            "convergio": dual["convergio"],
+            "brecha": dual["brecha"],
+            "valor": -dual["valor"],
+        }
+
+    def _A_por(self, v: np.ndarray) -> np.ndarray:
+        resultado = self.A @ v[: self.n]
+        resultado[self.filas_holgura] += self.signos * v[self.n :]
+        return resultado
+
+    def _At_por(self, y: np.ndarray) -> np.ndarray:
+        return np.concatenate([self.A.T @ y, self.signos * y[self.filas_holgura]])
+
+    def _normal(self, d: np.ndarray) -> np.ndarray:
+        """A D A^T: la parte de las holguras solo suma a la diagonal."""
+        M = (self.A * d[: self.n]) @ self.A.T
+        M[self.filas_holgura, self.filas_holgura] += d[self.n :]
+        return M
+
+    def _cholesky(self, M: np.ndarray) -> np.ndarray:
+        # Filas dependientes o variables casi nulas vuelven M singular: se
+        # regulariza la diagonal hasta que la factorización sea posible
+        regularizacion = 0.0
+        escala = max(np.abs(np.diag(M)).max(initial=0.0), 1.0)
+        while True:
+            try:
+                if regularizacion:
+                    M = M + regularizacion * np.eye(len(M))
+                return np.linalg.cholesky(M)
+            except np.linalg.LinAlgError:
+                regularizacion = max(regularizacion * 100, escala * 1e-14)
+                if regularizacion > escala:
+                    raise
+
+    def _punto_inicial(self, costo: np.ndarray, b: np.ndarray):
+        """Punto inicial de Mehrotra: mínimos cuadrados desplazados al interior."""
+        L = self._cholesky(self._normal(np.ones(len(costo))))
+
+        def resolver(v):
+            return _sustitucion(L, _sustitucion(L, v), transpuesta=True)
+
+        x = self._At_por(resolver(b))
+        y = resolver(self._A_por(costo))
+        z = costo - self._At_por(y)
+
+        x = x + max(-1.5 * x.min(), 0.0)
+        z = z + max(-1.5 * z.min(), 0.0)
+        producto = x @ z
+        x = x + 0.5 * producto / z.sum()
+        z = z + 0.5 * producto / x.sum()
+        # Evita ceros exactos cuando x y z ya eran positivos y ortogonales
+        return np.maximum(x, 1e-8), y, np.maximum(z, 1e-8)
+
+    @staticmethod
+    def _paso_maximo(v: np.ndarray, dv: np.ndarray) -> float:
+        negativos = dv < 0
+        if not negativos.any():
+            return np.inf
+        return float(np.min(-v[negativos] / dv[negativos]))
+
+
+def identificar_base(
+    x: np.ndarray, z: np.ndarray, desigualdades: List[str], num_vars: int
+) -> List[int]:
+    """
+    Elige una base de la tabla Simplex (una columna por restricción) a partir
+    del punto interior: son básicas las columnas con x_j > z_j. Si faltan
+    columnas (vértice degenerado) se completan con las holguras de las
+    restricciones activas que estén más cerca de ser básicas y, en último
+    caso, con las artificiales de las igualdades, que quedan en nivel cero.
+
+    Las columnas siguen la numeración de ``_inicializar_tabla``: variables,
+    holguras/excesos y artificiales.
+    """
+    num_holguras = sum(1 for d in desigualdades if d != "=")
+    indicador = x / (x + z)
+
+    candidatas = [j for j in range(len(x)) if x[j] > z[j]]
+    relleno = []
+    holgura = num_vars
+    artificial = num_vars + num_holguras
+    for d in desigualdades:
+        if d != "=":
+            if x[holgura] <= z[holgura]:
+                relleno.append((indicador[holgura], holgura))
+            holgura += 1
+        if d != "<=":
+            if d == "=":
+                relleno.append((-1.0, artificial))
+            artificial += 1
+
+    m = len(desigualdades)
+    candidatas.sort(key=lambda j: -indicador[j])
+    base = candidatas[:m]
+    relleno.sort(key=lambda par: -par[0])
+    base += [j for _, j in relleno[: m - len(base)]]
+    return base
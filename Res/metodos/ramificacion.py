@@ -0,0 +1,257 @@
+import heapq
+import itertools
+import math
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .simplex_dual import agregar_restriccion, simplex_dual
+
+# Límite de nodos evaluados (incluida la raíz) por problema
+MAX_NODOS = 1000
+
+# Distancia al entero más cercano por debajo de la cual un valor es entero
+TOLERANCIA_ENTERA = 1e-6
+
+
+def trabajadores_ramificacion() -> int:
+    try:
+        from django.conf import settings
+
+        configurado = getattr(settings, "SIMPLEX_RAMIFICACION_TRABAJADORES", None)
+    except Exception:
+        configurado = None
+    return configurado or 1
+
+
+def evaluar_hijo(
+    tabla: np.ndarray,
+    variables_basicas: List[int],
+    permitidas: np.ndarray,
+    variable: int,
+    sentido: str,
+    cota: float,
+    tolerancia: float,
+    max_iter: int,
+):
+    """
+    Evalúa un nodo hijo: agrega la cota ``x_variable (<= | >=) cota`` a la
+    tabla óptima del padre y reoptimiza con el Simplex dual desde su base.
+    Se ejecuta en un proceso del pool, por lo que recibe y devuelve solo
+    tipos serializables.
+
+    Devuelve (tabla, variables_basicas, permitidas, pivotes), o None si el
+    nodo es infactible.
+    """
+    variables_basicas = list(variables_basicas)
+    coeficientes = np.zeros(variable + 1)
+    coeficientes[variable] = 1.0
+    tabla = agregar_restriccion(tabla, variables_basicas, coeficientes, sentido, cota)
+    # La holgura de la cota nueva puede entrar a la base
+    permitidas = np.append(permitidas, True)
+    try:
+        pivotes = simplex_dual(
+            tabla, variables_basicas, tolerancia, max_iter, permitidas
+        )
+    except ValueError:
+        return None
+    return tabla, variables_basicas, permitidas, pivotes
+
+
+class RamificacionAcotamiento:
+    """
+    Ramificación y acotamiento para problemas con variables enteras.
+
+    La relajación de la raíz se resuelve con el motor configurado en el
+    SimplexSolver; cada hijo parte de la tabla óptima de su padre con una
+    fila de cota más y se reoptimiza con el Simplex dual, de modo que
+    suele bastar con pocos pivotes. Los nodos se exploran por mejor cota
+    primero y, con varios trabajadores, se evalúan en paralelo.
+    """
+
+    def __init__(
+        self,
+        solver,
+        enteras: List[bool],
+        max_nodos: int = MAX_NODOS,
+        trabajadores: Optional[int] = None,
+    ):
+        self.solver = solver
+        self.enteras = np.asarray(enteras, dtype=bool)
+        self.max_nodos = max_nodos
+        self.trabajadores = trabajadores or trabajadores_ramificacion()
+
+    def resolver(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> Dict:
+        if len(self.enteras) != len(c):
+            raise ValueError(
+                "Las variables enteras no coinciden con las variables de decisión"
+            )
+        inicio = time.perf_counter()
+        self.num_vars = len(c)
+        self.tolerancia = self.solver.tolerancia
+
+        raiz = self.solver._despachar_motor(
+            c, A, b, desigualdades, tipo_optimizacion, con_tabla=True
+        )
+        tabla = self.solver.tabla_final
+        # Las artificiales que siguen en la base no pueden volver a entrar
+        inicio_artificiales = self.num_vars + sum(1 for d in desigualdades if d != "=")
+        permitidas = np.arange(tabla.shape[1] - 1) < inicio_artificiales
+
+        self.abiertos = []
+        self.contador = itertools.count()
+        self.incumbente = None
+        self.valor_incumbente = -np.inf
+        self.nodos = 1
+        pivotes_duales = 0
+        self._agregar(tabla, list(self.solver.basicas_finales), permitidas)
+
+        limite_alcanzado = False
+        pool = (
+            ProcessPoolExecutor(max_workers=self.trabajadores)
+            if self.trabajadores > 1
+            else None
+        )
+        try:
+            while self.abiertos:
+                if self.nodos >= self.max_nodos:
+                    warnings.warn(
+                        "Máximo número de nodos alcanzado en ramificación y "
+                        "acotamiento. Solución puede no ser óptima."
+                    )
+                    limite_alcanzado = True
+                    break
+                # Fuera de tiempo o cancelado: se devuelve la mejor entera
+                if self.solver.presupuesto.agotado():
+                    limite_alcanzado = True
+                    break
+
+                tareas = []
+                for nodo in self._siguientes(self.trabajadores):
+                    tabla, variables_basicas, permitidas, j, valor = nodo
+                    for sentido, cota in (
+                        ("<=", math.floor(valor)),
+                        (">=", math.ceil(valor)),
+                    ):
+                        tareas.append(
+                            (
+                                tabla,
+                                variables_basicas,
+                                permitidas,
+                                j,
+                                sentido,
+                                cota,
+                                self.tolerancia,
+                                self.solver.max_iter,
+                            )
+                        )
+                if not tareas:
+                    continue
+
+                if pool is not None:
+                    hijos = pool.map(evaluar_hijo, *zip(*tareas))
+                else:
+                    hijos = (evaluar_hijo(*tarea) for tarea in tareas)
+                for hijo in hijos:
+                    self.nodos += 1
+                    if hijo is None:
+                        continue
+                    tabla, variables_basicas, permitidas, pivotes = hijo
+                    pivotes_duales += pivotes
+                    self._agregar(tabla, variables_basicas, permitidas)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        if self.incumbente is None:
+            if limite_alcanzado:
+                raise ValueError(
+                    "No se encontró una solución entera dentro del límite de nodos"
+                    if self.solver.presupuesto.motivo is None
+                    else self.solver.presupuesto.error_sin_base()
+                )
+            raise ValueError("El problema no tiene solución entera factible")
+
+        tabla, variables_basicas = self.incumbente
+        solucion = self._solucion(tabla, variables_basicas)
+        solucion[self.enteras] = np.round(solucion[self.enteras])
+        valor_optimo = float(c @ solucion)
+
+        cota = max([self.valor_incumbente] + [-nodo[0] for nodo in self.abiertos])
+        brecha = (cota - self.valor_incumbente) / max(1.0, abs(self.valor_incumbente))
+        if tipo_optimizacion == "minimizar":
+            cota = -cota
+
+        return {
+            **raiz,
+            "solucion": solucion.tolist(),
+            "valor_optimo": valor_optimo,
+            "iteraciones": raiz["iteraciones"] + pivotes_duales,
+            "tabla_final": (
+                tabla.tolist() if raiz.get("tabla_final") is not None else None
+            ),
+            "variables_basicas": list(variables_basicas),
+            "ramificacion": {
+                "nodos": self.nodos,
+                "nodos_abiertos": len(self.abiertos),
+                "cota": float(cota),
+                "brecha": float(max(brecha, 0.0)),
+                "pivotes_duales": pivotes_duales,
+                "trabajadores": self.trabajadores,
+                "tiempo": time.perf_counter() - inicio,
+            },
+        }
+
+    def _solucion(self, tabla: np.ndarray, variables_basicas: List[int]) -> np.ndarray:
+        solucion = np.zeros(self.num_vars)
+        for i, j in enumerate(variables_basicas):
+            if j < self.num_vars:
+                solucion[j] = tabla[i, -1]
+        return solucion
+
+    def _agregar(self, tabla: np.ndarray, variables_basicas: List[int], permitidas):
+        """Actualiza la solución entera incumbente o encola el nodo para ramificar."""
+        valor = tabla[-1, -1]
+        if self._podado(valor):
+            return
+
+        solucion = self._solucion(tabla, variables_basicas)
+        fraccion = np.abs(solucion - np.round(solucion))
+        fraccion[~self.enteras] = 0.0
+        j = int(np.argmax(fraccion))
+        if fraccion[j] <= TOLERANCIA_ENTERA:
+            self.incumbente = (tabla, variables_basicas)
+            self.valor_incumbente = valor
+            return
+
+        # Ramifica en la variable más fraccionaria; el heap ordena por cota
+        heapq.heappush(
+            self.abiertos,
+            (
+                -valor,
+                next(self.contador),
+                (tabla, variables_basicas, permitidas, j, solucion[j]),
+            ),
+        )
+
+    def _siguientes(self, cantidad: int) -> List:
+        """Extrae hasta ``cantidad`` nodos con mejor cota que no estén podados."""
+        nodos = []
+        while self.abiertos and len(nodos) < cantidad:
+            cota, _, nodo = heapq.heappop(self.abiertos)
+            if not self._podado(-cota):
+                nodos.append(nodo)
+        return nodos
+
+    def _podado(self, cota: float) -> bool:
+        return cota <= self.valor_incumbente + self.tolerancia
@@ -0,0 +1,220 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+# La región se acota con x1 <= R, x2 <= R, con R este múltiplo de la mayor
+# distancia de una restricción al origen. Si el óptimo cae sobre esa caja y
+# el problema no es no acotado, se resuelve con la tabla
+FACTOR_CAJA = 1e4
+
+
+def semiplanos(
+    A: np.ndarray, b: np.ndarray, desigualdades: List[str]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Semiplanos ``n . x <= l`` de la región (restricciones y x >= 0), con las
+    normales de norma 1. Una fila nula se omite si se cumple y, si no, se
+    reemplaza por ``0 . x <= -1`` (región vacía).
+    """
+    normales, limites = [], []
+    for a, bi, d in zip(np.asarray(A, dtype=np.float64), b, desigualdades):
+        norma = np.hypot(a[0], a[1])
+        if norma == 0:
+            if (d == "<=" and bi < 0) or (d == ">=" and bi > 0) or (d == "=" and bi):
+                normales.append(np.zeros(2))
+                limites.append(-1.0)
+            continue
+        if d in ("<=", "="):
+            normales.append(a / norma)
+            limites.append(bi / norma)
+        if d in (">=", "="):
+            normales.append(-a / norma)
+            limites.append(-bi / norma)
+    normales += [np.array([-1.0, 0.0]), np.array([0.0, -1.0])]
+    limites += [0.0, 0.0]
+    return np.array(normales), np.array(limites)
+
+
+def _interseccion(n1, l1, n2, l2) -> np.ndarray:
+    det = n1[0] * n2[1] - n1[1] * n2[0]
+    return np.array([(l1 * n2[1] - l2 * n1[1]) / det, (n1[0] * l2 - n2[0] * l1) / det])
+
+
+def interseccion_semiplanos(
+    normales: np.ndarray, limites: np.ndarray, tolerancia: float = 1e-9
+) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+    """
+    Intersección de semiplanos ``n . x <= l`` acotada: ordena por ángulo y
+    recorre con una doble cola, O(m log m). Devuelve los vértices en sentido
+    antihorario y, por vértice, los índices de los dos semiplanos que lo
+    forman; sin vértices si la intersección es vacía o no tiene área.
+    """
+    # Dirección del borde con la región a la izquierda: (-n2, n1)
+    angulos = np.arctan2(normales[:, 0], -normales[:, 1])
+    orden = np.argsort(angulos, kind="stable")
+
+    def fuera(k: int, punto: np.ndarray) -> bool:
+        return normales[k] @ punto - limites[k] > tolerancia
+
+    def vertice(i: int, j: int) -> np.ndarray:
+        return _interseccion(normales[i], limites[i], normales[j], limites[j])
+
+    cola: List[int] = []
+    for k in orden:
+        while len(cola) > 1 and fuera(k, vertice(cola[-1], cola[-2])):
+            cola.pop()
+        while len(cola) > 1 and fuera(k, vertice(cola[0], cola[1])):
+            cola.pop(0)
+        if cola:
+            ultimo = cola[-1]
+            cruz = normales[k] @ np.array([normales[ultimo][1], -normales[ultimo][0]])
+            if abs(cruz) < 1e-12:
+                # Paralelos opuestos sin otro semiplano entre ellos: vacía
+                if normales[k] @ normales[ultimo] < 0:
+                    return np.empty((0, 2)), []
+                # Misma dirección: queda el más restrictivo
+                if limites[k] >= limites[ultimo]:
+                    continue
+                cola.pop()
+        cola.append(int(k))
+    while len(cola) > 2 and fuera(cola[0], vertice(cola[-1], cola[-2])):
+        cola.pop()
+    while len(cola) > 2 and fuera(cola[-1], vertice(cola[0], cola[1])):
+        cola.pop(0)
+    if len(cola) < 3:
+        return np.empty((0, 2)), []
+
+    pares = [(cola[i], cola[(i + 1) % len(cola)]) for i in range(len(cola))]
+    return np.array([vertice(i, j) for i, j in pares]), pares
+
+
+class RegionPlana:
+    """
+    Región factible de un problema con dos variables como polígono exacto
+    (intersección de semiplanos) para resolverlo leyendo el óptimo en los
+    vértices y para dibujarla. Las restricciones ``=`` dejan una región sin
+    área: en ese caso ``poligono`` es None y se usa la tabla.
+    """
+
+    def __init__(
+        self,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tolerancia: float = 1e-9,
+    ):
+        self.tolerancia = tolerancia
+        self.normales, self.limites = semiplanos(A, b, desigualdades)
+        self.num_semiplanos = len(self.limites)
+        self.radio = FACTOR_CAJA * max(1.0, np.abs(self.limites).max())
+        self.poligono = None
+        self.pares: List[Tuple[int, int]] = []
+        # Región sin área (restricciones "=") o vacía por una fila nula
+        if "=" in desigualdades or not self.normales.any(axis=1).all():
+            return
+
+        normales = np.vstack([self.normales, [[1.0, 0.0], [0.0, 1.0]]])
+        limites = np.concatenate([self.limites, [self.radio, self.radio]])
+        tolerancia_geometrica = tolerancia * max(1.0, np.abs(self.limites).max())
+        vertices, pares = interseccion_semiplanos(
+            normales, limites, tolerancia_geometrica
+        )
+        if len(vertices):
+            self.poligono, self.pares = vertices, pares
+
+    def en_caja(self, k: int) -> bool:
+        """Indica si el vértice ``k`` lo forma la caja x <= R."""
+        return max(self.pares[k]) >= self.num_semiplanos
+
+    @property
+    def acotada(self) -> bool:
+        return self.poligono is not None and not any(
+            self.en_caja(k) for k in range(len(self.poligono))
+        )
+
+    def no_acotado_en(self, c_max: np.ndarray) -> bool:
+        """
+        Indica si la región contiene una dirección d >= 0 con c . d > 0. Las
+        direcciones de recesión forman un intervalo de ángulos en [0, pi/2]
+        que cada semiplano recorta.
+        """
+        inferior, superior = 0.0, np.pi / 2
+        for n1, n2 in self.normales:
+            if n1 > 0 and n2 > 0:
+                return False
+            if n1 > 0:
+                inferior = max(inferior, np.arctan2(n1, -n2))
+            elif n2 > 0:
+                superior = min(superior, np.arctan2(-n1, n2))
+        if inferior > superior + 1e-12:
+            return False
+        # c . (cos t, sin t) es máximo en el ángulo de c o en un extremo
+        angulo_c = np.arctan2(c_max[1], c_max[0])
+        angulos = [inferior, superior] + (
+            [angulo_c] if inferior <= angulo_c <= superior else []
+        )
+        mayor = max(c_max @ [np.cos(t), np.sin(t)] for t in angulos)
+        return mayor > self.tolerancia
+
+    def optimo(self, c: np.ndarray, tipo_optimizacion: str) -> Optional[Dict]:
+        """
+        Óptimo en los vértices del polígono. Se certifica con los
+        multiplicadores de los dos semiplanos que forman el vértice
+        (c = l1 n1 + l2 n2 con l >= 0); si no se puede (región vacía o
+        degenerada, óptimo sobre la caja) devuelve None. Lanza ValueError
+        si el problema es no acotado.
+        """
+        if self.poligono is None:
+            return None
+        c_max = np.asarray(c, dtype=np.float64)
+        if tipo_optimizacion == "minimizar":
+            c_max = -c_max
+        if self.no_acotado_en(c_max):
+            raise ValueError("El problema es no acotado")
+
+        valores = self.poligono @ c_max
+        holgura = self.tolerancia * (1.0 + np.abs(valores).max())
+        for k in np.flatnonzero(valores >= valores.max() - holgura):
+            if self.en_caja(k):
+                continue
+            i, j = self.pares[k]
+            base = np.column_stack([self.normales[i], self.normales[j]])
+            try:
+                multiplicadores = np.linalg.solve(base, c_max)
+            except np.linalg.LinAlgError:
+                continue
+            if multiplicadores.min() < -holgura:
+                continue
+            x = np.maximum(self.poligono[k], 0.0) + 0.0
+            if (self.normales @ x - self.limites).max() > holgura:
+                continue
+            return {
+                "solucion": x.tolist(),
+                "valor_optimo": float(np.asarray(c, dtype=np.float64) @ x),
+                "iteraciones": 0,
+                "pasos": [],
+                "tabla_final": None,
+                "variables_basicas": [],
+            }
+        return None
+
+    def recortar(self, x_max: float, y_max: float) -> Optional[np.ndarray]:
+        """Polígono recortado a la ventana [0, x_max] x [0, y_max] (para dibujar)."""
+        if self.poligono is None:
+            return None
+        normales = np.vstack([self.normales, [[1.0, 0.0], [0.0, 1.0]]])
+        limites = np.concatenate([self.limites, [x_max, y_max]])
+        vertices, _ = interseccion_semiplanos(
+            normales, limites, self.tolerancia * max(1.0, x_max, y_max)
+        )
+        return vertices if len(vertices) else None
+
+    def resumen(self) -> Dict:
+        """Vértices reales de la región (sin los de la caja) y si es acotada."""
+        vertices = []
+        if self.poligono is not None:
+            vertices = [
+                (vertice + 0.0).tolist()
+                for k, vertice in enumerate(self.poligono)
+                if not self.en_caja(k)
+            ]
+        return {"vertices": vertices, "acotada": self.acotada}
@@ -0,0 +1,481 @@
+import numpy as np
+from typing import Dict, Iterator, List, Optional
+
+# Identifica el formato compacto dentro del JSONField ``pasos``
+FORMATO_REGISTRO = "pivotes"
+
+# ninguno: sin pasos; resumen: tablas inicial y final; muestreo: además una
+# tabla cada k pivotes; completo: registro de pivotes reconstruible
+NIVELES_REGISTRO = ("ninguno", "resumen", "muestreo", "completo")
+
+
+# Filas por bloque en la actualización de rango 1 de un pivote
+FILAS_POR_BLOQUE = 64
+
+# Con a lo sumo esta fracción de filas no nulas en la columna pivote se
+# actualizan solo esas filas, una a una
+FRACCION_FILAS_DISPERSAS = 0.125
+
+
+class EspacioPivoteo:
+    """
+    Memoria de trabajo reutilizable para pivotear una tabla in situ: los
+    factores de la columna pivote y un bloque de filas para el producto de
+    la actualización de rango 1. Se reserva una vez por resolución (crece si
+    la tabla crece), de modo que un pivote no reserva memoria proporcional a
+    la tabla.
+    """
+
+    def __init__(self, filas_por_bloque: int = FILAS_POR_BLOQUE):
+        self.filas_por_bloque = filas_por_bloque
+        self.factores = np.empty(0)
+        self.producto = np.empty((filas_por_bloque, 0))
+
+    def pivotear(self, tabla: np.ndarray, fila_pivote: int, col_pivote: int):
+        filas, columnas = tabla.shape
+        if len(self.factores) < filas:
+            self.factores = np.empty(filas)
+        if self.producto.shape[1] < columnas:
+            self.producto = np.empty((self.filas_por_bloque, columnas))
+
+        fila = tabla[fila_pivote]
+        fila /= fila[col_pivote]
+        factores = self.factores[:filas]
+        np.copyto(factores, tabla[:, col_pivote])
+        factores[fila_pivote] = 0.0
+
+        # Solo cambian las filas con coeficiente no nulo en la columna pivote
+        if np.count_nonzero(factores) <= FRACCION_FILAS_DISPERSAS * filas:
+            producto = self.producto[0, :columnas]
+            for i in np.flatnonzero(factores):
+                np.multiply(fila, factores[i], out=producto)
+                np.subtract(tabla[i], producto, out=tabla[i])
+            return
+
+        for inicio in range(0, filas, self.filas_por_bloque):
+            fin = min(inicio + self.filas_por_bloque, filas)
+            bloque = factores[inicio:fin]
+            if not bloque.any():
+                continue
+            producto = self.producto[: fin - inicio, :columnas]
+            np.multiply(bloque[:, np.newaxis], fila, out=producto)
+            np.subtract(tabla[inicio:fin], producto, out=tabla[inicio:fin])
+
+
+def pivotear_tabla(
+    tabla: np.ndarray,
+    fila_pivote: int,
+    col_pivote: int,
+    espacio: Optional[EspacioPivoteo] = None,
+):
+    """
+    Operación de pivote sobre la tabla completa (in situ). Quien pivotea
+    muchas veces debe pasar su ``espacio`` para reutilizar la memoria.
+    """
+    (espacio or EspacioPivoteo()).pivotear(tabla, fila_pivote, col_pivote)
+
+
+def cambiar_base(tabla: np.ndarray, variables_basicas: List[int]):
+    """
+    Expresa la tabla en la base dada (in situ), como si se hubieran hecho
+    los pivotes que llevan a ella. Lanza LinAlgError si la base es singular.
+    """
+    tabla[:-1] = np.linalg.solve(tabla[:-1, variables_basicas], tabla[:-1])
+    tabla[-1] -= tabla[-1, variables_basicas] @ tabla[:-1]
+
+
+def reparar_base(
+    tabla: np.ndarray,
+    variables_basicas: List[int],
+    filas: List[int],
+    inicio_artificiales: int,
+):
+    """
+    Repara una base que no es primal factible: cada fila de ``filas`` (con
+    lado derecho negativo) se multiplica por -1 y recibe una artificial
+    nueva que entra a la base. La fila objetivo pasa a ser la de Fase I (la
+    suma de todas las artificiales). Devuelve la tabla ampliada y la base.
+    """
+    filas_tabla, columnas = tabla.shape
+    reparada = np.zeros((filas_tabla, columnas + len(filas)))
+    reparada[:, : columnas - 1] = tabla[:, :-1]
+    reparada[:, -1] = tabla[:, -1]
+    variables_basicas = list(variables_basicas)
+    for k, i in enumerate(filas):
+        reparada[i] *= -1
+        reparada[i, columnas - 1 + k] = 1
+        variables_basicas[i] = columnas - 1 + k
+
+    reparada[-1] = 0
+    reparada[-1, inicio_artificiales:-1] = 1
+    for i, j in enumerate(variables_basicas):
+        if reparada[-1, j] != 0:
+            reparada[-1] -= reparada[-1, j] * reparada[i]
+    return reparada, variables_basicas
+
+
+def restaurar_objetivo(tabla: np.ndarray, variables_basicas: List[int], c):
+    """Reemplaza la fila objetivo de Fase I por la original (Fase II)."""
+    tabla[-1, :] = 0
+    tabla[-1, : len(c)] = -np.asarray(c)
+    # Las columnas básicas son unitarias: basta una combinación de filas
+    tabla[-1] -= tabla[-1, variables_basicas] @ tabla[:-1]
+
+
+def _paso(titulo: str, tabla: np.ndarray, variables_basicas, explicacion: str, **extra):
+    paso = {
+        "titulo": titulo,
+        "tabla": tabla.tolist(),
+        "variables_basicas": list(variables_basicas),
+    }
+    paso.update(extra)
+    paso["explicacion"] = explicacion
+    return paso
+
+
+def _paso_inicial(tabla: np.ndarray, variables_basicas) -> Dict:
+    return _paso(
+        "Tabla inicial",
+        tabla,
+        variables_basicas,
+        "Tabla inicial con variables de holgura/exceso/artificiales",
+    )
+
+
+# Título y explicación del paso que muestra un cambio directo de base
+_ORIGENES_BASE = {
+    "crossover": (
+        "Crossover",
+        "Tabla expresada en la base identificada por el punto interior",
+    ),
+    "reoptimizacion": (
+        "Base anterior",
+        "Tabla expresada en la base óptima del problema antes de editarlo",
+    ),
+    "crash": (
+        "Base inicial (crash)",
+        "Tabla expresada en una base triangular que usa variables de decisión "
+        "en lugar de artificiales en las filas >= y =",
+    ),
+    "reparacion": (
+        "Base reparada",
+        "Las filas infactibles de la base anterior reciben una artificial nueva "
+        "y la Fase I parte de esa base",
+    ),
+}
+
+
+# Título y explicación del paso que muestra un ajuste del lado derecho
+_AJUSTES_RHS = {
+    "perturbacion": (
+        "Perturbación del lado derecho",
+        "Pivotes degenerados repetidos: se suma un valor pequeño al lado "
+        "derecho de cada fila para salir del estancamiento",
+    ),
+    "limpieza": (
+        "Limpieza de la perturbación",
+        "Se quita la perturbación del lado derecho al terminar la fase",
+    ),
+}
+
+
+def _paso_base(tabla: np.ndarray, variables_basicas, origen: str) -> Dict:
+    titulo, explicacion = _ORIGENES_BASE[origen]
+    return _paso(titulo, tabla, variables_basicas, explicacion)
+
+
+def _paso_rhs(tabla: np.ndarray, variables_basicas, motivo: str) -> Dict:
+    titulo, explicacion = _AJUSTES_RHS[motivo]
+    return _paso(titulo, tabla, variables_basicas, explicacion)
+
+
+def _paso_pivote(tabla, variables_basicas, fila, columna, fase, iteracion) -> Dict:
+    if fase == "I":
+        titulo = f"Fase I - Iteración {iteracion}"
+        explicacion = "Pivote en Fase I para eliminar variables artificiales"
+    elif fase == "dual":
+        titulo = f"Simplex dual - Iteración {iteracion}"
+        explicacion = (
+            f"Pivote dual en fila {fila}, columna {columna}: sale una "
+            "variable básica negativa"
+        )
+    else:
+        titulo = f"Iteración {iteracion}"
+        explicacion = f"Pivote en fila {fila}, columna {columna}"
+    return _paso(
+        titulo,
+        tabla,
+        variables_basicas,
+        explicacion,
+        pivote={"fila": fila, "columna": columna},
+    )
+
+
+class RegistroPasos:
+    """
+    Registro de pasos del Simplex por tablas (nivel "ninguno": no guarda nada).
+
+    El solver llama a ``pivote`` después de cada pivote, con la tabla ya
+    actualizada, y al final ``resultado`` devuelve las claves que se agregan
+    al resultado (``pasos`` o ``registro_pasos`` y ``tabla_final``).
+    """
+
+    def __init__(
+        self, tabla: np.ndarray, variables_basicas: List[int], costos: np.ndarray
+    ):
+        self.iteraciones = {"I": 0, "II": 0, "dual": 0}
+
+    def pivote(
+        self,
+        tabla: np.ndarray,
+        variables_basicas: List[int],
+        fila: int,
+        columna: int,
+        sale: int,
+        fase: str,
+    ):
+        """``fase`` es "I", "II", "dual" o "expulsion" (no se muestra como paso)."""
+        if fase != "expulsion":
+            self.iteraciones[fase] += 1
+
+    def cambiar_base(
+        self, tabla: np.ndarray, variables_basicas: List[int], origen: str = "crossover"
+    ):
+        """``origen`` es "crossover", "reoptimizacion" o "crash"."""
+
+    def reparar_base(
+        self,
+        tabla: np.ndarray,
+        variables_basicas: List[int],
+        base: List[int],
+        filas: List[int],
+        inicio_artificiales: int,
+    ):
+        """Cambio a ``base`` seguido de ``reparar_base`` (tabla ya reparada)."""
+
+    def ajustar_rhs(
+        self,
+        tabla: np.ndarray,
+        variables_basicas: List[int],
+        delta: np.ndarray,
+        motivo: str,
+    ):
+        """Se sumó ``delta`` al lado derecho ("perturbacion" o "limpieza")."""
+
+    def eliminar_columnas(self, conservar: List[int]):
+        pass
+
+    def restaurar_objetivo(self):
+        pass
+
+    def resultado(self, tabla: np.ndarray, variables_basicas: List[int]) -> Dict:
+        return {"pasos": [], "tabla_final": None}
+
+
+class RegistroResumen(RegistroPasos):
+    """Solo la tabla inicial y la final."""
+
+    def __init__(self, tabla, variables_basicas, costos):
+        super().__init__(tabla, variables_basicas, costos)
+        self.pasos = [_paso_inicial(tabla, variables_basicas)]
+
+    def resultado(self, tabla, variables_basicas) -> Dict:
+        tabla_final = tabla.tolist()
+        paso_final = {
+            "titulo": "Tabla final",
+            "tabla": tabla_final,
+            "variables_basicas": list(variables_basicas),
+            "explicacion": (
+                f"Tabla final tras {sum(self.iteraciones.values())} pivotes"
+            ),
+        }
+        return {"pasos": self.pasos + [paso_final], "tabla_final": tabla_final}
+
+
+class RegistroMuestreado(RegistroResumen):
+    """Tabla inicial, una tabla cada ``cada`` pivotes de cada fase y la final."""
+
+    def __init__(self, tabla, variables_basicas, costos, cada: int = 10):
+        super().__init__(tabla, variables_basicas, costos)
+        self.cada = max(int(cada), 1)
+
+    def cambiar_base(self, tabla, variables_basicas, origen="crossover"):
+        self.pasos.append(_paso_base(tabla, variables_basicas, origen))
+
+    def reparar_base(self, tabla, variables_basicas, base, filas, inicio_artificiales):
+        self.pasos.append(_paso_base(tabla, variables_basicas, "reparacion"))
+
+    def ajustar_rhs(self, tabla, variables_basicas, delta, motivo):
+        self.pasos.append(_paso_rhs(tabla, variables_basicas, motivo))
+
+    def pivote(self, tabla, variables_basicas, fila, columna, sale, fase):
+        super().pivote(tabla, variables_basicas, fila, columna, sale, fase)
+        if fase != "expulsion" and self.iteraciones[fase] % self.cada == 0:
+            self.pasos.append(
+                _paso_pivote(
+                    tabla,
+                    variables_basicas,
+                    fila,
+                    columna,
+                    fase,
+                    self.iteraciones[fase],
+                )
+            )
+
+
+class RegistroPivotes(RegistroPasos):
+    """
+    Registro compacto de la ejecución del Simplex por tablas (nivel "completo").
+
+    Guarda la tabla inicial una sola vez y, por cada operación posterior, un
+    evento pequeño: los pivotes (fila, columna, variable que entra y que
+    sale), los cambios directos de base (crossover o reoptimización), los
+    ajustes del lado derecho (perturbación anti-degeneración), la
+    eliminación de columnas artificiales y el cambio de objetivo entre
+    fases. Cualquier tabla intermedia se reconstruye reproduciendo los
+    eventos con ``expandir_pasos``.
+    """
+
+    def __init__(
+        self, tabla: np.ndarray, variables_basicas: List[int], costos: np.ndarray
+    ):
+        super().__init__(tabla, variables_basicas, costos)
+        self.tabla_inicial = tabla.copy()
+        self.variables_basicas = list(variables_basicas)
+        self.costos = [float(x) for x in costos]
+        self.eventos: List[Dict] = []
+
+    def pivote(self, tabla, variables_basicas, fila, columna, sale, fase):
+        super().pivote(tabla, variables_basicas, fila, columna, sale, fase)
+        self.eventos.append(
+            {
+                "tipo": "pivote",
+                "fila": int(fila),
+                "columna": int(columna),
+                "sale": int(sale),
+                "fase": fase,
+            }
+        )
+
+    def cambiar_base(self, tabla, variables_basicas, origen="crossover"):
+        self.eventos.append(
+            {"tipo": "base", "basicas": list(variables_basicas), "origen": origen}
+        )
+
+    def reparar_base(self, tabla, variables_basicas, base, filas, inicio_artificiales):
+        self.eventos.append(
+            {
+                "tipo": "reparacion",
+                "basicas": list(base),
+                "filas": [int(i) for i in filas],
+                "inicio_artificiales": int(inicio_artificiales),
+            }
+        )
+
+    def ajustar_rhs(self, tabla, variables_basicas, delta, motivo):
+        self.eventos.append(
+            {"tipo": "rhs", "delta": [float(x) for x in delta], "motivo": motivo}
+        )
+
+    def eliminar_columnas(self, conservar: List[int]):
+        self.eventos.append({"tipo": "columnas", "conservar": list(conservar)})
+
+    def restaurar_objetivo(self):
+        self.eventos.append({"tipo": "objetivo"})
+
+    def a_dict(self) -> Dict:
+        return {
+            "formato": FORMATO_REGISTRO,
+            "tabla_inicial": self.tabla_inicial.tolist(),
+            "variables_basicas": self.variables_basicas,
+            "costos": self.costos,
+            "eventos": self.eventos,
+        }
+
+    def resultado(self, tabla, variables_basicas) -> Dict:
+        return {"registro_pasos": self.a_dict(), "tabla_final": tabla.tolist()}
+
+
+def crear_registro(
+    nivel: str,
+    tabla: np.ndarray,
+    variables_basicas: List[int],
+    costos: np.ndarray,
+    cada: int = 10,
+) -> RegistroPasos:
+    """Instancia el registro de pasos del nivel indicado."""
+    if nivel == "completo":
+        return RegistroPivotes(tabla, variables_basicas, costos)
+    if nivel == "muestreo":
+        return RegistroMuestreado(tabla, variables_basicas, costos, cada)
+    if nivel == "resumen":
+        return RegistroResumen(tabla, variables_basicas, costos)
+    if nivel == "ninguno":
+        return RegistroPasos(tabla, variables_basicas, costos)
+    raise ValueError(f"Nivel de registro desconocido: {nivel}")
+
+
+def es_registro(pasos) -> bool:
+    return isinstance(pasos, dict) and pasos.get("formato") == FORMATO_REGISTRO
+
+
+def expandir_pasos(registro: Dict) -> Iterator[Dict]:
+    """
+    Genera los pasos (tabla inicial y una tabla por pivote) en el formato
+    histórico de ``pasos``. Es perezoso: cada tabla se produce al iterar.
+    """
+    tabla = np.array(registro["tabla_inicial"], dtype=np.float64)
+    basicas = list(registro["variables_basicas"])
+    iteraciones = {"I": 0, "II": 0, "dual": 0}
+    espacio = EspacioPivoteo()
+
+    yield _paso_inicial(tabla, basicas)
+
+    for evento in registro["eventos"]:
+        if evento["tipo"] == "columnas":
+            conservar = evento["conservar"]
+            tabla = tabla[:, conservar]
+            posicion = {j: k for k, j in enumerate(conservar)}
+            basicas = [posicion[j] for j in basicas]
+            continue
+        if evento["tipo"] == "objetivo":
+            restaurar_objetivo(tabla, basicas, registro["costos"])
+            continue
+        if evento["tipo"] == "base":
+            basicas = list(evento["basicas"])
+            cambiar_base(tabla, basicas)
+            yield _paso_base(tabla, basicas, evento.get("origen", "crossover"))
+            continue
+        if evento["tipo"] == "rhs":
+            tabla[:, -1] += evento["delta"]
+            yield _paso_rhs(tabla, basicas, evento["motivo"])
+            continue
+        if evento["tipo"] == "reparacion":
+            cambiar_base(tabla, evento["basicas"])
+            tabla, basicas = reparar_base(
+                tabla,
+                evento["basicas"],
+                evento["filas"],
+                evento["inicio_artificiales"],
+            )
+            yield _paso_base(tabla, basicas, "reparacion")
+            continue
+
+        fila, columna, fase = evento["fila"], evento["columna"], evento["fase"]
+        basicas[fila] = columna
+        pivotear_tabla(tabla, fila, columna, espacio)
+        if fase == "expulsion":
+            continue
+
+        iteraciones[fase] += 1
+        yield _paso_pivote(tabla, basicas, fila, columna, fase, iteraciones[fase])
+
+
+def reconstruir_paso(registro: Dict, indice: int) -> Dict:
+    """Reconstruye solo el paso ``indice`` (0 es la tabla inicial)."""
+    if indice < 0:
+        raise ValueError("El índice del paso debe ser no negativo")
+    for k, paso in enumerate(expandir_pasos(registro)):
+        if k == indice:
+            return paso
+    raise ValueError(f"El paso {indice} no existe")
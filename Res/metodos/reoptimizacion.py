@@ -0,0 +1,85 @@
+from typing import List, Optional
+
+import numpy as np
+
+from .punto_interior import identificar_base
+
+
+def etiquetar_base(
+    solucion: List[float],
+    A: np.ndarray,
+    b: np.ndarray,
+    desigualdades: List[str],
+    tolerancia: float = 1e-9,
+) -> List[str]:
+    """
+    Describe la base óptima con etiquetas independientes de la numeración de
+    la tabla: ``x3`` (variable de decisión), ``s2`` (holgura o exceso de la
+    restricción 2) y ``a2`` (artificial de la restricción 2). Se identifica
+    a partir del vértice óptimo en el problema original, así que vale
+    también cuando el solver trabajó sobre el problema reducido o escalado.
+    """
+    x = np.asarray(solucion, dtype=np.float64)
+    num_vars = len(x)
+    filas_holgura = [i for i, d in enumerate(desigualdades) if d != "="]
+    filas_artificiales = [i for i, d in enumerate(desigualdades) if d != "<="]
+    holguras = np.abs(b[filas_holgura] - A[filas_holgura] @ x)
+
+    estandar = np.concatenate([x, holguras])
+    columnas = identificar_base(
+        estandar, np.full(len(estandar), tolerancia), desigualdades, num_vars
+    )
+
+    etiquetas = []
+    for j in columnas:
+        if j < num_vars:
+            etiquetas.append(f"x{j + 1}")
+        elif j < num_vars + len(filas_holgura):
+            etiquetas.append(f"s{filas_holgura[j - num_vars] + 1}")
+        else:
+            etiquetas.append(
+                f"a{filas_artificiales[j - num_vars - len(filas_holgura)] + 1}"
+            )
+    return etiquetas
+
+
+def columnas_base(
+    etiquetas: List[str], desigualdades: List[str], num_vars: int
+) -> Optional[List[int]]:
+    """
+    Traduce las etiquetas de ``etiquetar_base`` a columnas de la tabla
+    inicial del problema (posiblemente editado) y completa la base con la
+    holgura o artificial de las restricciones agregadas al final. Devuelve
+    None si la base no se puede trasladar.
+    """
+    holgura, artificial = {}, {}
+    columna = num_vars
+    for i, d in enumerate(desigualdades):
+        if d != "=":
+            holgura[i] = columna
+            columna += 1
+    for i, d in enumerate(desigualdades):
+        if d != "<=":
+            artificial[i] = columna
+            columna += 1
+
+    num_restr = len(desigualdades)
+    base = []
+    for etiqueta in etiquetas:
+        tipo, indice = etiqueta[0], int(etiqueta[1:]) - 1
+        if tipo == "x":
+            if indice < num_vars:
+                base.append(indice)
+        elif indice < num_restr:
+            # Si cambió el tipo de la restricción se usa la columna que tenga
+            preferida, otra = (
+                (holgura, artificial) if tipo == "s" else (artificial, holgura)
+            )
+            base.append(preferida.get(indice, otra.get(indice)))
+
+    for i in range(len(etiquetas), num_restr):
+        base.append(holgura.get(i, artificial.get(i)))
+
+    if len(base) != num_restr or len(set(base)) != num_restr:
+        return None
+    return base
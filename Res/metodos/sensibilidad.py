@@ -0,0 +1,354 @@
+import warnings
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Número máximo de cambios de base en un barrido paramétrico
+MAX_CAMBIOS_BASE = 1000
+
+
+def _finito(valor: float) -> Optional[float]:
+    """Los intervalos no acotados se informan con None (JSON no admite inf)."""
+    return float(valor) + 0.0 if np.isfinite(valor) else None
+
+
+def _intervalo(inferior: float, superior: float) -> List[Optional[float]]:
+    return [_finito(min(inferior, superior)), _finito(max(inferior, superior))]
+
+
+class AnalisisSensibilidad:
+    """
+    Análisis de sensibilidad y paramétrico a partir de una base óptima.
+
+    Trabaja como el Simplex revisado sobre la forma estándar del problema
+    (variables, holguras/excesos y artificiales, en el orden de la tabla
+    inicial): mantiene la inversa de la base, de modo que precios sombra,
+    costos reducidos e intervalos salen de productos con ella y cada cambio
+    de base de un barrido es una actualización de rango 1, no una nueva
+    resolución.
+
+    ``base`` son columnas de esa forma estándar para el problema con los
+    signos normalizados (lados derechos no negativos); si faltan columnas
+    (artificiales básicas en nivel cero, cuya fila es redundante) se completa
+    con las columnas unitarias de las filas. Los resultados se expresan en
+    los términos del problema original.
+    """
+
+    def __init__(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+        base: List[int],
+        tolerancia: float = 1e-9,
+    ):
+        self.tolerancia = tolerancia
+        self.num_vars = len(c)
+        self.signo_objetivo = 1.0 if tipo_optimizacion == "maximizar" else -1.0
+        # Filas multiplicadas por -1 al normalizar los signos
+        self.signos = np.where(np.asarray(b) < 0, -1.0, 1.0)
+        invertida = {"<=": ">=", ">=": "<=", "=": "="}
+        sentidos = [
+            invertida[d] if s < 0 else d for d, s in zip(desigualdades, self.signos)
+        ]
+
+        num_restr = len(b)
+        filas_holgura = [i for i, d in enumerate(sentidos) if d != "="]
+        filas_artificiales = [i for i, d in enumerate(sentidos) if d != "<="]
+        self.inicio_artificiales = self.num_vars + len(filas_holgura)
+        num_columnas = self.inicio_artificiales + len(filas_artificiales)
+
+        self.M = np.zeros((num_restr, num_columnas))
+        self.M[:, : self.num_vars] = np.asarray(A) * self.signos[:, np.newaxis]
+        self.etiquetas = [f"x{j + 1}" for j in range(self.num_vars)]
+        # Columna +e_i de cada fila: su holgura o, si no tiene, su artificial
+        self.columna_unidad = np.zeros(num_restr, dtype=int)
+        for k, i in enumerate(filas_holgura):
+            j = self.num_vars + k
+            self.M[i, j] = 1.0 if sentidos[i] == "<=" else -1.0
+            self.etiquetas.append(f"s{i + 1}")
+            if sentidos[i] == "<=":
+                self.columna_unidad[i] = j
+        for k, i in enumerate(filas_artificiales):
+            j = self.inicio_artificiales + k
+            self.M[i, j] = 1.0
+            self.etiquetas.append(f"a{i + 1}")
+            self.columna_unidad[i] = j
+
+        self.b = np.asarray(b, dtype=np.float64) * self.signos
+        self.costos = np.zeros(num_columnas)
+        self.costos[: self.num_vars] = self.signo_objetivo * np.asarray(c)
+        self.base = self._completar_base(list(base))
+        self.inversa = np.linalg.inv(self.M[:, self.base])
+        self.cambios_base = 0
+
+    def _completar_base(self, base: List[int]) -> List[int]:
+        for j in self.columna_unidad:
+            if len(base) >= self.M.shape[0]:
+                break
+            if (
+                j not in base
+                and np.linalg.matrix_rank(self.M[:, base + [j]]) == len(base) + 1
+            ):
+                base.append(int(j))
+        return base
+
+    # ------------------------------------------------------------------
+    # Cantidades de la base actual
+    # ------------------------------------------------------------------
+
+    def _basicas(self) -> np.ndarray:
+        return self.inversa @ self.b
+
+    def _duales(self) -> np.ndarray:
+        return self.costos[self.base] @ self.inversa
+
+    def _costos_reducidos(self) -> np.ndarray:
+        return self._duales() @ self.M - self.costos
+
+    def _no_basicas_permitidas(self) -> np.ndarray:
+        # Las artificiales no pueden entrar a la base
+        permitidas = np.arange(self.M.shape[1]) < self.inicio_artificiales
+        permitidas[self.base] = False
+        return permitidas
+
+    def _solucion(self) -> np.ndarray:
+        solucion = np.zeros(self.num_vars)
+        for valor, j in zip(self._basicas(), self.base):
+            if j < self.num_vars:
+                solucion[j] = valor
+        return solucion
+
+    def _valor(self) -> float:
+        return float(self.signo_objetivo * (self.costos[self.base] @ self._basicas()))
+
+    def _pivotear(self, fila: int, columna: int):
+        """Actualización de rango 1 de la inversa al entrar ``columna``."""
+        d = self.inversa @ self.M[:, columna]
+        self.inversa[fila] /= d[fila]
+        d[fila] = 0.0
+        self.inversa -= np.outer(d, self.inversa[fila])
+        self.base[fila] = columna
+        self.cambios_base += 1
+
+    # ------------------------------------------------------------------
+    # Sensibilidad
+    # ------------------------------------------------------------------
+
+    def precios_sombra(self) -> np.ndarray:
+        """Derivadas del valor óptimo respecto de cada lado derecho original."""
+        return self.signo_objetivo * self.signos * self._duales() + 0.0
+
+    def resumen(self) -> Dict:
+        """
+        Precios sombra y costos reducidos (derivadas del valor óptimo
+        respecto de cada lado derecho y de cada variable no básica) e
+        intervalos de los lados derechos y de los costos en los que la base
+        sigue siendo óptima.
+        """
+        basicas = self._basicas()
+        reducidos = self._costos_reducidos()
+        reducidos[self.base] = 0.0
+        permitidas = self._no_basicas_permitidas()
+
+        rango_rhs = []
+        for i in range(len(self.b)):
+            u = self.inversa[:, i]
+            inferior, superior = self._pasos(basicas, u)
+            rango_rhs.append(
+                _intervalo(
+                    self.signos[i] * (self.b[i] - inferior),
+                    self.signos[i] * (self.b[i] + superior),
+                )
+            )
+
+        rango_costos = []
+        for j in range(self.num_vars):
+            if j in self.base:
+                fila = self.inversa[self.base.index(j)] @ self.M
+                inferior, superior = self._pasos(
+                    reducidos[permitidas], fila[permitidas]
+                )
+            else:
+                inferior, superior = np.inf, reducidos[j]
+            rango_costos.append(
+                _intervalo(
+                    self.signo_objetivo * (self.costos[j] - inferior),
+                    self.signo_objetivo * (self.costos[j] + superior),
+                )
+            )
+
+        return {
+            "precios_sombra": self.precios_sombra().tolist(),
+            "costos_reducidos": (
+                -self.signo_objetivo * reducidos[: self.num_vars] + 0.0
+            ).tolist(),
+            "rango_rhs": rango_rhs,
+            "rango_costos": rango_costos,
+            "base": [self.etiquetas[j] for j in self.base],
+        }
+
+    def _pasos(self, valores: np.ndarray, direccion: np.ndarray):
+        """
+        Cuánto puede bajar y subir t antes de que ``valores + t * direccion``
+        deje de ser no negativo.
+        """
+        tol = self.tolerancia
+        baja = direccion > tol
+        sube = direccion < -tol
+        inferior = np.min(valores[baja] / direccion[baja], initial=np.inf)
+        superior = np.min(valores[sube] / -direccion[sube], initial=np.inf)
+        return max(inferior, 0.0), max(superior, 0.0)
+
+    # ------------------------------------------------------------------
+    # Barridos paramétricos
+    # ------------------------------------------------------------------
+
+    def barrido_rhs(
+        self, fila: int, hasta: float, desde: Optional[float] = None
+    ) -> Dict:
+        """Recorre b_fila hasta ``hasta`` con cambios de base (Simplex dual)."""
+        if desde is not None:
+            self._recorrer_rhs(fila, desde, None)
+        segmentos = []
+        limite = self._recorrer_rhs(fila, hasta, segmentos)
+        return self._barrido("rhs", fila, segmentos, limite)
+
+    def barrido_costo(
+        self, variable: int, hasta: float, desde: Optional[float] = None
+    ) -> Dict:
+        """Recorre c_variable hasta ``hasta`` con cambios de base (Simplex primal)."""
+        if desde is not None:
+            self._recorrer_costo(variable, desde, None)
+        segmentos = []
+        limite = self._recorrer_costo(variable, hasta, segmentos)
+        return self._barrido("costo", variable, segmentos, limite)
+
+    def _barrido(self, parametro: str, indice: int, segmentos, limite) -> Dict:
+        return {
+            "parametro": parametro,
+            "indice": indice + 1,
+            "segmentos": segmentos,
+            "limite": limite,
+            "cambios_base": self.cambios_base,
+        }
+
+    def _segmento(
+        self, desde: float, hasta: float, valor_desde: float, pendiente, solucion
+    ) -> Dict:
+        """Tramo del barrido; ``solucion`` es la del inicio del tramo."""
+        return {
+            "desde": _finito(desde),
+            "hasta": _finito(hasta),
+            "valor_desde": _finito(valor_desde),
+            "valor_hasta": _finito(valor_desde + pendiente * (hasta - desde)),
+            "pendiente": _finito(pendiente),
+            "solucion": (solucion + 0.0).tolist(),
+            "base": [self.etiquetas[j] for j in self.base],
+        }
+
+    def _recorrer_rhs(self, fila: int, objetivo: float, segmentos) -> Optional[str]:
+        signo = self.signos[fila]
+        destino = signo * objetivo
+        for _ in range(MAX_CAMBIOS_BASE):
+            distancia = destino - self.b[fila]
+            if abs(distancia) <= self.tolerancia:
+                return None
+            direccion = np.sign(distancia)
+            u = direccion * self.inversa[:, fila]
+            basicas = self._basicas()
+            _, paso = self._pasos(basicas, u)
+            paso = min(paso, abs(distancia))
+
+            # El valor óptimo es lineal en el tramo, con pendiente el precio sombra
+            valor = self._valor()
+            solucion = self._solucion()
+            pendiente = self.signo_objetivo * signo * self._duales()[fila]
+            inicio = signo * self.b[fila]
+            self.b[fila] += direccion * paso
+            if segmentos is not None and paso > self.tolerancia:
+                segmentos.append(
+                    self._segmento(
+                        inicio, signo * self.b[fila], valor, pendiente, solucion
+                    )
+                )
+            if paso >= abs(distancia):
+                return None
+
+            # Pivote dual en la básica que se anula al pasar el punto de quiebre
+            bloqueantes = u < -self.tolerancia
+            razones = np.full(len(u), np.inf)
+            razones[bloqueantes] = basicas[bloqueantes] / -u[bloqueantes]
+            salida = int(np.argmin(razones))
+            alfa = self.inversa[salida] @ self.M
+            candidatas = self._no_basicas_permitidas() & (alfa < -self.tolerancia)
+            if not candidatas.any():
+                return "infactible"
+            reducidos = np.maximum(self._costos_reducidos(), 0.0)
+            razones = np.full(len(alfa), np.inf)
+            razones[candidatas] = reducidos[candidatas] / -alfa[candidatas]
+            self._pivotear(salida, int(np.argmin(razones)))
+
+        warnings.warn("Máximo número de cambios de base alcanzado en el barrido.")
+        return "max_iter"
+
+    def _recorrer_costo(
+        self, variable: int, objetivo: float, segmentos
+    ) -> Optional[str]:
+        destino = self.signo_objetivo * objetivo
+        for _ in range(MAX_CAMBIOS_BASE):
+            distancia = destino - self.costos[variable]
+            if abs(distancia) <= self.tolerancia:
+                return None
+            direccion = np.sign(distancia)
+
+            # Derivada de los costos reducidos respecto del costo
+            if variable in self.base:
+                derivada = self.inversa[self.base.index(variable)] @ self.M
+                derivada[variable] = 0.0
+            else:
+                derivada = np.zeros(self.M.shape[1])
+                derivada[variable] = -1.0
+            derivada *= direccion
+            permitidas = self._no_basicas_permitidas()
+            reducidos = self._costos_reducidos()
+            _, paso = self._pasos(reducidos[permitidas], derivada[permitidas])
+            paso = min(paso, abs(distancia))
+
+            # El valor óptimo es lineal en el tramo, con pendiente x_variable
+            valor = self._valor()
+            solucion = self._solucion()
+            pendiente = solucion[variable]
+            inicio = self.signo_objetivo * self.costos[variable]
+            self.costos[variable] += direccion * paso
+            if segmentos is not None and paso > self.tolerancia:
+                segmentos.append(
+                    self._segmento(
+                        inicio,
+                        self.signo_objetivo * self.costos[variable],
+                        valor,
+                        pendiente,
+                        solucion,
+                    )
+                )
+            if paso >= abs(distancia):
+                return None
+
+            # Pivote primal con la no básica cuyo costo reducido se anula
+            razones = np.full(len(derivada), np.inf)
+            bloqueantes = permitidas & (derivada < -self.tolerancia)
+            razones[bloqueantes] = reducidos[bloqueantes] / -derivada[bloqueantes]
+            entrada = int(np.argmin(razones))
+            d = self.inversa @ self.M[:, entrada]
+            basicas = self._basicas()
+            positivas = d > self.tolerancia
+            if not positivas.any():
+                return "no_acotado"
+            razones = np.full(len(d), np.inf)
+            razones[positivas] = basicas[positivas] / d[positivas]
+            self._pivotear(int(np.argmin(razones)), entrada)
+
+        warnings.warn("Máximo número de cambios de base alcanzado en el barrido.")
+        return "max_iter"
@@ -1,4 +1,6 @@
+from django.conf import settings
 from rest_framework import serializers
+from .campos import a_listas
 from .models import (
     ProblemaSimplex,
     FalsaPosicion,
@@ -8,8 +10,35 @@ from .models import (
     InterpolacionNewton,
 )
 
+# Campos que definen un problema Simplex (los que se pueden enviar en un lote
+# o modificar al clonar)
+CAMPOS_PROBLEMA = [
+    "objetivo",
+    "tipo_optimizacion",
+    "restricciones",
+    "variables_decision",
+    "tolerancia",
+    "max_iteraciones",
+    "tiempo_limite",
+    "motor",
+    "regla_pivoteo",
+    "escalado",
+    "variables_enteras",
+]
+
+
+class TablaSerializerField(serializers.Field):
+    """Tablas y pasos binarios del modelo, expuestos como listas JSON."""
+
+    def to_representation(self, value):
+        return a_listas(value)
+
 
 class SimplexSerializer(serializers.ModelSerializer):
+    tabla_inicial = TablaSerializerField(read_only=True)
+    tabla_final = TablaSerializerField(read_only=True)
+    pasos = TablaSerializerField(read_only=True)
+
     class Meta:
         model = ProblemaSimplex
         fields = "__all__"
@@ -19,20 +48,42 @@ class SimplexSerializer(serializers.ModelSerializer):
             "tabla_final",
             "solucion",
             "grafico_base64",
+            "problema_origen",
+            "iteraciones_evitadas",
+            "tiempo_resolucion",
+            "cancelacion_solicitada",
             "creado",
         ]
 
-    def to_representation(self, instance):
-        """Transforma los datos para la respuesta API"""
-        representation = super().to_representation(instance)
 
-        # Formatea campos complejos si existen
-        if instance.tabla_inicial:
-            representation["tabla_inicial"] = instance.tabla_inicial
-        if instance.tabla_final:
-            representation["tabla_final"] = instance.tabla_final
+class SimplexLoteItemSerializer(serializers.ModelSerializer):
+    """Valida un problema de un lote sin crear el registro."""
+
+    class Meta:
+        model = ProblemaSimplex
+        fields = CAMPOS_PROBLEMA
+
+
+class SimplexLoteSerializer(serializers.Serializer):
+    problemas = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+    trabajadores = serializers.IntegerField(min_value=1, required=False)
+    incluir_pasos = serializers.BooleanField(default=False)
+
+    def validate_problemas(self, value):
+        maximo = getattr(settings, "SIMPLEX_LOTE_MAXIMO", 1000)
+        if len(value) > maximo:
+            raise serializers.ValidationError(
+                f"El lote no puede tener más de {maximo} problemas"
+            )
+        return value
+
 
-        return representation
+class SimplexParametricoSerializer(serializers.Serializer):
+    parametro = serializers.ChoiceField(choices=["rhs", "costo"])
+    # Número de restricción (rhs) o de variable (costo), desde 1
+    indice = serializers.IntegerField(min_value=1)
+    hasta = serializers.FloatField()
+    desde = serializers.FloatField(required=False)
 
 
 class FalsaPosicionSerializer(serializers.ModelSerializer):
@@ -0,0 +1,296 @@
+import numpy as np
+from typing import Dict, List, Sequence
+
+from .formula import LIMITE_PIVOTES_DEGENERADOS
+
+# Estados por problema durante la resolución apilada
+ACTIVO, OPTIMO, NO_ACOTADO, INFACTIBLE, MAX_ITER, INTERRUMPIDO = range(6)
+
+_ERRORES = {
+    NO_ACOTADO: "El problema es no acotado",
+    INFACTIBLE: "El problema no tiene solución factible",
+}
+
+
+class SimplexApilado:
+    """
+    Resuelve muchos problemas lineales pequeños de la misma forma a la vez.
+
+    Las K tablas se apilan en un arreglo de forma (K, m + 2, n + 2m + 1) y
+    se pivotean en paralelo: cada iteración elige columna, fila y pivote de
+    todos los problemas activos con operaciones vectorizadas. Los problemas
+    que terminan (óptimo, no acotado o infactible) salen del conjunto activo.
+
+    Todas las filas tienen una columna de holgura (+1, -1 o 0 según el
+    sentido) y una artificial, de modo que la forma de la tabla no depende
+    de los signos; las artificiales nunca pueden entrar a la base. La fila
+    ``m`` es el objetivo de la fase II y la ``m + 1`` el de la fase I.
+
+    Con ``presupuesto`` (tiempo límite o cancelación, ver ``Presupuesto``)
+    se revisa en cada iteración; al agotarse, los problemas en fase II
+    devuelven su base actual con una advertencia y los que siguen en fase I
+    un error.
+    """
+
+    def __init__(
+        self, tolerancia: float = 1e-6, max_iter: int = 1000, presupuesto=None
+    ):
+        self.tolerancia = tolerancia
+        self.max_iter = max_iter
+        self.presupuesto = presupuesto
+
+    def resolver(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: Sequence,
+        tipo_optimizacion="maximizar",
+    ) -> List[Dict]:
+        """
+        Args:
+            c: Costos, forma (K, n)
+            A: Coeficientes, forma (K, m, n)
+            b: Términos independientes, forma (K, m)
+            desigualdades: Lista de m sentidos comunes a todos los problemas
+                o una lista de K listas
+            tipo_optimizacion: "maximizar"/"minimizar" común o uno por problema
+
+        Returns:
+            Una lista con el resultado de cada problema, en el mismo formato
+            que ``SimplexSolver`` (``error`` si no hay solución óptima).
+        """
+        c = np.array(c, dtype=np.float64)
+        A = np.array(A, dtype=np.float64)
+        b = np.array(b, dtype=np.float64)
+        K, m, n = A.shape
+
+        sentidos = np.asarray(desigualdades)
+        if sentidos.ndim == 1:
+            sentidos = np.broadcast_to(sentidos, (K, m))
+        tipos = np.broadcast_to(np.asarray(tipo_optimizacion), (K,))
+        signo_objetivo = np.where(tipos == "minimizar", -1.0, 1.0)
+
+        self._construir(c * signo_objetivo[:, None], A, b, sentidos)
+        self._iterar()
+
+        valores = self.T[:, m, -1] * signo_objetivo
+        soluciones = np.zeros((K, n))
+        filas, columnas = np.nonzero(self.basicas < n)
+        soluciones[filas, self.basicas[filas, columnas]] = self.T[filas, columnas, -1]
+
+        resultados = []
+        for k in range(K):
+            error = _ERRORES.get(self.estado[k])
+            # Sin terminar la fase I no hay una base factible que devolver
+            if self.estado[k] == MAX_ITER and self.fase[k] == 1:
+                error = "Máximo número de iteraciones alcanzado en Fase I."
+            if self.estado[k] == INTERRUMPIDO and self.fase[k] == 1:
+                error = self.presupuesto.error_sin_base()
+            if error is not None:
+                resultados.append(
+                    {
+                        "error": error,
+                        "solucion": None,
+                        "valor_optimo": None,
+                        "iteraciones": int(self.iteraciones[k]),
+                    }
+                )
+                continue
+            resultado = {
+                "solucion": soluciones[k].tolist(),
+                "valor_optimo": float(valores[k]),
+                "iteraciones": int(self.iteraciones[k]),
+                "variables_basicas": self.basicas[k].tolist(),
+            }
+            if self.estado[k] == MAX_ITER:
+                resultado["warning"] = (
+                    "Máximo número de iteraciones alcanzado. Solución puede no ser óptima."
+                )
+            elif self.estado[k] == INTERRUMPIDO:
+                resultado["warning"] = self.presupuesto.advertencia()
+                resultado["interrupcion"] = {
+                    "motivo": self.presupuesto.motivo,
+                    "tiempo": self.presupuesto.transcurrido(),
+                }
+            resultados.append(resultado)
+        return resultados
+
+    def _construir(self, c, A, b, sentidos):
+        K, m, n = A.shape
+        self.m, self.n = m, n
+        columnas = n + 2 * m
+
+        # Restricciones con b < 0 se multiplican por -1
+        negativos = b < 0
+        A = np.where(negativos[:, :, None], -A, A)
+        b = np.abs(b)
+        signo_holgura = np.where(
+            sentidos == "<=", 1.0, np.where(sentidos == ">=", -1.0, 0.0)
+        )
+        signo_holgura = np.where(negativos, -signo_holgura, signo_holgura)
+
+        T = np.zeros((K, m + 2, columnas + 1))
+        filas = np.arange(m)
+        T[:, :m, :n] = A
+        T[:, filas, n + filas] = signo_holgura
+        T[:, filas, n + m + filas] = 1.0
+        T[:, :m, -1] = b
+        T[:, m, :n] = -c
+
+        # Base inicial: holgura si su coeficiente es +1, si no la artificial
+        usa_holgura = signo_holgura > 0
+        self.basicas = np.where(usa_holgura, n + filas, n + m + filas)
+
+        # Fase I: minimizar la suma de artificiales básicas (costo +1),
+        # expresada en términos de las no básicas
+        artificiales = ~usa_holgura
+        T[:, m + 1, n + m : columnas] = np.where(artificiales, 1.0, 0.0)
+        T[:, m + 1] -= np.einsum("km,kmj->kj", artificiales.astype(float), T[:, :m])
+
+        self.T = T
+        self.permitidas = np.ones(columnas, dtype=bool)
+        self.permitidas[n + m :] = False
+        self.fase = np.where(artificiales.any(axis=1), 1, 2)
+        self.estado = np.full(K, ACTIVO)
+        self.iteraciones = np.zeros(K, dtype=np.int64)
+        self.degenerados = np.zeros(K, dtype=np.int64)
+
+    def _iterar(self):
+        m, tol = self.m, self.tolerancia
+        while True:
+            activos = np.flatnonzero(self.estado == ACTIVO)
+            if activos.size == 0:
+                return
+            if self.presupuesto is not None and self.presupuesto.agotado():
+                self.estado[activos] = INTERRUMPIDO
+                return
+
+            T = self.T[activos]
+            fila_objetivo = np.where(self.fase[activos] == 1, m + 1, m)
+            reducidos = T[np.arange(activos.size), fila_objetivo, :-1]
+            reducidos = np.where(self.permitidas, reducidos, np.inf)
+
+            # Dantzig; Bland para los problemas con muchos pivotes degenerados
+            mejora = reducidos < -tol
+            bland = self.degenerados[activos] >= LIMITE_PIVOTES_DEGENERADOS
+            columna = np.where(
+                bland, np.argmax(mejora, axis=1), np.argmin(reducidos, axis=1)
+            )
+            optimos = ~mejora.any(axis=1)
+
+            if optimos.any():
+                self._fin_de_fase(activos[optimos])
+            if self.iteraciones[activos].max(initial=0) >= self.max_iter:
+                agotados = activos[self.iteraciones[activos] >= self.max_iter]
+                self.estado[agotados[self.estado[agotados] == ACTIVO]] = MAX_ITER
+
+            seguir = ~optimos & (self.iteraciones[activos] < self.max_iter)
+            if not seguir.any():
+                continue
+            activos, T, columna = activos[seguir], T[seguir], columna[seguir]
+            indices = np.arange(activos.size)
+
+            # Prueba de la razón mínima vectorizada
+            alpha = T[indices, :m, columna]
+            rhs = T[:, :m, -1]
+            positivos = alpha > tol
+            razones = np.where(
+                positivos,
+                np.maximum(rhs, 0.0) / np.where(positivos, alpha, 1.0),
+                np.inf,
+            )
+            fila = np.argmin(razones, axis=1)
+            acotados = positivos.any(axis=1)
+            if not acotados.all():
+                sin_cota = activos[~acotados]
+                # La fase I siempre está acotada; solo ocurre por errores numéricos
+                self.estado[sin_cota] = np.where(
+                    self.fase[sin_cota] == 1, INFACTIBLE, NO_ACOTADO
+                )
+                activos, T, columna, fila = (
+                    activos[acotados],
+                    T[acotados],
+                    columna[acotados],
+                    fila[acotados],
+                )
+                indices = np.arange(activos.size)
+                if activos.size == 0:
+                    continue
+
+            degenerado = razones[acotados][indices, fila] <= tol
+            self.degenerados[activos] = np.where(
+                degenerado, self.degenerados[activos] + 1, 0
+            )
+
+            self._pivotear(activos, T, fila, columna)
+            self.basicas[activos, fila] = columna
+            self.iteraciones[activos] += 1
+
+    def _pivotear(self, activos, T, fila, columna):
+        indices = np.arange(activos.size)
+        fila_pivote = T[indices, fila] / T[indices, fila, columna][:, None]
+        factores = T[indices, :, columna]
+        T -= factores[:, :, None] * fila_pivote[:, None, :]
+        T[indices, fila] = fila_pivote
+        self.T[activos] = T
+
+    def _fin_de_fase(self, optimos):
+        m, n, tol = self.m, self.n, self.tolerancia
+        en_fase_I = optimos[self.fase[optimos] == 1]
+        self.estado[optimos[self.fase[optimos] == 2]] = OPTIMO
+        if en_fase_I.size == 0:
+            return
+
+        # Suma de artificiales (fila de fase I) distinta de cero: infactible
+        infactibles = self.T[en_fase_I, m + 1, -1] < -tol
+        self.estado[en_fase_I[infactibles]] = INFACTIBLE
+        pasan = en_fase_I[~infactibles]
+        self.fase[pasan] = 2
+        self.degenerados[pasan] = 0
+
+        # Artificiales básicas en nivel cero: se sacan si la fila lo permite
+        for k in pasan:
+            for r in np.flatnonzero(self.basicas[k] >= n + m):
+                candidatas = np.flatnonzero(np.abs(self.T[k, r, : n + m]) > tol)
+                if candidatas.size:
+                    j = candidatas[0]
+                    self._pivotear(
+                        np.array([k]), self.T[k : k + 1], np.array([r]), np.array([j])
+                    )
+                    self.basicas[k, r] = j
+
+
+def resolver_apilado(
+    problemas: List[Dict],
+    tolerancia: float = 1e-6,
+    max_iter: int = 1000,
+    presupuesto=None,
+) -> List[Dict]:
+    """
+    Resuelve una lista de problemas ya parseados agrupándolos por forma.
+
+    Cada problema es un diccionario con ``c``, ``A``, ``b``,
+    ``desigualdades`` y ``tipo_optimizacion``. Los resultados se devuelven en
+    el orden de entrada. ``presupuesto`` se comparte entre todos los
+    grupos.
+    """
+    grupos: Dict[tuple, List[int]] = {}
+    for indice, problema in enumerate(problemas):
+        forma = np.shape(problema["A"])
+        grupos.setdefault(forma, []).append(indice)
+
+    resultados: List[Dict] = [None] * len(problemas)
+    solver = SimplexApilado(tolerancia, max_iter, presupuesto)
+    for indices in grupos.values():
+        grupo = [problemas[i] for i in indices]
+        salida = solver.resolver(
+            [p["c"] for p in grupo],
+            [p["A"] for p in grupo],
+            [p["b"] for p in grupo],
+            [list(p["desigualdades"]) for p in grupo],
+            [p["tipo_optimizacion"] for p in grupo],
+        )
+        for i, resultado in zip(indices, salida):
+            resultados[i] = resultado
+    return resultados
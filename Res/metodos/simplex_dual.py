@@ -0,0 +1,102 @@
+import warnings
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from .registro_pasos import EspacioPivoteo, pivotear_tabla
+
+
+def agregar_restriccion(
+    tabla: np.ndarray,
+    variables_basicas: List[int],
+    coeficientes: np.ndarray,
+    sentido: str,
+    rhs: float,
+) -> np.ndarray:
+    """
+    Agrega a una tabla óptima la restricción ``coeficientes · x (<= | >=) rhs``
+    sobre las variables originales, con una holgura nueva que entra a la base.
+    La fila se expresa en la base actual, así que la tabla sigue siendo dual
+    factible y puede reoptimizarse con ``simplex_dual``.
+
+    Devuelve la tabla nueva (una fila y una columna más) y agrega la holgura
+    a ``variables_basicas``.
+    """
+    if sentido not in ("<=", ">="):
+        raise ValueError(f"Sentido de restricción no admitido: {sentido}")
+    filas, columnas = tabla.shape
+    nueva = np.zeros((filas + 1, columnas + 1))
+    nueva[:-2, :-2] = tabla[:-1, :-1]
+    nueva[:-2, -1] = tabla[:-1, -1]
+    nueva[-1, :-2] = tabla[-1, :-1]
+    nueva[-1, -1] = tabla[-1, -1]
+
+    # Una restricción >= se agrega como -a x <= -rhs
+    signo = 1.0 if sentido == "<=" else -1.0
+    fila = np.zeros(columnas + 1)
+    fila[: len(coeficientes)] = signo * np.asarray(coeficientes, dtype=np.float64)
+    fila[-2] = 1.0
+    fila[-1] = signo * rhs
+    for i, j in enumerate(variables_basicas):
+        if fila[j] != 0:
+            fila -= fila[j] * nueva[i]
+    nueva[-2] = fila
+
+    variables_basicas.append(columnas - 1)
+    return nueva
+
+
+def simplex_dual(
+    tabla: np.ndarray,
+    variables_basicas: List[int],
+    tolerancia: float = 1e-9,
+    max_iter: int = 1000,
+    permitidas: Optional[np.ndarray] = None,
+    al_pivotear: Optional[Callable[[int, int, int], None]] = None,
+    presupuesto=None,
+) -> int:
+    """
+    Reoptimiza con el Simplex dual una tabla dual factible (costos reducidos
+    no negativos) cuyo lado derecho tiene valores negativos. Modifica la
+    tabla in situ y devuelve el número de pivotes.
+
+    ``permitidas`` marca las columnas que pueden entrar a la base (las
+    artificiales no deben volver a hacerlo). ``al_pivotear(fila, columna,
+    sale)`` se llama después de cada pivote (p. ej. para el registro de pasos).
+    Con ``presupuesto`` (ver ``Presupuesto``) se revisa en cada iteración:
+    las bases intermedias no son primal factibles, así que al agotarse se
+    lanza un ValueError en lugar de devolver una solución.
+    """
+    iteracion = 0
+    espacio = EspacioPivoteo()
+    while True:
+        rhs = tabla[:-1, -1]
+        fila = int(np.argmin(rhs))
+        if rhs[fila] >= -tolerancia:
+            return iteracion
+
+        if iteracion >= max_iter:
+            warnings.warn("Máximo número de iteraciones alcanzado en el Simplex dual.")
+            return iteracion
+        if presupuesto is not None and presupuesto.agotado():
+            raise ValueError(presupuesto.error_sin_base())
+        iteracion += 1
+
+        alfa = tabla[fila, :-1]
+        candidatas = alfa < -tolerancia
+        if permitidas is not None:
+            candidatas &= permitidas
+        if not candidatas.any():
+            raise ValueError("El problema no tiene solución factible")
+
+        # Prueba de la razón dual: conserva los costos reducidos >= 0
+        costos = np.maximum(tabla[-1, :-1], 0.0)
+        razones = np.full(len(alfa), np.inf)
+        razones[candidatas] = costos[candidatas] / -alfa[candidatas]
+        columna = int(np.argmin(razones))
+
+        sale = variables_basicas[fila]
+        variables_basicas[fila] = columna
+        pivotear_tabla(tabla, fila, columna, espacio)
+        if al_pivotear is not None:
+            al_pivotear(fila, columna, sale)
@@ -0,0 +1,646 @@
+import numpy as np
+from typing import List, Tuple, Dict, Optional, Union
+import warnings
+
+from .matriz_dispersa import MatrizCSC
+from .pivoteo import ReglaBland, crear_regla, razon_harris, razon_minima
+
+# El modo disperso se activa automáticamente para matrices grandes que son poco
+# densas o tienen al menos tantas filas como columnas: la base solo se
+# factoriza en las columnas estructurales y las holguras quedan implícitas
+TAMANO_MINIMO_DISPERSO = 2_000
+DENSIDAD_MAXIMA_DISPERSA = 0.05
+
+# Número de condición (estimado con los pivotes de U) a partir del cual la
+# base se considera singular, como múltiplo de 1 / tolerancia de la
+# factorización
+CONDICION_MAXIMA = 1.0
+
+# Columnas por bloque de la factorización LU y de las sustituciones
+TAMANO_BLOQUE = 64
+
+
+def forma_estandar(
+    A: np.ndarray, desigualdades: List[str]
+) -> Tuple[np.ndarray, List[int], int]:
+    """
+    Construye la matriz de restricciones en forma estándar.
+
+    Las columnas siguen el mismo orden que la tabla Simplex:
+    variables de decisión, holgura/exceso y artificiales.
+
+    Returns:
+        tuple: (matriz ampliada, variables básicas iniciales, índice de la
+        primera columna artificial)
+    """
+    num_restr, num_vars = A.shape
+    num_holgura = sum(1 for d in desigualdades if d in ["<=", ">="])
+    num_artificiales = sum(1 for d in desigualdades if d in [">=", "="])
+    inicio_artificiales = num_vars + num_holgura
+
+    M = np.zeros((num_restr, inicio_artificiales + num_artificiales))
+    M[:, :num_vars] = A
+    variables_basicas = []
+
+    idx_holgura = 0
+    idx_artificial = 0
+    for i, desigualdad in enumerate(desigualdades):
+        if desigualdad == "<=":
+            M[i, num_vars + idx_holgura] = 1
+            variables_basicas.append(num_vars + idx_holgura)
+            idx_holgura += 1
+        elif desigualdad == ">=":
+            M[i, num_vars + idx_holgura] = -1
+            M[i, inicio_artificiales + idx_artificial] = 1
+            variables_basicas.append(inicio_artificiales + idx_artificial)
+            idx_holgura += 1
+            idx_artificial += 1
+        elif desigualdad == "=":
+            M[i, inicio_artificiales + idx_artificial] = 1
+            variables_basicas.append(inicio_artificiales + idx_artificial)
+            idx_artificial += 1
+
+    return M, variables_basicas, inicio_artificiales
+
+
+class FormaEstandar:
+    """Matriz [A | holguras | artificiales] almacenada de forma densa."""
+
+    disperso = False
+
+    def __init__(self, A: np.ndarray, desigualdades: List[str]):
+        self.M, self.basicas_iniciales, self.inicio_artificiales = forma_estandar(
+            A, desigualdades
+        )
+        self.num_filas, self.num_columnas = self.M.shape
+
+    def columna(self, j: int) -> np.ndarray:
+        return self.M[:, j]
+
+    def columnas(self, lista: List[int]) -> np.ndarray:
+        return self.M[:, lista]
+
+    def precios(self, y: np.ndarray) -> np.ndarray:
+        """Calcula y^T M para todas las columnas."""
+        return y @ self.M
+
+    def normas_columnas(self) -> np.ndarray:
+        return np.einsum("ij,ij->j", self.M, self.M)
+
+
+class FormaEstandarDispersa:
+    """
+    Forma estándar con A en CSC y columnas de holgura/artificiales implícitas.
+
+    Cada columna implícita es ``signo * e_fila``, así que solo se guardan dos
+    vectores de enteros en lugar del bloque identidad de m x m.
+    """
+
+    disperso = True
+
+    def __init__(self, A: MatrizCSC, desigualdades: List[str]):
+        self.A = A
+        self.num_filas, num_vars = A.forma
+
+        filas_holgura, signos_holgura, filas_artificiales = [], [], []
+        for i, desigualdad in enumerate(desigualdades):
+            if desigualdad in ["<=", ">="]:
+                filas_holgura.append(i)
+                signos_holgura.append(1.0 if desigualdad == "<=" else -1.0)
+            if desigualdad in [">=", "="]:
+                filas_artificiales.append(i)
+
+        self.inicio_artificiales = num_vars + len(filas_holgura)
+        self.num_columnas = self.inicio_artificiales + len(filas_artificiales)
+        self.fila_unitaria = np.array(
+            filas_holgura + filas_artificiales, dtype=np.int64
+        )
+        self.signo_unitaria = np.array(signos_holgura + [1.0] * len(filas_artificiales))
+
+        # Base inicial: la holgura de cada fila <= o la artificial de las demás
+        self.basicas_iniciales = [0] * self.num_filas
+        for k, i in enumerate(filas_artificiales):
+            self.basicas_iniciales[i] = self.inicio_artificiales + k
+        for k, i in enumerate(filas_holgura):
+            if signos_holgura[k] > 0:
+                self.basicas_iniciales[i] = num_vars + k
+
+    def columna(self, j: int) -> np.ndarray:
+        num_vars = self.A.forma[1]
+        if j < num_vars:
+            return self.A.columna(j)
+        v = np.zeros(self.num_filas)
+        v[self.fila_unitaria[j - num_vars]] = self.signo_unitaria[j - num_vars]
+        return v
+
+    def columnas(self, lista: List[int]) -> np.ndarray:
+        return np.column_stack([self.columna(j) for j in lista])
+
+    def precios(self, y: np.ndarray) -> np.ndarray:
+        """Calcula y^T M: producto disperso para A y directo para las unitarias."""
+        return np.concatenate(
+            [
+                self.A.producto_transpuesto(y),
+                self.signo_unitaria * y[self.fila_unitaria],
+            ]
+        )
+
+    def normas_columnas(self) -> np.ndarray:
+        normas_A = np.bincount(
+            self.A._columna_de, weights=self.A.datos**2, minlength=self.A.forma[1]
+        )
+        return np.concatenate([normas_A, np.ones(self.fila_unitaria.size)])
+
+
+class FactorizacionLU:
+    """
+    Factorización LU de la matriz básica con actualizaciones en forma producto.
+
+    Al refactorizar se calcula PB = LU con pivoteo parcial por bloques de
+    ``TAMANO_BLOQUE`` columnas: dentro del bloque se elimina columna por
+    columna y el resto de la matriz se actualiza con un producto de
+    matrices. FTRAN y BTRAN resuelven los triángulos también por bloques.
+    Cada pivote agrega una matriz eta en lugar de refactorizar; cuando se
+    acumulan ``frecuencia_refactorizacion`` etas la base se vuelve a
+    factorizar para controlar el error numérico y el costo de FTRAN/BTRAN.
+    """
+
+    def __init__(self, tolerancia: float = 1e-11, frecuencia_refactorizacion: int = 50):
+        self.tolerancia = tolerancia
+        self.frecuencia_refactorizacion = frecuencia_refactorizacion
+        self.LU = None
+        self.permutacion = None
+        self.etas: List[Tuple[int, np.ndarray]] = []
+        self.refactorizaciones = 0
+
+    def factorizar(self, B: np.ndarray):
+        """Calcula PB = LU con pivoteo parcial y descarta las etas acumuladas."""
+        LU = np.array(B, dtype=np.float64, copy=True)
+        m = LU.shape[0]
+        permutacion = np.arange(m)
+        escala = np.abs(LU).max(initial=0.0)
+
+        for inicio in range(0, m, TAMANO_BLOQUE):
+            fin = min(inicio + TAMANO_BLOQUE, m)
+            for k in range(inicio, fin):
+                p = k + int(np.argmax(np.abs(LU[k:, k])))
+                if abs(LU[p, k]) <= self.tolerancia * escala:
+                    raise ValueError("La matriz básica es singular")
+                if p != k:
+                    LU[[k, p]] = LU[[p, k]]
+                    permutacion[[k, p]] = permutacion[[p, k]]
+                LU[k + 1 :, k] /= LU[k, k]
+                LU[k + 1 :, k + 1 : fin] -= np.outer(LU[k + 1 :, k], LU[k, k + 1 : fin])
+            if fin < m:
+                L11 = np.tril(LU[inicio:fin, inicio:fin], -1) + np.eye(fin - inicio)
+                LU[inicio:fin, fin:] = np.linalg.solve(L11, LU[inicio:fin, fin:])
+                LU[fin:, fin:] -= LU[fin:, inicio:fin] @ LU[inicio:fin, fin:]
+
+        # Cota inferior del número de condición: cociente de los pivotes
+        diagonal = np.abs(np.diag(LU))
+        if m and diagonal.min() * CONDICION_MAXIMA < self.tolerancia * diagonal.max():
+            raise ValueError("La matriz básica es singular")
+
+        self.LU, self.permutacion = LU, permutacion
+        # Inversas de los bloques diagonales triangulares de L (diagonal
+        # unitaria) y U: las sustituciones por bloques se reducen a productos
+        # de matrices, sin invertir nunca la base completa
+        self.bloques = []
+        for inicio in range(0, m, TAMANO_BLOQUE):
+            fin = min(inicio + TAMANO_BLOQUE, m)
+            diagonal = LU[inicio:fin, inicio:fin]
+            identidad = np.eye(fin - inicio)
+            L = np.linalg.solve(np.tril(diagonal, -1) + identidad, identidad)
+            U = np.linalg.solve(np.triu(diagonal), identidad)
+            self.bloques.append((inicio, fin, L, U))
+        self.etas = []
+        self.refactorizaciones += 1
+
+    @property
+    def requiere_refactorizacion(self) -> bool:
+        return len(self.etas) >= self.frecuencia_refactorizacion
+
+    def ftran(self, v: np.ndarray) -> np.ndarray:
+        """Resuelve B x = v (v puede ser un vector o una matriz de columnas)."""
+        x = self._resolver_base(np.asarray(v, dtype=np.float64))
+        for fila, eta in self.etas:
+            valor = x[fila].copy()
+            x += np.multiply.outer(eta, valor)
+            x[fila] = eta[fila] * valor
+        return x
+
+    def btran(self, v: np.ndarray) -> np.ndarray:
+        """Resuelve B^T y = v."""
+        y = np.array(v, dtype=np.float64, copy=True)
+        for fila, eta in reversed(self.etas):
+            y[fila] = eta @ y
+        return self._resolver_base_transpuesta(y)
+
+    def actualizar(self, fila: int, alpha: np.ndarray):
+        """Registra el cambio de la columna ``fila`` de la base (alpha = B^-1 a_q)."""
+        pivote = alpha[fila]
+        if abs(pivote) < self.tolerancia:
+            raise ValueError(
+                "Elemento pivote demasiado pequeño para actualizar la base"
+            )
+        eta = -alpha / pivote
+        eta[fila] = 1.0 / pivote
+        self.etas.append((fila, eta))
+
+    def _resolver_base(self, v: np.ndarray) -> np.ndarray:
+        """Resuelve B0 x = v con la última factorización (sin etas): L U x = P v."""
+        x = v[self.permutacion]
+        LU = self.LU
+        for inicio, fin, L, _ in self.bloques:
+            x[inicio:fin] = L @ x[inicio:fin]
+            x[fin:] -= LU[fin:, inicio:fin] @ x[inicio:fin]
+        for inicio, fin, _, U in reversed(self.bloques):
+            x[inicio:fin] = U @ x[inicio:fin]
+            x[:inicio] -= LU[:inicio, inicio:fin] @ x[inicio:fin]
+        return x
+
+    def _resolver_base_transpuesta(self, v: np.ndarray) -> np.ndarray:
+        """Resuelve B0^T y = v: U^T L^T (P y) = v."""
+        w = np.array(v, dtype=np.float64, copy=True)
+        LU = self.LU
+        for inicio, fin, _, U in self.bloques:
+            w[inicio:fin] = U.T @ w[inicio:fin]
+            w[fin:] -= LU[inicio:fin, fin:].T @ w[inicio:fin]
+        for inicio, fin, L, _ in reversed(self.bloques):
+            w[inicio:fin] = L.T @ w[inicio:fin]
+            w[:inicio] -= LU[inicio:fin, :inicio].T @ w[inicio:fin]
+        y = np.empty_like(w)
+        y[self.permutacion] = w
+        return y
+
+
+class FactorizacionNucleo(FactorizacionLU):
+    """
+    Factorización para el modo disperso.
+
+    Las columnas básicas de holgura/artificiales son vectores unitarios, así
+    que solo se factoriza el núcleo formado por las columnas estructurales
+    básicas y las filas que no cubre ninguna holgura (k x k, con k <= n).
+    El resto de la solución se obtiene por sustitución directa.
+    """
+
+    def factorizar_nucleo(self, forma: FormaEstandarDispersa, basicas: List[int]):
+        num_vars = forma.A.forma[1]
+        basicas = np.asarray(basicas, dtype=np.int64)
+
+        self.pos_estructurales = np.flatnonzero(basicas < num_vars)
+        self.pos_unitarias = np.flatnonzero(basicas >= num_vars)
+        implicitas = basicas[self.pos_unitarias] - num_vars
+        self.filas_unitarias = forma.fila_unitaria[implicitas]
+        self.signos_unitarios = forma.signo_unitaria[implicitas]
+
+        cubiertas = np.zeros(forma.num_filas, dtype=bool)
+        cubiertas[self.filas_unitarias] = True
+        if cubiertas.sum() != self.filas_unitarias.size:
+            raise ValueError("La matriz básica es singular")
+        self.filas_nucleo = np.flatnonzero(~cubiertas)
+
+        self.B_K = forma.A.submatriz_columnas(basicas[self.pos_estructurales])
+        k = self.pos_estructurales.size
+        if self.filas_nucleo.size != k:
+            raise ValueError("La matriz básica es singular")
+
+        # Extraer el bloque denso k x k directamente desde el formato CSC
+        fila_en_nucleo = np.full(forma.num_filas, -1, dtype=np.int64)
+        fila_en_nucleo[self.filas_nucleo] = np.arange(k)
+        destino = fila_en_nucleo[self.B_K.indices]
+        en_nucleo = destino >= 0
+        nucleo = np.zeros((k, k))
+        nucleo[destino[en_nucleo], self.B_K._columna_de[en_nucleo]] = self.B_K.datos[
+            en_nucleo
+        ]
+        self.factorizar(nucleo)
+
+    def _resolver_base(self, v: np.ndarray) -> np.ndarray:
+        # v puede ser un vector o una matriz de columnas (como en ftran)
+        x = np.zeros(v.shape)
+        x_K = super()._resolver_base(v[self.filas_nucleo])
+        x[self.pos_estructurales] = x_K
+        if x_K.ndim == 1:
+            aporte = self.B_K.producto(x_K)
+        else:
+            aporte = np.column_stack([self.B_K.producto(col) for col in x_K.T])
+        signos = self.signos_unitarios.reshape((-1,) + (1,) * (v.ndim - 1))
+        x[self.pos_unitarias] = (
+            v[self.filas_unitarias] - aporte[self.filas_unitarias]
+        ) / signos
+        return x
+
+    def _resolver_base_transpuesta(self, v: np.ndarray) -> np.ndarray:
+        y = np.zeros(v.shape[0])
+        y[self.filas_unitarias] = v[self.pos_unitarias] / self.signos_unitarios
+        resto = v[self.pos_estructurales] - self.B_K.producto_transpuesto(y)
+        y[self.filas_nucleo] = super()._resolver_base_transpuesta(resto)
+        return y
+
+
+class SimplexRevisado:
+    """
+    Método Simplex revisado en dos fases.
+
+    En lugar de pivotear la tabla completa mantiene solo la factorización de
+    la base, de modo que cada iteración resuelve dos sistemas (BTRAN y FTRAN)
+    y calcula los costos reducidos de las columnas no básicas.
+
+    Con ``disperso=True`` la matriz A se guarda en CSC y las columnas de
+    holgura/artificiales quedan implícitas; con ``None`` el modo se elige
+    según el tamaño y la densidad de A.
+    """
+
+    def __init__(
+        self,
+        tolerancia: float = 1e-6,
+        max_iter: int = 1000,
+        verbose: bool = False,
+        frecuencia_refactorizacion: int = 50,
+        disperso: Optional[bool] = None,
+        regla_pivoteo: str = "dantzig",
+        limite_degenerados: int = 20,
+        prueba_razon: str = "harris",
+        registro: str = "resumen",
+        presupuesto=None,
+    ):
+        self.tolerancia = tolerancia
+        self.max_iter = max_iter
+        self.verbose = verbose
+        self.frecuencia_refactorizacion = frecuencia_refactorizacion
+        self.disperso = disperso
+        self.regla = crear_regla(regla_pivoteo, tolerancia)
+        self.regla_bland = ReglaBland(tolerancia)
+        self.limite_degenerados = limite_degenerados
+        self.prueba_razon = prueba_razon
+        # Sin tablas intermedias, "resumen", "muestreo" y "completo" guardan
+        # la tabla inicial y la final; "ninguno" no construye tablas
+        self.registro = registro
+        # Presupuesto de tiempo/cancelación de SimplexSolver (opcional)
+        self.presupuesto = presupuesto
+
+    def _usar_disperso(self, A: Union[np.ndarray, MatrizCSC]) -> bool:
+        if self.disperso is not None:
+            return self.disperso
+        if isinstance(A, MatrizCSC):
+            return True
+        return A.size >= TAMANO_MINIMO_DISPERSO and (
+            A.shape[0] >= A.shape[1]
+            or np.count_nonzero(A) <= DENSIDAD_MAXIMA_DISPERSA * A.size
+        )
+
+    def resolver(
+        self,
+        c: np.ndarray,
+        A: Union[np.ndarray, MatrizCSC],
+        b: np.ndarray,
+        desigualdades: List[str],
+    ) -> Dict:
+        """
+        Maximiza c^T x sujeto a las restricciones dadas (b >= 0).
+
+        Returns:
+            dict: Mismo formato que ``SimplexSolver._ejecutar_simplex``. En modo
+            disperso o con ``registro="ninguno"`` no se construyen tablas
+            densas: ``pasos`` queda vacío y ``tabla_final`` es None.
+        """
+        num_vars = len(c)
+        if self._usar_disperso(A):
+            if not isinstance(A, MatrizCSC):
+                A = MatrizCSC.desde_densa(A)
+            self.forma = FormaEstandarDispersa(A, desigualdades)
+            self.lu = FactorizacionNucleo(
+                frecuencia_refactorizacion=self.frecuencia_refactorizacion
+            )
+        else:
+            if isinstance(A, MatrizCSC):
+                A = A.a_densa()
+            self.forma = FormaEstandar(A, desigualdades)
+            self.lu = FactorizacionLU(
+                frecuencia_refactorizacion=self.frecuencia_refactorizacion
+            )
+
+        inicio_artificiales = self.forma.inicio_artificiales
+        num_columnas = self.forma.num_columnas
+        self.b = b
+        self.basicas = list(self.forma.basicas_iniciales)
+        self._refactorizar()
+        # La base inicial es la identidad: ||B^-1 a_j|| = ||a_j||. Los pesos
+        # solo dependen de la base, así que se conservan entre Fase I y II.
+        self.regla.reiniciar(self.forma.normas_columnas())
+        self.degenerados_consecutivos = 0
+        self.pivotes_bland = 0
+        self.pivotes_degenerados = 0
+        self.pivotes_estancados = 0
+
+        costos = np.zeros(num_columnas)
+        costos[:num_vars] = c
+
+        pasos = []
+        construir_tablas = not self.forma.disperso and self.registro != "ninguno"
+        if construir_tablas:
+            pasos.append(
+                {
+                    "titulo": "Tabla inicial",
+                    "tabla": self._tabla_inicial(costos).tolist(),
+                    "variables_basicas": self.basicas.copy(),
+                    "explicacion": "Tabla inicial con variables de holgura/exceso/artificiales",
+                }
+            )
+
+        iteraciones = 0
+        hay_artificiales = inicio_artificiales < num_columnas
+
+        # Fase I: maximizar -(suma de artificiales)
+        if hay_artificiales:
+            if self.verbose:
+                print("\nIniciando Fase I (revisado)...")
+            costos_fase_I = np.zeros(num_columnas)
+            costos_fase_I[inicio_artificiales:] = -1.0
+            iteraciones += self._iterar(
+                costos_fase_I, np.ones(num_columnas, dtype=bool), "Fase I"
+            )
+
+            if costos_fase_I[self.basicas] @ self.x_B < -self.tolerancia:
+                raise ValueError("El problema no tiene solución factible")
+
+            self._expulsar_artificiales(inicio_artificiales)
+
+        # Fase II: las artificiales no pueden volver a entrar
+        if self.verbose:
+            print("\nIniciando Fase II (revisado)...")
+        permitidas = np.zeros(num_columnas, dtype=bool)
+        permitidas[:inicio_artificiales] = True
+        iteraciones += self._iterar(costos, permitidas, "Fase II")
+
+        solucion = [0.0] * num_vars
+        for i, j in enumerate(self.basicas):
+            if j < num_vars:
+                solucion[j] = float(self.x_B[i])
+
+        if not construir_tablas:
+            tabla_final, variables_basicas = None, list(self.basicas)
+        else:
+            tabla_final, variables_basicas = self._tabla_final(
+                costos, inicio_artificiales if hay_artificiales else None
+            )
+            tabla_final = tabla_final.tolist()
+            pasos.append(
+                {
+                    "titulo": "Tabla final",
+                    "tabla": tabla_final,
+                    "variables_basicas": variables_basicas,
+                    "explicacion": f"Tabla reconstruida desde la base factorizada tras {iteraciones} pivotes",
+                }
+            )
+
+        return {
+            "solucion": solucion,
+            "valor_optimo": float(costos[self.basicas] @ self.x_B),
+            "iteraciones": iteraciones,
+            "pasos": pasos,
+            "tabla_final": tabla_final,
+            "variables_basicas": variables_basicas,
+            "refactorizaciones": self.lu.refactorizaciones,
+            "disperso": self.forma.disperso,
+            "regla_pivoteo": self.regla.nombre,
+            "pivotes_bland": self.pivotes_bland,
+            "pivotes_degenerados": self.pivotes_degenerados,
+            "pivotes_estancados": self.pivotes_estancados,
+        }
+
+    def _refactorizar(self):
+        if self.forma.disperso:
+            self.lu.factorizar_nucleo(self.forma, self.basicas)
+        else:
+            self.lu.factorizar(self.forma.columnas(self.basicas))
+        self.x_B = self.lu.ftran(self.b)
+
+    def _iterar(self, costos: np.ndarray, permitidas: np.ndarray, fase: str) -> int:
+        """Itera hasta optimalidad para los costos dados; devuelve los pivotes."""
+        pivotes = 0
+        while True:
+            y = self.lu.btran(costos[self.basicas])
+            # Convención de la fila objetivo de la tabla: negativo = mejora
+            reducidos = self.forma.precios(y) - costos
+            reducidos[self.basicas] = 0.0
+
+            if self.degenerados_consecutivos >= self.limite_degenerados:
+                col_pivote = self.regla_bland.seleccionar(reducidos, permitidas)
+                if col_pivote != -1:
+                    self.pivotes_bland += 1
+            else:
+                col_pivote = self.regla.seleccionar(reducidos, permitidas)
+            if col_pivote == -1:
+                return pivotes
+
+            if pivotes >= self.max_iter:
+                warnings.warn(
+                    "Máximo número de iteraciones alcanzado. Solución puede no ser óptima."
+                )
+                return pivotes
+
+            if self.presupuesto is not None and self.presupuesto.agotado():
+                if fase == "Fase I":
+                    raise ValueError(self.presupuesto.error_sin_base())
+                return pivotes
+
+            alpha = self.lu.ftran(self.forma.columna(col_pivote))
+            fila_pivote = self._razon_minima(alpha)
+
+            if fila_pivote == -1:
+                if fase == "Fase I":
+                    raise ValueError("Problema no factible (Fase I no acotada)")
+                raise ValueError("El problema es no acotado")
+
+            self._pivotear(fila_pivote, col_pivote, alpha)
+            pivotes += 1
+
+            if self.verbose:
+                print(
+                    f"{fase} - Iteración {pivotes}: Pivote en fila {fila_pivote}, columna {col_pivote}"
+                )
+
+    def _razon_minima(self, alpha: np.ndarray) -> int:
+        if self.degenerados_consecutivos >= self.limite_degenerados:
+            return razon_minima(self.x_B, alpha, self.tolerancia, self.basicas)
+        if self.prueba_razon == "estandar":
+            return razon_minima(self.x_B, alpha, self.tolerancia)
+        return razon_harris(self.x_B, alpha, self.tolerancia)
+
+    def _pivotear(self, fila_pivote: int, col_pivote: int, alpha: np.ndarray):
+        if self.regla.requiere_fila_pivote:
+            e = np.zeros(len(self.basicas))
+            e[fila_pivote] = 1.0
+            self.regla.actualizar(
+                self.forma.precios(self.lu.btran(e)),
+                alpha,
+                col_pivote,
+                self.basicas[fila_pivote],
+                fila_pivote,
+                lambda v: self.forma.precios(self.lu.btran(v)),
+            )
+
+        theta = max(self.x_B[fila_pivote], 0.0) / alpha[fila_pivote]
+        if theta <= self.tolerancia:
+            self.degenerados_consecutivos += 1
+            self.pivotes_degenerados += 1
+            # Los pivotes de una racha que llega al límite son estancados
+            if self.degenerados_consecutivos == self.limite_degenerados:
+                self.pivotes_estancados += self.limite_degenerados
+            elif self.degenerados_consecutivos > self.limite_degenerados:
+                self.pivotes_estancados += 1
+        else:
+            self.degenerados_consecutivos = 0
+        self.x_B -= theta * alpha
+        self.x_B[fila_pivote] = theta
+        self.basicas[fila_pivote] = col_pivote
+        self.lu.actualizar(fila_pivote, alpha)
+        if self.lu.requiere_refactorizacion:
+            self._refactorizar()
+
+    def _expulsar_artificiales(self, inicio_artificiales: int):
+        """Saca de la base las artificiales que quedaron en nivel cero."""
+        for fila, j in enumerate(list(self.basicas)):
+            if j < inicio_artificiales:
+                continue
+            e = np.zeros(len(self.basicas))
+            e[fila] = 1.0
+            fila_tabla = self.forma.precios(self.lu.btran(e))[:inicio_artificiales]
+            fila_tabla[[k for k in self.basicas if k < inicio_artificiales]] = 0.0
+            candidatas = np.flatnonzero(np.abs(fila_tabla) > self.tolerancia)
+            if candidatas.size == 0:
+                # Restricción redundante: la artificial permanece en cero
+                continue
+            col = int(candidatas[0])
+            self._pivotear(fila, col, self.lu.ftran(self.forma.columna(col)))
+
+    def _tabla_inicial(self, costos: np.ndarray) -> np.ndarray:
+        M = self.forma.M
+        tabla = np.zeros((M.shape[0] + 1, M.shape[1] + 1))
+        tabla[:-1, :-1] = M
+        tabla[:-1, -1] = self.b
+        tabla[-1, :-1] = -costos
+        return tabla
+
+    def _tabla_final(
+        self, costos: np.ndarray, inicio_artificiales
+    ) -> Tuple[np.ndarray, List[int]]:
+        """Reconstruye la tabla Simplex final (B^-1 [A | b]) una sola vez."""
+        M = self.forma.M
+        columnas = list(range(M.shape[1]))
+        if inicio_artificiales is not None:
+            basicas = set(self.basicas)
+            columnas = [j for j in columnas if j < inicio_artificiales or j in basicas]
+
+        cuerpo = self.lu.ftran(M[:, columnas])
+        y = self.lu.btran(costos[self.basicas])
+        tabla = np.zeros((M.shape[0] + 1, len(columnas) + 1))
+        tabla[:-1, :-1] = cuerpo
+        tabla[:-1, -1] = self.x_B
+        tabla[-1, :-1] = -(costos[columnas] - y @ M[:, columnas])
+        tabla[-1, -1] = costos[self.basicas] @ self.x_B
+
+        posicion = {j: k for k, j in enumerate(columnas)}
+        return tabla, [posicion[j] for j in self.basicas]
@@ -1,3 +1,954 @@
-from django.test import TestCase
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Create your tests here.
+import numpy as np
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from .cache_simplex import CacheResultados, clave_canonica
+from .campos import codificar_tabla, decodificar_pasos, decodificar_tabla
+from .crash import base_crash
+from .dualizacion import Dualizacion
+from .escalado import METODOS_ESCALADO
+from .expresion_lineal import (
+    ErrorExpresion,
+    parsear_objetivo,
+    parsear_restriccion,
+    parsear_variables,
+)
+from .formula import VERSION_SOLVER, SimplexSolver
+from .lote_simplex import (
+    agrupar_lote,
+    completar_opciones,
+    resolver_grupo,
+    resolver_item,
+)
+from .matriz_dispersa import MatrizCSC
+from .models import ProblemaSimplex
+from .pivoteo import PRUEBAS_RAZON, REGLAS_PIVOTEO, razon_harris, razon_minima
+from .presolucion import Presolucion
+from .presupuesto import Presupuesto
+from .punto_interior import PuntoInterior, identificar_base
+from .registro_pasos import (
+    EspacioPivoteo,
+    es_registro,
+    expandir_pasos,
+    pivotear_tabla,
+    reconstruir_paso,
+)
+from .simplex_apilado import SimplexApilado
+from .simplex_revisado import FactorizacionLU
+from .transporte import ProblemaTransporte
+from .views import (
+    CancelacionProblema,
+    SimplexCancelarAPIView,
+    SimplexListCreateView,
+    SimplexLoteAPIView,
+)
+
+
+def problema(objetivo, restricciones, variables, tipo="maximizar"):
+    return SimpleNamespace(
+        objetivo=objetivo,
+        restricciones=restricciones,
+        variables_decision=variables,
+        tipo_optimizacion=tipo,
+    )
+
+
+def resolver(datos, **opciones):
+    opciones.setdefault("generar_grafico", False)
+    opciones.setdefault("registro", "resumen")
+    return SimplexSolver(**opciones).resolver_problema(datos)
+
+
+# max 3x1 + 5x2: óptimo 36 en (2, 6)
+WYNDOR = problema("3x1 + 5x2", "x1 <= 4; 2x2 <= 12; 3x1 + 2x2 <= 18", 2)
+
+# max 5x1 + 4x2 + 3x3: óptimo 13 en (2, 0, 1)
+TRES_VARIABLES = problema(
+    "5x1 + 4x2 + 3x3",
+    "2x1 + 3x2 + x3 <= 5; 4x1 + x2 + 2x3 <= 11; 3x1 + 4x2 + 2x3 <= 8",
+    3,
+)
+
+# min 2x1 + 3x2 con restricciones >=: óptimo 9 en (3, 1)
+MINIMIZACION = problema("2x1 + 3x2", "x1 + x2 >= 4; x1 + 3x2 >= 6", 2, "minimizar")
+
+
+def transporte(costos, ofertas, demandas):
+    m, n = len(ofertas), len(demandas)
+    objetivo = " + ".join(
+        f"{costos[i][j]}x{i * n + j + 1}" for i in range(m) for j in range(n)
+    )
+    filas = [
+        " + ".join(f"x{i * n + j + 1}" for j in range(n)) + f" = {ofertas[i]}"
+        for i in range(m)
+    ]
+    filas += [
+        " + ".join(f"x{i * n + j + 1}" for i in range(m)) + f" = {demandas[j]}"
+        for j in range(n)
+    ]
+    return problema(objetivo, "; ".join(filas), m * n, "minimizar")
+
+
+class MotoresTests(SimpleTestCase):
+    def assertOptimo(self, resultado, valor, solucion=None):
+        self.assertIsNone(resultado.get("error"))
+        self.assertAlmostEqual(resultado["valor_optimo"], valor, places=6)
+        if solucion is not None:
+            np.testing.assert_allclose(resultado["solucion"], solucion, atol=1e-6)
+
+    def test_revisado_llega_al_optimo(self):
+        self.assertOptimo(resolver(WYNDOR, motor="revisado"), 36.0, [2.0, 6.0])
+        self.assertOptimo(resolver(MINIMIZACION, motor="revisado"), 9.0, [3.0, 1.0])
+        self.assertOptimo(
+            resolver(TRES_VARIABLES, motor="revisado"), 13.0, [2.0, 0.0, 1.0]
+        )
+
+    def test_reglas_de_pivoteo_llegan_al_optimo(self):
+        for regla in REGLAS_PIVOTEO:
+            with self.subTest(regla=regla):
+                resultado = resolver(
+                    TRES_VARIABLES, motor="tabla", regla_pivoteo=regla, presolve=False
+                )
+                self.assertOptimo(resultado, 13.0, [2.0, 0.0, 1.0])
+                self.assertOptimo(
+                    resolver(MINIMIZACION, motor="tabla", regla_pivoteo=regla), 9.0
+                )
+                self.assertOptimo(
+                    resolver(TRES_VARIABLES, motor="revisado", regla_pivoteo=regla),
+                    13.0,
+                )
+
+    def test_regla_de_pivoteo_desconocida(self):
+        with self.assertRaises(ValueError):
+            SimplexSolver(regla_pivoteo="otra")
+
+    def test_punto_interior_con_crossover(self):
+        resultado = resolver(TRES_VARIABLES, motor="punto_interior")
+        self.assertOptimo(resultado, 13.0, [2.0, 0.0, 1.0])
+        self.assertTrue(resultado["punto_interior"]["convergio"])
+        self.assertTrue(resultado["punto_interior"]["crossover"])
+
+        interior = PuntoInterior().resolver(
+            np.array([3.0, 5.0]),
+            np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]),
+            np.array([4.0, 12.0, 18.0]),
+            ["<="] * 3,
+        )
+        np.testing.assert_allclose(interior["x"][:2], [2.0, 6.0], atol=1e-6)
+        self.assertEqual(
+            sorted(identificar_base(interior["x"], interior["z"], ["<="] * 3, 2)),
+            [0, 1, 2],
+        )
+
+    def test_seleccion_automatica_del_motor(self):
+        solver = SimplexSolver(motor="automatico")
+        self.assertEqual(solver._seleccionar_motor(3, 5), "tabla")
+        self.assertEqual(solver._seleccionar_motor(20, 150), "punto_interior")
+        self.assertEqual(solver._seleccionar_motor(5, 200), "revisado")
+        # Con dos variables el geométrico solo cuando no hay tablas que registrar
+        self.assertEqual(solver._seleccionar_motor(2, 3), "tabla")
+        rapido = SimplexSolver(motor="automatico", registro="ninguno")
+        self.assertEqual(rapido._seleccionar_motor(2, 3), "geometrico")
+
+
+class PruebaRazonTests(SimpleTestCase):
+    def test_harris_prefiere_el_mayor_pivote_en_casi_empates(self):
+        rhs = np.array([1.0, 2.0 + 1e-9, 5.0])
+        columna = np.array([1.0, 2.0, 1.0])
+        self.assertEqual(razon_minima(rhs, columna, 1e-6), 0)
+        self.assertEqual(razon_harris(rhs, columna, 1e-6), 1)
+
+    def test_empates_y_columna_no_acotada(self):
+        rhs = np.array([2.0, 2.0, 1.0])
+        columna = np.array([1.0, 1.0, -1.0])
+        self.assertEqual(razon_minima(rhs, columna, 1e-9, basicas=[5, 3, 0]), 1)
+        self.assertEqual(razon_minima(rhs, -columna, 1e-9), 2)
+        self.assertEqual(razon_minima(rhs, np.zeros(3), 1e-9), -1)
+        self.assertEqual(razon_harris(rhs, np.zeros(3), 1e-9), -1)
+
+    def test_pruebas_de_razon_llegan_al_optimo(self):
+        for prueba in PRUEBAS_RAZON:
+            with self.subTest(prueba=prueba):
+                resultado = resolver(TRES_VARIABLES, motor="tabla", prueba_razon=prueba)
+                self.assertAlmostEqual(resultado["valor_optimo"], 13.0)
+        with self.assertRaises(ValueError):
+            SimplexSolver(prueba_razon="otra")
+
+
+class DualizacionTests(SimpleTestCase):
+    def test_resolver_el_dual_da_el_mismo_optimo(self):
+        # Muchas más filas ">=" que variables: conviene la tabla del dual
+        rng = np.random.default_rng(4)
+        m, n = 60, 4
+        A = np.round(rng.uniform(0.5, 5, (m, n)), 1)
+        b = np.round(rng.uniform(5, 20, m), 1)
+        c = np.round(rng.uniform(1, 5, n), 1)
+        resultados = [
+            SimplexSolver(
+                motor="tabla", registro="ninguno", dual_automatico=dual
+            )._resolver_con_motor(c, A, b, [">="] * m, "minimizar")
+            for dual in (True, False)
+        ]
+        dual, primal = resultados
+        self.assertEqual(dual["dualizacion"]["restricciones_dual"], n)
+        self.assertIsNone(primal.get("dualizacion"))
+        self.assertAlmostEqual(dual["valor_optimo"], primal["valor_optimo"])
+        np.testing.assert_allclose(dual["solucion"], primal["solucion"], atol=1e-9)
+        self.assertLess(dual["iteraciones"], primal["iteraciones"])
+
+    def test_no_conviene_en_problemas_pequenos(self):
+        A = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+        self.assertFalse(
+            Dualizacion().conviene(
+                np.array([3.0, 5.0]),
+                A,
+                np.array([4.0, 12.0, 18.0]),
+                ["<="] * 3,
+                "maximizar",
+            )
+        )
+
+
+class PerturbacionTests(SimpleTestCase):
+    def test_perturbacion_ante_estancamiento(self):
+        # Asignación 6 x 6: muy degenerada
+        k = 6
+        costos = np.random.default_rng(0).integers(1, 20, (k, k)).astype(float)
+        A = np.zeros((2 * k, k * k))
+        for i in range(k):
+            A[i, i * k : (i + 1) * k] = 1.0
+            A[k + i, i::k] = 1.0
+        argumentos = (costos.ravel(), A, np.ones(2 * k), ["="] * (2 * k), "minimizar")
+        solver = SimplexSolver(
+            motor="tabla", presolve=False, crash=False, registro="ninguno"
+        )
+        referencia = solver._despachar_motor(*argumentos)
+        with patch("metodos.formula.LIMITE_PIVOTES_DEGENERADOS", 3):
+            resultado = solver._despachar_motor(*argumentos)
+        self.assertEqual(referencia["perturbaciones"], 0)
+        self.assertGreater(resultado["perturbaciones"], 0)
+        self.assertGreater(resultado["pivotes_estancados"], 0)
+        self.assertAlmostEqual(resultado["valor_optimo"], referencia["valor_optimo"])
+        # Al limpiar la perturbación la solución vuelve a ser exacta
+        solucion = np.asarray(resultado["solucion"])
+        np.testing.assert_allclose(solucion, np.round(solucion), atol=1e-9)
+        np.testing.assert_allclose(solucion.reshape(k, k).sum(axis=1), 1.0)
+
+
+class CrashTests(SimpleTestCase):
+    def test_base_crash_acorta_la_fase_I(self):
+        datos = problema(
+            "x1 + 2x2 + 3x3", "x1 + x2 + x3 = 10; x1 - x2 >= 1; x3 <= 4", 3, "minimizar"
+        )
+        con_crash = resolver(datos, motor="tabla", presolve=False)
+        sin_crash = resolver(datos, motor="tabla", presolve=False, crash=False)
+        self.assertEqual(con_crash["crash"]["variables"], 2)
+        self.assertIsNone(sin_crash["crash"])
+        self.assertLess(con_crash["iteraciones"], sin_crash["iteraciones"])
+        self.assertAlmostEqual(con_crash["valor_optimo"], sin_crash["valor_optimo"])
+        np.testing.assert_allclose(con_crash["solucion"], [10.0, 0.0, 0.0])
+
+    def test_base_crash_es_factible(self):
+        # Ambas filas ">=" toman una variable de decisión
+        A = np.array([[1.0, 1.0], [1.0, 3.0]])
+        self.assertEqual(base_crash(A, np.array([4.0, 6.0]), [">=", ">="]), [0, 1])
+        # Solo filas "<=": la base de holguras ya es factible
+        self.assertIsNone(base_crash(A, np.array([4.0, 6.0]), ["<=", "<="]))
+
+
+class FactorizacionLUTests(SimpleTestCase):
+    def test_ftran_y_btran_resuelven_la_base(self):
+        rng = np.random.default_rng(0)
+        # Más de un bloque para recorrer las actualizaciones fuera de la diagonal
+        B = rng.normal(size=(150, 150))
+        factorizacion = FactorizacionLU()
+        factorizacion.factorizar(B)
+        v = rng.normal(size=150)
+        np.testing.assert_allclose(B @ factorizacion.ftran(v), v, atol=1e-9)
+        np.testing.assert_allclose(B.T @ factorizacion.btran(v), v, atol=1e-9)
+        V = rng.normal(size=(150, 3))
+        np.testing.assert_allclose(B @ factorizacion.ftran(V), V, atol=1e-9)
+
+        # Tras una actualización eta, ftran resuelve con la nueva base
+        columna = rng.normal(size=150)
+        factorizacion.actualizar(7, factorizacion.ftran(columna))
+        B[:, 7] = columna
+        np.testing.assert_allclose(B @ factorizacion.ftran(v), v, atol=1e-9)
+        np.testing.assert_allclose(B.T @ factorizacion.btran(v), v, atol=1e-9)
+
+    def test_base_singular(self):
+        B = np.array([[1.0, 2.0, 3.0], [2.0, 4.0, 6.0], [0.0, 1.0, 1.0]])
+        with self.assertRaisesMessage(ValueError, "singular"):
+            FactorizacionLU().factorizar(B)
+
+
+class MatrizDispersaTests(SimpleTestCase):
+    def test_productos_coinciden_con_la_densa(self):
+        rng = np.random.default_rng(1)
+        A = rng.normal(size=(30, 20)) * (rng.random((30, 20)) < 0.1)
+        dispersa = MatrizCSC.desde_densa(A)
+        self.assertEqual(dispersa.nnz, np.count_nonzero(A))
+        np.testing.assert_array_equal(dispersa.a_densa(), A)
+        x, y = rng.normal(size=20), rng.normal(size=30)
+        np.testing.assert_allclose(dispersa.producto(x), A @ x)
+        np.testing.assert_allclose(dispersa.producto_transpuesto(y), A.T @ y)
+        np.testing.assert_array_equal(dispersa.columna(4), A[:, 4])
+        np.testing.assert_array_equal(
+            dispersa.submatriz_columnas([3, 0]).a_densa(), A[:, [3, 0]]
+        )
+
+    def test_revisado_disperso_coincide_con_el_denso(self):
+        rng = np.random.default_rng(2)
+        m, n = 60, 40
+        A = np.round(rng.uniform(0.1, 9, (m, n)) * (rng.random((m, n)) < 0.05), 2)
+        # Todas las filas y columnas con algún coeficiente: el problema es acotado
+        A[np.arange(m), rng.integers(0, n, m)] = np.round(rng.uniform(0.5, 9, m), 2)
+        A[rng.integers(0, m, n), np.arange(n)] = np.round(rng.uniform(0.5, 9, n), 2)
+        b = np.round(rng.uniform(10, 100, m), 1)
+        c = np.round(rng.uniform(1, 10, n), 1)
+        resultados = [
+            SimplexSolver(
+                motor="revisado", registro="ninguno", disperso=disperso
+            )._despachar_motor(c, A, b, ["<="] * m, "maximizar")
+            for disperso in (False, True)
+        ]
+        self.assertAlmostEqual(
+            resultados[0]["valor_optimo"], resultados[1]["valor_optimo"], places=6
+        )
+
+
+class EscaladoTests(SimpleTestCase):
+    # WYNDOR con la primera fila multiplicada por 1000 y x2 medida en milésimas
+    MAL_ESCALADO = problema(
+        "3x1 + 0.005x2", "1000x1 <= 4000; 0.002x2 <= 12; 3x1 + 0.002x2 <= 18", 2
+    )
+
+    def test_escalado_no_cambia_la_solucion(self):
+        for motor in ("tabla", "revisado"):
+            sin_escalar = resolver(self.MAL_ESCALADO, motor=motor)
+            self.assertIsNone(sin_escalar.get("escalado"))
+            for metodo in METODOS_ESCALADO:
+                with self.subTest(motor=motor, metodo=metodo):
+                    escalado = resolver(self.MAL_ESCALADO, motor=motor, escalado=metodo)
+                    self.assertEqual(escalado["escalado"]["metodo"], metodo)
+                    self.assertAlmostEqual(
+                        escalado["valor_optimo"], sin_escalar["valor_optimo"]
+                    )
+                    np.testing.assert_allclose(
+                        escalado["solucion"], sin_escalar["solucion"]
+                    )
+
+    def test_geometrico_reduce_el_rango_y_mide_los_pivotes(self):
+        resultado = resolver(
+            self.MAL_ESCALADO, motor="tabla", escalado="geometrico", medir_escalado=True
+        )
+        resumen = resultado["escalado"]
+        self.assertLess(resumen["rango_escalado"], resumen["rango_original"])
+        self.assertEqual(
+            resumen["pivotes_ahorrados"],
+            resumen["iteraciones_sin_escalar"] - resultado["iteraciones"],
+        )
+
+    def test_metodo_desconocido(self):
+        with self.assertRaises(ValueError):
+            SimplexSolver(escalado="otro")
+
+
+class ExpresionLinealTests(SimpleTestCase):
+    def test_objetivo_conserva_todos_los_coeficientes(self):
+        # El parser anterior perdía los coeficientes de 3x1 + 2x2
+        self.assertEqual(parsear_objetivo("3x1 + 2x2", 2), [3.0, 2.0])
+        self.assertEqual(parsear_objetivo("3*x1 - 2X2 + x3", 3), [3.0, -2.0, 1.0])
+        self.assertEqual(parsear_objetivo("2(x1 + x2) - x2/4", 2), [2.0, 1.75])
+        self.assertEqual(parsear_objetivo("1.5e1x2", 2), [0.0, 15.0])
+
+    def test_restriccion_con_variables_en_ambos_lados(self):
+        self.assertEqual(
+            parsear_restriccion("2x1 + 3 <= x2 + 7", 2), ([2.0, -1.0], "<=", 4.0)
+        )
+        self.assertEqual(parsear_restriccion("x1 ≥ 2", 2), ([1.0, 0.0], ">=", 2.0))
+        self.assertEqual(parsear_restriccion("x1 + x2 == 3", 2), ([1.0, 1.0], "=", 3.0))
+
+    def test_errores_con_posicion(self):
+        for texto in ("x1 +", "x1 x2", "x3", "2.5.3x1", "1 000x1", "x1 / x2"):
+            with self.subTest(texto=texto):
+                with self.assertRaises(ErrorExpresion):
+                    parsear_objetivo(texto, 2)
+        with self.assertRaises(ErrorExpresion) as contexto:
+            parsear_objetivo("x1 $ x2", 2)
+        self.assertEqual(contexto.exception.posicion, 3)
+
+    def test_respaldo_con_sympy(self):
+        self.assertEqual(parsear_objetivo("x1^1 + 2*x2", 2), [1.0, 2.0])
+        self.assertEqual(parsear_restriccion("x1^1 ≤ 4", 2), ([1.0, 0.0], "<=", 4.0))
+        for texto in ("x1^1 < 4", "x1^1 <= 3 <= 4"):
+            with self.subTest(texto=texto):
+                with self.assertRaises(ValueError):
+                    parsear_restriccion(texto, 2)
+
+    def test_variables_enteras(self):
+        self.assertEqual(parsear_variables("x1, x3", 3), [True, False, True])
+        with self.assertRaises(ValueError):
+            parsear_variables("x4", 3)
+
+
+class RamificacionTests(SimpleTestCase):
+    def entero(self, enteras, restricciones="6x1 + 4x2 <= 24; x1 + 2x2 <= 6"):
+        datos = problema("5x1 + 4x2", restricciones, 2)
+        datos.variables_enteras = enteras
+        return resolver(datos)
+
+    def test_optimo_entero(self):
+        # Relajación lineal: 21 en (3, 1.5)
+        resultado = self.entero("x1, x2")
+        self.assertAlmostEqual(resultado["valor_optimo"], 20.0)
+        np.testing.assert_allclose(resultado["solucion"], [4.0, 0.0], atol=1e-9)
+        self.assertEqual(resultado["ramificacion"]["brecha"], 0.0)
+
+        resultado = self.entero("x2")
+        self.assertAlmostEqual(resultado["valor_optimo"], 62 / 3)
+        np.testing.assert_allclose(resultado["solucion"], [10 / 3, 1.0])
+
+    def test_sin_solucion_entera(self):
+        resultado = self.entero("x1, x2", "2x1 + 2x2 = 3")
+        self.assertIn("entera", resultado["error"])
+
+
+class CacheTests(SimpleTestCase):
+    def setUp(self):
+        self.c = np.array([3.0, 5.0])
+        self.A = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+        self.b = np.array([4.0, 12.0, 18.0])
+        self.desigualdades = ["<=", "<=", "<="]
+
+    def clave(self, c=None, A=None, b=None, desigualdades=None, **cambios):
+        argumentos = {
+            "tipo_optimizacion": "maximizar",
+            "tolerancia": 1e-6,
+            "version": VERSION_SOLVER,
+            "opciones": {"motor": "tabla"},
+        }
+        argumentos.update(cambios)
+        return clave_canonica(
+            self.c if c is None else c,
+            self.A if A is None else A,
+            self.b if b is None else b,
+            self.desigualdades if desigualdades is None else desigualdades,
+            **argumentos,
+        )
+
+    def test_clave_estable(self):
+        self.assertEqual(self.clave(), self.clave())
+        self.assertEqual(
+            self.clave(), self.clave(A=np.where(self.A == 0, -0.0, self.A))
+        )
+
+    def test_clave_cambia_con_el_problema_y_las_opciones(self):
+        base = self.clave()
+        self.assertNotEqual(base, self.clave(c=np.array([3.0, 4.0])))
+        self.assertNotEqual(base, self.clave(desigualdades=["<=", "<=", ">="]))
+        self.assertNotEqual(base, self.clave(tipo_optimizacion="minimizar"))
+        self.assertNotEqual(base, self.clave(opciones={"motor": "revisado"}))
+        self.assertNotEqual(base, self.clave(version="0"))
+        # Los resultados dependen del orden de las restricciones
+        orden = [2, 0, 1]
+        self.assertNotEqual(base, self.clave(A=self.A[orden], b=self.b[orden]))
+
+    def test_restricciones_reordenadas_no_reutilizan_el_resultado(self):
+        cache = CacheResultados(VERSION_SOLVER, persistente=False)
+        reordenado = problema("3x1 + 5x2", "3x1 + 2x2 <= 18; x1 <= 4; 2x2 <= 12", 2)
+        resolver(WYNDOR, cache=cache, sensibilidad=True)
+        resultado = resolver(reordenado, cache=cache, sensibilidad=True)
+        self.assertFalse(resultado.get("desde_cache"))
+        esperado = resolver(reordenado, sensibilidad=True)
+        self.assertEqual(
+            resultado["sensibilidad"]["precios_sombra"],
+            esperado["sensibilidad"]["precios_sombra"],
+        )
+        self.assertEqual(
+            resultado["sensibilidad"]["base"], esperado["sensibilidad"]["base"]
+        )
+        np.testing.assert_allclose(
+            resultado["sensibilidad"]["precios_sombra"], [1.0, 0.0, 1.5]
+        )
+        self.assertTrue(
+            resolver(WYNDOR, cache=cache, sensibilidad=True).get("desde_cache")
+        )
+
+
+class PresolucionTests(SimpleTestCase):
+    def test_reduce_y_recupera_la_solucion(self):
+        # Fila unitaria, fila duplicada y variable fija por igualdad
+        datos = problema(
+            "2x1 + 3x2 + x3",
+            "x1 + x2 + x3 <= 10; 2x1 + 2x2 + 2x3 <= 20; x1 <= 4; x3 = 1; x2 - x1 <= 3",
+            3,
+        )
+        reducido = resolver(datos, motor="tabla")
+        completo = resolver(datos, motor="tabla", presolve=False)
+        self.assertGreater(reducido["presolve"]["filas_eliminadas"], 0)
+        self.assertAlmostEqual(reducido["valor_optimo"], completo["valor_optimo"])
+        np.testing.assert_allclose(
+            reducido["solucion"], completo["solucion"], atol=1e-9
+        )
+
+    def test_postresolver_desplaza_cotas_inferiores(self):
+        c = np.array([1.0, 1.0])
+        A = np.array([[1.0, 0.0], [1.0, 1.0]])
+        b = np.array([2.0, 5.0])
+        presolucion = Presolucion()
+        c_r, A_r, b_r, d_r = presolucion.reducir(c, A, b, [">=", "<="], "minimizar")
+        self.assertFalse(presolucion.sin_cambios)
+        self.assertEqual(np.shape(A_r)[1], len(c_r))
+        # Óptimo del reducido: todas las variables en su cota inferior
+        resultado = presolucion.postresolver(
+            {"solucion": [0.0] * len(c_r), "valor_optimo": 0.0}
+        )
+        np.testing.assert_allclose(resultado["solucion"], [2.0, 0.0])
+        self.assertAlmostEqual(resultado["valor_optimo"], 2.0)
+
+    def test_problema_trivial(self):
+        resultado = resolver(problema("x1 + x2", "x1 <= 3; x2 <= 2", 2), motor="tabla")
+        self.assertAlmostEqual(resultado["valor_optimo"], 5.0)
+        np.testing.assert_allclose(resultado["solucion"], [3.0, 2.0])
+
+
+class TransporteTests(SimpleTestCase):
+    COSTOS = [[8, 6, 10], [9, 12, 13]]
+
+    def test_detecta_y_resuelve_transporte(self):
+        datos = transporte(self.COSTOS, [20, 30], [10, 25, 15])
+        resultado = resolver(datos, motor="automatico")
+        self.assertEqual(resultado["motor"], "transporte")
+        self.assertEqual(resultado["transporte"]["metodo"], "vogel_modi")
+        tabla = resolver(datos, motor="tabla")
+        self.assertAlmostEqual(resultado["valor_optimo"], tabla["valor_optimo"])
+
+    def test_detecta_y_resuelve_asignacion(self):
+        datos = transporte([[4, 2, 8], [4, 3, 7], [3, 1, 6]], [1, 1, 1], [1, 1, 1])
+        resultado = resolver(datos, motor="automatico")
+        self.assertEqual(resultado["transporte"]["metodo"], "hungaro")
+        self.assertAlmostEqual(resultado["valor_optimo"], 12.0)
+        asignacion = np.reshape(resultado["solucion"][:9], (3, 3))
+        np.testing.assert_allclose(asignacion.sum(axis=0), 1.0)
+        np.testing.assert_allclose(asignacion.sum(axis=1), 1.0)
+
+    def test_no_detecta_otras_estructuras(self):
+        c = np.array([3.0, 5.0])
+        A = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+        b = np.array([4.0, 12.0, 18.0])
+        self.assertFalse(
+            ProblemaTransporte().detectar(c, A, b, ["<="] * 3, "maximizar")
+        )
+        # Orígenes "=" con destinos ">=": no es ninguna de las formas admitidas
+        A = np.array([[1.0, 1.0], [1.0, 0.0], [0.0, 1.0]])
+        self.assertFalse(
+            ProblemaTransporte().detectar(
+                c, A, np.array([2.0, 1.0, 1.0]), ["=", ">=", "<="], "minimizar"
+            )
+        )
+
+
+class RegistroPasosTests(SimpleTestCase):
+    def test_expansion_del_registro_compacto(self):
+        resultado = resolver(TRES_VARIABLES, motor="tabla", registro="completo")
+        registro = resultado["registro_pasos"]
+        self.assertTrue(es_registro(registro))
+        self.assertTrue(all("entra" not in evento for evento in registro["eventos"]))
+
+        pasos = list(expandir_pasos(registro))
+        self.assertEqual(pasos[0]["tabla"], registro["tabla_inicial"])
+        pivotes = [paso for paso in pasos if "pivote" in paso]
+        self.assertEqual(len(pivotes), resultado["iteraciones"])
+        np.testing.assert_allclose(pasos[-1]["tabla"], resultado["tabla_final"])
+        for indice in (0, len(pasos) // 2, len(pasos) - 1):
+            self.assertEqual(reconstruir_paso(registro, indice), pasos[indice])
+        with self.assertRaises(ValueError):
+            reconstruir_paso(registro, len(pasos))
+
+    def test_pivote_in_situ(self):
+        rng = np.random.default_rng(3)
+        espacio = EspacioPivoteo(filas_por_bloque=4)
+        densa = rng.normal(size=(11, 9))
+        # Columna pivote casi vacía: se actualizan solo las filas no nulas
+        dispersa = densa.copy()
+        dispersa[:, 2] = 0.0
+        dispersa[[0, 5], 2] = [3.0, 1.5]
+        for tabla in (densa, dispersa):
+            esperada = tabla.copy()
+            esperada[5] /= esperada[5, 2]
+            for i in range(len(esperada)):
+                if i != 5:
+                    esperada[i] -= esperada[i, 2] * esperada[5]
+            pivotear_tabla(tabla, 5, 2, espacio)
+            np.testing.assert_allclose(tabla, esperada, atol=1e-12)
+            np.testing.assert_allclose(tabla[:, 2], np.eye(11)[5], atol=1e-12)
+
+        # El espacio de trabajo se reutiliza entre pivotes
+        factores, producto = espacio.factores, espacio.producto
+        pivotear_tabla(densa, 3, 4, espacio)
+        self.assertIs(espacio.factores, factores)
+        self.assertIs(espacio.producto, producto)
+
+    def test_niveles_de_registro(self):
+        resultado = resolver(
+            TRES_VARIABLES, motor="tabla", registro="muestreo", registro_cada=2
+        )
+        self.assertEqual(
+            [paso["titulo"] for paso in resultado["pasos"]],
+            ["Tabla inicial", "Iteración 2", "Tabla final"],
+        )
+        resultado = resolver(TRES_VARIABLES, motor="tabla", registro="resumen")
+        self.assertFalse(es_registro(resultado.get("registro_pasos")))
+        self.assertEqual(len(resultado["pasos"]), 2)
+        resultado = resolver(TRES_VARIABLES, motor="tabla", registro="ninguno")
+        self.assertFalse(resultado.get("pasos"))
+        self.assertIsNone(resultado.get("tabla_final"))
+        self.assertAlmostEqual(resultado["valor_optimo"], 13.0)
+        with self.assertRaises(ValueError):
+            SimplexSolver(registro="otro")
+
+
+class CamposComprimidosTests(TestCase):
+    def test_tabla_y_pasos_se_recuperan_de_la_base_de_datos(self):
+        resultado = resolver(TRES_VARIABLES, motor="tabla", registro="completo")
+        problema_guardado = ProblemaSimplex.objects.create(
+            usuario=User.objects.create_user("campos", password="clave"),
+            objetivo=TRES_VARIABLES.objetivo,
+            restricciones=TRES_VARIABLES.restricciones,
+            variables_decision=3,
+            tabla_final=resultado["tabla_final"],
+            pasos=resultado["registro_pasos"],
+        )
+        guardado = ProblemaSimplex.objects.get(pk=problema_guardado.pk)
+        np.testing.assert_array_equal(guardado.tabla_final, resultado["tabla_final"])
+        self.assertEqual(
+            list(expandir_pasos(guardado.pasos)),
+            list(expandir_pasos(resultado["registro_pasos"])),
+        )
+
+    def test_tipo_de_dato_y_formatos_anteriores(self):
+        # float32 solo cuando no se pierde precisión
+        for tabla in (np.array([[1.0, 0.5], [2.0, -3.0]]), np.array([[0.1, 1 / 3]])):
+            recuperada = decodificar_tabla(codificar_tabla(tabla))
+            np.testing.assert_array_equal(recuperada, tabla)
+        campo = ProblemaSimplex._meta.get_field("tabla_final")
+        np.testing.assert_array_equal(
+            campo.to_python("[[1, 2], [3, 4]]"), [[1, 2], [3, 4]]
+        )
+        with self.assertRaises(ValueError):
+            decodificar_pasos(codificar_tabla(np.eye(2)))
+
+
+class ReoptimizacionTests(SimpleTestCase):
+    def test_reoptimiza_desde_la_base_anterior(self):
+        anterior = resolver(TRES_VARIABLES)
+        self.assertEqual(sorted(anterior["base"]), ["s2", "x1", "x3"])
+        originales = TRES_VARIABLES.restricciones
+        casos = [
+            # Otro lado derecho: la base sigue siendo primal factible
+            (originales.replace("<= 5", "<= 4"), "primal", 0),
+            # Un corte al final que el óptimo anterior viola: Simplex dual
+            (originales + "; x1 <= 1", "dual", 1),
+        ]
+        for restricciones, arranque, pivotes in casos:
+            with self.subTest(restricciones=restricciones):
+                editado = problema(TRES_VARIABLES.objetivo, restricciones, 3)
+                desde_cero = resolver(editado)
+                resultado = resolver(editado, base_anterior=anterior["base"])
+                self.assertEqual(resultado["reoptimizacion"]["arranque"], arranque)
+                self.assertEqual(resultado["iteraciones"], pivotes)
+                self.assertLess(resultado["iteraciones"], desde_cero["iteraciones"])
+                self.assertAlmostEqual(
+                    resultado["valor_optimo"], desde_cero["valor_optimo"]
+                )
+
+
+class SensibilidadTests(SimpleTestCase):
+    def test_precios_sombra_y_rangos(self):
+        sensibilidad = resolver(WYNDOR, sensibilidad=True)["sensibilidad"]
+        np.testing.assert_allclose(sensibilidad["precios_sombra"], [0.0, 1.5, 1.0])
+        np.testing.assert_allclose(sensibilidad["rango_rhs"][2], [12.0, 24.0])
+        np.testing.assert_allclose(sensibilidad["rango_costos"][0], [0.0, 7.5])
+
+    def test_barrido_parametrico_del_lado_derecho(self):
+        solver = SimplexSolver(registro="ninguno", generar_grafico=False)
+        barrido = solver.barrido_parametrico(WYNDOR, "rhs", 3, 30.0, 0.0)
+        segmentos = barrido["segmentos"]
+        self.assertEqual(
+            [(t["desde"], t["hasta"]) for t in segmentos],
+            [(0.0, 12.0), (12.0, 24.0), (24.0, 30.0)],
+        )
+        np.testing.assert_allclose([t["pendiente"] for t in segmentos], [2.5, 1.0, 0.0])
+        for anterior, siguiente in zip(segmentos, segmentos[1:]):
+            self.assertAlmostEqual(anterior["valor_hasta"], siguiente["valor_desde"])
+        # En b3 = 18 el tramo central pasa por el óptimo original
+        self.assertAlmostEqual(
+            segmentos[1]["valor_desde"] + 6.0 * segmentos[1]["pendiente"], 36.0
+        )
+
+    def test_barrido_parametrico_de_un_costo(self):
+        solver = SimplexSolver(registro="ninguno", generar_grafico=False)
+        barrido = solver.barrido_parametrico(WYNDOR, "costo", 1, 10.0, 0.0)
+        self.assertEqual(barrido["cambios_base"], 1)
+        self.assertEqual(barrido["segmentos"][0]["hasta"], 7.5)
+        np.testing.assert_allclose(barrido["segmentos"][1]["solucion"], [4.0, 3.0])
+
+
+class PresupuestoTests(SimpleTestCase):
+    def test_interrupcion_devuelve_la_base_actual(self):
+        cancelado = SimpleNamespace(cancelado=True)
+        for motor in ("tabla", "revisado", "punto_interior"):
+            for opciones in ({"tiempo_limite": 0.0}, {"cancelacion": cancelado}):
+                with self.subTest(motor=motor, **opciones):
+                    resultado = resolver(TRES_VARIABLES, motor=motor, **opciones)
+                    motivo = "tiempo" if "tiempo_limite" in opciones else "cancelado"
+                    self.assertEqual(resultado["interrupcion"]["motivo"], motivo)
+                    self.assertIn("mejor base", resultado["warning"])
+                    # La base de holguras: factible pero no óptima
+                    self.assertEqual(resultado["solucion"], [0.0, 0.0, 0.0])
+
+    def test_interrupcion_en_fase_I_es_un_error(self):
+        resultado = resolver(MINIMIZACION, motor="revisado", tiempo_limite=0.0)
+        self.assertIn("Fase I sin terminar", resultado["error"])
+
+    def test_tabla_apilada_respeta_el_presupuesto(self):
+        c, A, b = [[3.0, 5.0], [2.0, 3.0]], [[1.0, 0.0], [1.0, 3.0]], [4.0, 6.0]
+        sentidos = [["<=", "<="], [">=", ">="]]
+        resultados = SimplexApilado(presupuesto=Presupuesto(0.0)).resolver(
+            c, [A, A], [b, b], sentidos, ["maximizar", "minimizar"]
+        )
+        self.assertEqual(resultados[0]["interrupcion"]["motivo"], "tiempo")
+        self.assertEqual(resultados[0]["solucion"], [0.0, 0.0])
+        self.assertIn("Fase I sin terminar", resultados[1]["error"])
+
+
+class CrearVistaTests(TestCase):
+    def setUp(self):
+        self.usuario = User.objects.create_user("crear", password="clave")
+        self.client.force_login(self.usuario)
+
+    def test_dos_variables_guarda_las_tablas(self):
+        with patch(
+            "metodos.views.generar_explicacion_simplex", return_value="Explicación"
+        ):
+            respuesta = self.client.post(
+                reverse("add_simplex"),
+                {
+                    "objetivo": "3x1 + 5x2",
+                    "tipo_optimizacion": "maximizar",
+                    "restricciones": "x1 <= 4; 2x2 <= 12; 3x1 + 2x2 <= 18",
+                    "variables_decision": 2,
+                    "tolerancia": 1e-6,
+                    "max_iteraciones": 100,
+                    "motor": "automatico",
+                    "regla_pivoteo": "dantzig",
+                    "escalado": "ninguno",
+                },
+            )
+        self.assertEqual(respuesta.status_code, 302)
+        problema = ProblemaSimplex.objects.get(usuario=self.usuario)
+        self.assertTrue(problema.pasos)
+        self.assertIsNotNone(problema.tabla_final)
+        self.assertGreater(problema.iteraciones_realizadas, 0)
+        self.assertIsNotNone(problema.grafico_base64)
+
+
+class CancelarAPITests(TestCase):
+    def setUp(self):
+        self.usuario = User.objects.create_user("cancelar", password="clave")
+        explicacion = patch(
+            "metodos.views.generar_explicacion_simplex", return_value="Explicación"
+        )
+        explicacion.start()
+        self.addCleanup(explicacion.stop)
+
+    def cancelar(self, pk):
+        solicitud = APIRequestFactory().post(f"/api/simplex/{pk}/cancelar/")
+        force_authenticate(solicitud, user=self.usuario)
+        return SimplexCancelarAPIView.as_view()(solicitud, pk=pk)
+
+    def test_cancelacion_llega_a_la_resolucion_en_curso(self):
+        pivotear = SimplexSolver._pivotear
+        respuestas = []
+
+        def pivotear_y_cancelar(solver, *args):
+            # Otra petición pide cancelar mientras el problema se resuelve
+            if not respuestas:
+                problema_en_curso = ProblemaSimplex.objects.get(usuario=self.usuario)
+                self.assertEqual(problema_en_curso.estado, "procesando")
+                respuestas.append(self.cancelar(problema_en_curso.pk))
+            pivotear(solver, *args)
+
+        solicitud = APIRequestFactory().post(
+            "/api/simplex/",
+            {
+                # Klee-Minty: siete pivotes con Dantzig
+                "objetivo": "100x1 + 10x2 + x3",
+                "restricciones": "x1 <= 1; 20x1 + x2 <= 100; "
+                "200x1 + 20x2 + x3 <= 10000",
+                "variables_decision": 3,
+                "motor": "tabla",
+                "usuario": self.usuario.pk,
+            },
+            format="json",
+        )
+        force_authenticate(solicitud, user=self.usuario)
+        with patch.object(CancelacionProblema, "INTERVALO", 0.0), patch.object(
+            SimplexSolver, "_pivotear", pivotear_y_cancelar
+        ):
+            respuesta = SimplexListCreateView.as_view()(solicitud)
+
+        self.assertEqual(respuesta.status_code, 201)
+        self.assertEqual(respuestas[0].status_code, 202)
+        problema_guardado = ProblemaSimplex.objects.get(pk=respuesta.data["id"])
+        self.assertEqual(problema_guardado.estado, "cancelado")
+        self.assertEqual(problema_guardado.iteraciones_realizadas, 1)
+
+    def test_solo_se_cancela_una_resolucion_en_curso(self):
+        problema_guardado = ProblemaSimplex.objects.create(
+            usuario=self.usuario,
+            objetivo=WYNDOR.objetivo,
+            restricciones=WYNDOR.restricciones,
+            variables_decision=2,
+            estado="optimo",
+        )
+        self.assertEqual(self.cancelar(problema_guardado.pk).status_code, 409)
+
+
+class ClonarAPITests(TestCase):
+    def setUp(self):
+        self.usuario = User.objects.create_user("clonar", password="clave")
+        self.cliente = APIClient()
+        self.cliente.force_authenticate(self.usuario)
+        explicacion = patch(
+            "metodos.views.generar_explicacion_simplex", return_value="Explicación"
+        )
+        explicacion.start()
+        self.addCleanup(explicacion.stop)
+
+    def test_clon_parte_de_la_base_del_original(self):
+        respuesta = self.cliente.post(
+            reverse("api_simplex_list"),
+            {
+                "objetivo": TRES_VARIABLES.objetivo,
+                "restricciones": TRES_VARIABLES.restricciones,
+                "variables_decision": 3,
+                "usuario": self.usuario.pk,
+            },
+            format="json",
+        )
+        self.assertEqual(respuesta.status_code, 201)
+        origen = ProblemaSimplex.objects.get(pk=respuesta.data["id"])
+        self.assertEqual(origen.iteraciones_realizadas, 2)
+
+        respuesta = self.cliente.post(
+            reverse("api_simplex_clonar", args=[origen.pk]),
+            {"restricciones": TRES_VARIABLES.restricciones + "; x1 <= 1"},
+            format="json",
+        )
+        self.assertEqual(respuesta.status_code, 201)
+        clon = ProblemaSimplex.objects.get(pk=respuesta.data["id"])
+        self.assertEqual(clon.problema_origen, origen)
+        self.assertEqual(clon.estado, "optimo")
+        self.assertAlmostEqual(json.loads(clon.solucion)["valor_optimo"], 12.5)
+        # Un pivote dual en lugar de los dos del original
+        self.assertEqual(clon.iteraciones_realizadas, 1)
+        self.assertEqual(clon.iteraciones_evitadas, 1)
+
+
+class LoteTests(TestCase):
+    def setUp(self):
+        self.usuario = User.objects.create_user("lote", password="clave")
+
+    def datos(self, limite):
+        return {
+            "objetivo": "3x1 + 5x2",
+            "restricciones": f"x1 <= {limite}; 2x2 <= 12; 3x1 + 2x2 <= 18",
+            "variables_decision": 2,
+        }
+
+    def test_tabla_apilada_coincide_con_el_solver(self):
+        problemas = [completar_opciones(self.datos(limite)) for limite in (1, 2, 4, 8)]
+        problemas.append(completar_opciones({**self.datos(4), "motor": "revisado"}))
+        grupos, sueltos = agrupar_lote(problemas)
+        self.assertEqual([indices for indices, _ in grupos], [[0, 1, 2, 3]])
+        self.assertEqual(sueltos, [4])
+        for item in resolver_grupo(*grupos[0]):
+            esperado = resolver_item(item["indice"], problemas[item["indice"]])
+            self.assertEqual(item["estado"], esperado["estado"])
+            self.assertAlmostEqual(item["valor_optimo"], esperado["valor_optimo"])
+
+    def test_solo_se_apilan_problemas_pequenos(self):
+        grande = {
+            "objetivo": " + ".join(f"x{j}" for j in range(1, 13)),
+            "restricciones": " + ".join(f"x{j}" for j in range(1, 13)) + " <= 10",
+            "variables_decision": 12,
+        }
+        problemas = [completar_opciones(grande) for _ in range(3)]
+        problemas += [completar_opciones(self.datos(limite)) for limite in (1, 2)]
+        grupos, sueltos = agrupar_lote(problemas)
+        self.assertEqual([indices for indices, _ in grupos], [[3, 4]])
+        self.assertEqual(sueltos, [0, 1, 2])
+
+    def test_maximo_de_iteraciones_en_fase_I_es_un_error(self):
+        c, A, b = [2.0, 3.0], [[1.0, 1.0], [1.0, 3.0]], [4.0, 6.0]
+        (resultado,) = SimplexApilado(max_iter=1).resolver(
+            [c], [A], [b], [">=", ">="], "minimizar"
+        )
+        self.assertIn("Fase I", resultado["error"])
+        self.assertIsNone(resultado["solucion"])
+        (resultado,) = SimplexApilado().resolver(
+            [c], [A], [b], [">=", ">="], "minimizar"
+        )
+        self.assertAlmostEqual(resultado["valor_optimo"], 9.0)
+
+        # En la fase II se devuelve la base alcanzada con una advertencia
+        (resultado,) = SimplexApilado(max_iter=1).resolver(
+            [[3.0, 5.0]],
+            [[[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]]],
+            [[4.0, 12.0, 18.0]],
+            ["<="] * 3,
+        )
+        self.assertIn("warning", resultado)
+        self.assertIsNotNone(resultado["solucion"])
+
+    def test_respuesta_ndjson(self):
+        problemas = [self.datos(limite) for limite in (1, 4)]
+        problemas.append({"objetivo": "x1 + x2", "restricciones": "x1 - x2 <= 1"})
+        problemas.append({"objetivo": "x1 +", "restricciones": "x1 <= 1"})
+        problemas.append({"objetivo": "x1"})
+        solicitud = APIRequestFactory().post(
+            "/api/simplex/lote/",
+            {"problemas": problemas, "trabajadores": 1},
+            format="json",
+        )
+        force_authenticate(solicitud, user=self.usuario)
+        respuesta = SimplexLoteAPIView.as_view()(solicitud)
+        self.assertEqual(respuesta["Content-Type"], "application/x-ndjson")
+
+        lineas = [
+            json.loads(linea)
+            for linea in b"".join(respuesta.streaming_content).decode().splitlines()
+        ]
+        fin, items = lineas[-1], {item["indice"]: item for item in lineas[:-1]}
+        self.assertEqual(sorted(items), list(range(len(problemas))))
+        self.assertEqual(items[0]["valor_optimo"], 33.0)
+        self.assertEqual(items[1]["valor_optimo"], 36.0)
+        self.assertEqual(items[2]["estado"], "no_acotado")
+        self.assertEqual(items[3]["estado"], "error")
+        self.assertIn("restricciones", items[4]["error"])
+        self.assertEqual(
+            fin,
+            {
+                "fin": True,
+                "total": 5,
+                "estados": {"optimo": 2, "no_acotado": 1, "error": 2},
+            },
+        )
@@ -0,0 +1,509 @@
+import warnings
+from collections import deque
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+def _penalizaciones(costos: np.ndarray) -> np.ndarray:
+    """Diferencia entre los dos menores costos de cada fila (0 si hay uno)."""
+    if costos.shape[1] < 2:
+        return np.zeros(costos.shape[0])
+    menores = np.partition(costos, 1, axis=1)[:, :2]
+    return menores[:, 1] - menores[:, 0]
+
+
+def vogel(
+    costos: np.ndarray, oferta: np.ndarray, demanda: np.ndarray
+) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+    """
+    Solución inicial por aproximación de Vogel: en la fila o columna con
+    mayor penalización se asigna la celda de menor costo. Cada paso tacha
+    una sola línea, así que la base tiene m + n - 1 celdas (algunas con
+    asignación cero) y forma un árbol. Requiere oferta y demanda balanceadas.
+    """
+    m, n = costos.shape
+    oferta = np.array(oferta, dtype=np.float64)
+    demanda = np.array(demanda, dtype=np.float64)
+    asignacion = np.zeros((m, n))
+    base: List[Tuple[int, int]] = []
+    filas = np.ones(m, dtype=bool)
+    columnas = np.ones(n, dtype=bool)
+
+    while filas.any() and columnas.any():
+        activas_f, activas_c = np.flatnonzero(filas), np.flatnonzero(columnas)
+        sub = costos[np.ix_(activas_f, activas_c)]
+        penal_filas, penal_columnas = _penalizaciones(sub), _penalizaciones(sub.T)
+        if penal_filas.max() >= penal_columnas.max():
+            r = int(np.argmax(penal_filas))
+            s = int(np.argmin(sub[r]))
+        else:
+            s = int(np.argmax(penal_columnas))
+            r = int(np.argmin(sub[:, s]))
+        i, j = activas_f[r], activas_c[s]
+
+        cantidad = min(oferta[i], demanda[j])
+        asignacion[i, j] = cantidad
+        base.append((int(i), int(j)))
+        oferta[i] -= cantidad
+        demanda[j] -= cantidad
+        # Con oferta y demanda agotadas a la vez se tacha la fila y la
+        # columna queda con demanda cero (celda básica degenerada)
+        if (oferta[i] <= demanda[j] and len(activas_f) > 1) or len(activas_c) == 1:
+            filas[i] = False
+        else:
+            columnas[j] = False
+    return asignacion, base
+
+
+def _adyacencia(base: List[Tuple[int, int]], m: int, n: int) -> List[List[int]]:
+    """Árbol de la base: nodos 0..m-1 (orígenes) y m..m+n-1 (destinos)."""
+    adyacencia: List[List[int]] = [[] for _ in range(m + n)]
+    for i, j in base:
+        adyacencia[i].append(m + j)
+        adyacencia[m + j].append(i)
+    return adyacencia
+
+
+def potenciales(
+    costos: np.ndarray, base: List[Tuple[int, int]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Potenciales u, v del método MODI: u_i + v_j = c_ij en la base, u_0 = 0."""
+    m, n = costos.shape
+    adyacencia = _adyacencia(base, m, n)
+    potencial = np.full(m + n, np.nan)
+    potencial[0] = 0.0
+    cola = deque([0])
+    while cola:
+        nodo = cola.popleft()
+        for otro in adyacencia[nodo]:
+            if np.isnan(potencial[otro]):
+                i, j = (nodo, otro - m) if nodo < m else (otro, nodo - m)
+                potencial[otro] = costos[i, j] - potencial[nodo]
+                cola.append(otro)
+    return potencial[:m], potencial[m:]
+
+
+def ciclo(base: List[Tuple[int, int]], fila: int, columna: int, m: int, n: int):
+    """
+    Ciclo del paso a paso (stepping stone) que cierra la celda (fila,
+    columna): camino en el árbol de la base desde el destino hasta el
+    origen. Devuelve las celdas básicas del ciclo en orden; la primera
+    cede unidades y los signos se alternan.
+    """
+    adyacencia = _adyacencia(base, m, n)
+    anterior = {fila: None}
+    cola = deque([fila])
+    while m + columna not in anterior:
+        nodo = cola.popleft()
+        for otro in adyacencia[nodo]:
+            if otro not in anterior:
+                anterior[otro] = nodo
+                cola.append(otro)
+
+    celdas = []
+    nodo = m + columna
+    while anterior[nodo] is not None:
+        previo = anterior[nodo]
+        celdas.append((previo, nodo - m) if previo < m else (nodo, previo - m))
+        nodo = previo
+    return celdas
+
+
+def hungaro(costos: np.ndarray, presupuesto=None) -> Tuple[np.ndarray, ...]:
+    """
+    Método húngaro con potenciales, O(n² m) para n filas y m >= n columnas:
+    cada fila se agrega con una búsqueda de camino más corto sobre los
+    costos reducidos. Devuelve la columna asignada a cada fila, los
+    potenciales u (filas) y v (columnas) y el número de exploraciones.
+    """
+    n, m = costos.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    # fila_de[j]: fila (desde 1) asignada a la columna j; la columna 0 es
+    # la raíz de la búsqueda
+    fila_de = np.zeros(m + 1, dtype=int)
+    camino = np.zeros(m + 1, dtype=int)
+    exploraciones = 0
+
+    for i in range(1, n + 1):
+        if presupuesto is not None and presupuesto.agotado():
+            raise ValueError(presupuesto.error_sin_base())
+        fila_de[0] = i
+        j0 = 0
+        minimo = np.full(m + 1, np.inf)
+        usada = np.zeros(m + 1, dtype=bool)
+        while True:
+            exploraciones += 1
+            usada[j0] = True
+            i0 = fila_de[j0]
+            libres = np.flatnonzero(~usada)
+            reducidos = costos[i0 - 1, libres - 1] - u[i0] - v[libres]
+            mejora = reducidos < minimo[libres]
+            minimo[libres[mejora]] = reducidos[mejora]
+            camino[libres[mejora]] = j0
+
+            j1 = libres[np.argmin(minimo[libres])]
+            delta = minimo[j1]
+            usadas = np.flatnonzero(usada)
+            u[fila_de[usadas]] += delta
+            v[usadas] -= delta
+            minimo[libres] -= delta
+            j0 = j1
+            if fila_de[j0] == 0:
+                break
+        # Aumentar por el camino encontrado
+        while j0:
+            j1 = camino[j0]
+            fila_de[j0] = fila_de[j1]
+            j0 = j1
+
+    columna_de = np.full(n, -1)
+    asignadas = np.flatnonzero(fila_de[1:]) + 1
+    columna_de[fila_de[asignadas] - 1] = asignadas - 1
+    return columna_de, u[1:], v[1:], exploraciones
+
+
+def _cuadro(
+    asignacion: np.ndarray, oferta: np.ndarray, demanda: np.ndarray, costo: float
+) -> np.ndarray:
+    """Cuadro de transporte: asignación, oferta (última columna), demanda
+    (última fila) y costo total en la esquina."""
+    m, n = asignacion.shape
+    cuadro = np.zeros((m + 1, n + 1))
+    cuadro[:m, :n] = asignacion
+    cuadro[:m, n] = oferta
+    cuadro[m, :n] = demanda
+    cuadro[m, n] = costo
+    return cuadro
+
+
+def _paso(titulo: str, tabla: np.ndarray, variables_basicas, explicacion: str, **extra):
+    paso = {
+        "titulo": titulo,
+        "tabla": tabla.tolist(),
+        "variables_basicas": list(variables_basicas),
+    }
+    paso.update(extra)
+    paso["explicacion"] = explicacion
+    return paso
+
+
+class ProblemaTransporte:
+    """
+    Detección y resolución de problemas de transporte y asignación.
+
+    Un problema es de transporte si cada variable x_ij aparece con
+    coeficiente 1 en exactamente una fila de origen (``<=`` o ``=``, oferta)
+    y una de destino (``>=`` o ``=``, demanda), con una variable por par.
+    Se admiten:
+
+    - orígenes y destinos ``=`` con oferta y demanda balanceadas;
+    - orígenes ``<=`` y destinos ``=``; la oferta sobrante va a un destino
+      ficticio de costo cero. Los destinos ``>=`` equivalen a ``=`` si los
+      costos (en forma de minimización) no son negativos.
+
+    Se resuelve con Vogel y MODI; si todas las ofertas y demandas valen 1 es
+    de asignación y se usa el método húngaro.
+    """
+
+    def __init__(self, tolerancia: float = 1e-9):
+        self.tolerancia = tolerancia
+
+    def detectar(
+        self,
+        c: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        desigualdades: List[str],
+        tipo_optimizacion: str,
+    ) -> bool:
+        """Indica si (A, b, desigualdades) tiene estructura de transporte."""
+        A = np.asarray(A, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        num_restr, num_vars = A.shape
+        if num_restr < 2 or num_vars < 1 or (b < -self.tolerancia).any():
+            return False
+        unos = np.abs(A - 1.0) <= self.tolerancia
+        if not (unos | (np.abs(A) <= self.tolerancia)).all():
+            return False
+        if not (unos.sum(axis=0) == 2).all():
+            return False
+
+        # Filas de cada variable: una de cada lado. Los vecinos de las dos
+        # filas de la primera variable separan orígenes y destinos
+        _, filas = np.nonzero(unos.T)
+        extremos = filas.reshape(num_vars, 2)
+        lado = np.full(num_restr, -1)
+        for valor, fila in ((1, extremos[0, 0]), (0, extremos[0, 1])):
+            vecinas = extremos[(extremos == fila).any(axis=1)]
+            lado[vecinas[vecinas != fila]] = valor
+        if (lado < 0).any() or (lado[extremos[:, 0]] == lado[extremos[:, 1]]).any():
+            return False
+
+        sentidos = np.array(desigualdades)
+        if (sentidos[lado == 0] == ">=").any() or (sentidos[lado == 1] == "<=").any():
+            lado = 1 - lado
+        origenes, destinos = np.flatnonzero(lado == 0), np.flatnonzero(lado == 1)
+        m, n = len(origenes), len(destinos)
+        if num_vars != m * n:
+            return False
+
+        c = np.asarray(c, dtype=np.float64)
+        c_min = c if tipo_optimizacion == "minimizar" else -c
+        sentidos_origen = set(sentidos[origenes])
+        sentidos_destino = set(sentidos[destinos])
+        if sentidos_origen == {"="} and sentidos_destino == {"="}:
+            self.sobrante = False
+        elif sentidos_origen == {"<="} and sentidos_destino <= {"=", ">="}:
+            if ">=" in sentidos_destino and c_min.min() < -self.tolerancia:
+                return False
+            self.sobrante = True
+        else:
+            return False
+
+        # Una variable por par (origen, destino)
+        posicion = np.zeros(num_restr, dtype=int)
+        posicion[origenes] = np.arange(m)
+        posicion[destinos] = np.arange(n)
+        es_origen = lado[extremos[:, 0]] == 0
+        fila_origen = np.where(es_origen, extremos[:, 0], extremos[:, 1])
+        fila_destino = np.where(es_origen, extremos[:, 1], extremos[:, 0])
+        indice = np.full((m, n), -1)
+        indice[posicion[fila_origen], posicion[fila_destino]] = np.arange(num_vars)
+        if (indice < 0).any():
+            return False
+
+        self.c = c
+        # Los costos se guardan en forma de minimización; los costos totales
+        # de los pasos se informan con el signo del objetivo original
+        self.signo = 1.0 if tipo_optimizacion == "minimizar" else -1.0
+        self.indice = indice
+        self.costos = c_min[indice]
+        self.oferta = b[origenes]
+        self.demanda = b[destinos]
+        # Holgura de cada origen en la forma estándar (una por fila no "=")
+        holguras = np.cumsum([d != "=" for d in desigualdades]) - 1 + num_vars
+        self.holgura_origen = holguras[origenes]
+        self.es_asignacion = (
+            np.allclose(self.oferta, 1.0, atol=self.tolerancia)
+            and np.allclose(self.demanda, 1.0, atol=self.tolerancia)
+            and (m >= n if self.sobrante else m == n)
+        )
+        return True
+
+    def resolver(
+        self,
+        max_iter: int = 1000,
+        presupuesto=None,
+        registro: str = "completo",
+        cada: int = 10,
+    ) -> Dict:
+        """
+        Resuelve el problema detectado. El resultado tiene el formato de
+        ``SimplexSolver._ejecutar_simplex``; los pasos muestran el cuadro de
+        transporte (asignación, oferta, demanda y costo total) y el pivote
+        es la celda que entra a la base. Con ``registro="ninguno"`` no se
+        guardan pasos ni tabla final; con "muestreo" se guarda una iteración
+        MODI de cada ``cada`` y con "resumen" solo la inicial y la final.
+        """
+        total_oferta, total_demanda = self.oferta.sum(), self.demanda.sum()
+        holgura = self.tolerancia * (1.0 + total_oferta + total_demanda)
+        if total_oferta < total_demanda - holgura or (
+            not self.sobrante and total_oferta > total_demanda + holgura
+        ):
+            raise ValueError("El problema no tiene solución factible")
+
+        self.ficticio = False
+        self.costo_inicial = None
+        self.registro, self.cada = registro, cada
+        if self.es_asignacion:
+            asignacion, basicas, iteraciones, pasos = self._resolver_asignacion(
+                presupuesto
+            )
+        else:
+            asignacion, basicas, iteraciones, pasos = self._resolver_transporte(
+                max_iter, presupuesto
+            )
+
+        m, n = self.indice.shape
+        solucion = np.zeros(self.indice.size)
+        solucion[self.indice.ravel()] = asignacion[:, :n].ravel()
+        tabla_final = None
+        if registro != "ninguno":
+            tabla_final = pasos[-1]["tabla"]
+        self.iteraciones = iteraciones
+        return {
+            "solucion": solucion.tolist(),
+            "valor_optimo": float(self.c @ solucion),
+            "iteraciones": iteraciones,
+            "pasos": pasos,
+            "tabla_final": tabla_final,
+            "variables_basicas": basicas,
+            "transporte": self.resumen(),
+        }
+
+    def _variable(self, i: int, j: int) -> int:
+        """Índice en la forma estándar de la celda (i, j) (ficticia: holgura)."""
+        if j < self.indice.shape[1]:
+            return int(self.indice[i, j])
+        return int(self.holgura_origen[i])
+
+    def _costo(self, costos: np.ndarray, asignacion: np.ndarray) -> float:
+        return float(self.signo * (costos * asignacion).sum())
+
+    def _resolver_transporte(self, max_iter: int, presupuesto) -> Tuple:
+        costos, oferta, demanda = self.costos, self.oferta, self.demanda
+        sobrante = oferta.sum() - demanda.sum()
+        if self.sobrante and sobrante > self.tolerancia * (1.0 + oferta.sum()):
+            self.ficticio = True
+            costos = np.hstack([costos, np.zeros((len(oferta), 1))])
+            demanda = np.append(demanda, sobrante)
+        m, n = costos.shape
+        umbral = self.tolerancia * max(1.0, np.abs(costos).max())
+
+        asignacion, base = vogel(costos, oferta, demanda)
+        self.costo_inicial = self._costo(costos, asignacion)
+        pasos = []
+        if self.registro != "ninguno":
+            pasos.append(
+                _paso(
+                    "Solución inicial (Vogel)",
+                    _cuadro(asignacion, oferta, demanda, self.costo_inicial),
+                    [self._variable(i, j) for i, j in base],
+                    "Asignación inicial por aproximación de Vogel: en la fila o "
+                    "columna con mayor diferencia entre sus dos menores costos se "
+                    "asigna la celda más barata",
+                )
+            )
+
+        es_basica = np.zeros((m, n), dtype=bool)
+        es_basica[tuple(np.array(base).T)] = True
+        iteracion = 0
+        while True:
+            u, v = potenciales(costos, base)
+            reducidos = costos - u[:, np.newaxis] - v
+            reducidos[es_basica] = 0.0
+            fila, columna = np.unravel_index(np.argmin(reducidos), reducidos.shape)
+            if reducidos[fila, columna] >= -umbral:
+                break
+            if iteracion >= max_iter:
+                warnings.warn(
+                    "Máximo número de iteraciones alcanzado. Solución puede no ser óptima."
+                )
+                break
+            # Fuera de tiempo o cancelado: la asignación actual es factible
+            if presupuesto is not None and presupuesto.agotado():
+                break
+            iteracion += 1
+
+            # Ciclo: las celdas en posición par ceden unidades
+            celdas = ciclo(base, fila, columna, m, n)
+            ceden = celdas[0::2]
+            theta, sale = min((asignacion[celda], celda) for celda in ceden)
+            asignacion[fila, columna] += theta
+            for celda in ceden:
+                asignacion[celda] -= theta
+            for celda in celdas[1::2]:
+                asignacion[celda] += theta
+            asignacion[sale] = 0.0
+            base[base.index(sale)] = (int(fila), int(columna))
+            es_basica[sale] = False
+            es_basica[fila, columna] = True
+
+            if self.registro == "completo" or (
+                self.registro == "muestreo" and iteracion % self.cada == 0
+            ):
+                pasos.append(
+                    _paso(
+                        f"Iteración {iteracion} (MODI)",
+                        _cuadro(
+                            asignacion, oferta, demanda, self._costo(costos, asignacion)
+                        ),
+                        [self._variable(i, j) for i, j in base],
+                        f"Entra la celda ({fila + 1}, {columna + 1}) con costo "
+                        f"reducido {reducidos[fila, columna]:.4g}; se mueven "
+                        f"{theta:.4g} unidades por el ciclo y sale la celda "
+                        f"({sale[0] + 1}, {sale[1] + 1})",
+                        pivote={"fila": int(fila), "columna": int(columna)},
+                    )
+                )
+
+        if self.registro != "ninguno":
+            pasos.append(
+                _paso(
+                    "Solución óptima (MODI)",
+                    _cuadro(
+                        asignacion, oferta, demanda, self._costo(costos, asignacion)
+                    ),
+                    [self._variable(i, j) for i, j in base],
+                    "Ningún costo reducido c_ij - u_i - v_j de las celdas no "
+                    "básicas es negativo: la asignación es óptima",
+                )
+            )
+        return asignacion, [self._variable(i, j) for i, j in base], iteracion, pasos
+
+    def _resolver_asignacion(self, presupuesto) -> Tuple:
+        costos = self.costos
+        m, n = costos.shape
+        # El método húngaro necesita filas <= columnas: con más orígenes que
+        # destinos se asignan los destinos
+        transpuesta = m > n
+        columna_de, u, v, exploraciones = hungaro(
+            costos.T if transpuesta else costos, presupuesto
+        )
+        asignacion = np.zeros((m, n))
+        if transpuesta:
+            asignacion[columna_de, np.arange(n)] = 1.0
+            u, v = v, u
+        else:
+            asignacion[np.arange(m), columna_de] = 1.0
+
+        filas, columnas = np.nonzero(asignacion)
+        basicas = [int(self.indice[i, j]) for i, j in zip(filas, columnas)]
+        basicas += [
+            int(self.holgura_origen[i])
+            for i in np.flatnonzero(asignacion.sum(axis=1) == 0)
+        ]
+        pasos = []
+        if self.registro != "ninguno":
+            costo = self._costo(costos, asignacion)
+            pasos.append(
+                _paso(
+                    "Matriz de costos",
+                    costos,
+                    [],
+                    "Costos de asignar cada origen (fila) a cada destino (columna)"
+                    + ("" if self.signo > 0 else "; al maximizar se cambia su signo"),
+                )
+            )
+            pasos.append(
+                _paso(
+                    "Matriz reducida (método húngaro)",
+                    costos - u[:, np.newaxis] - v,
+                    basicas,
+                    "Costos reducidos c_ij - u_i - v_j: ninguno es negativo y las "
+                    "celdas asignadas valen cero",
+                )
+            )
+            pasos.append(
+                _paso(
+                    "Asignación óptima",
+                    _cuadro(asignacion, self.oferta, self.demanda, costo),
+                    basicas,
+                    f"Asignación de costo {costo:.4g} encontrada con "
+                    f"{exploraciones} exploraciones del método húngaro",
+                )
+            )
+        return asignacion, basicas, exploraciones, pasos
+
+    def resumen(self) -> Dict:
+        m, n = self.indice.shape
+        return {
+            "metodo": "hungaro" if self.es_asignacion else "vogel_modi",
+            "origenes": int(m),
+            "destinos": int(n),
+            "destino_ficticio": self.ficticio,
+            "costo_inicial": self.costo_inicial,
+            "iteraciones": self.iteraciones,
+        }
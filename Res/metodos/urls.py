@@ -7,7 +7,13 @@ from .views import (
     SimplexDetailView,
     SimplexListCreateView,
     SimplexDeleteView,
-    SimplexDetailView as SimplexAPIDetailView,  # Alias para evitar conflicto de nombres
+    SimplexCacheAPIView,
+    SimplexCancelarAPIView,
+    SimplexClonarAPIView,
+    SimplexParametricoAPIView,
+    SimplexLoteAPIView,
+    SimplexPasosAPIView,
+    SimplexDetailAPIView,
     # Falsa Posición
     FalsaPosicionListView,
     FalsaPosicionChatbotView,
@@ -63,9 +69,39 @@ urlpatterns = [
     ),
     # Vistas API (JSON)
     path("api/simplex/", SimplexListCreateView.as_view(), name="api_simplex_list"),
+    path(
+        "api/simplex/<int:pk>/pasos/",
+        SimplexPasosAPIView.as_view(),
+        name="api_simplex_pasos",
+    ),
+    path(
+        "api/simplex/<int:pk>/clonar/",
+        SimplexClonarAPIView.as_view(),
+        name="api_simplex_clonar",
+    ),
+    path(
+        "api/simplex/<int:pk>/cancelar/",
+        SimplexCancelarAPIView.as_view(),
+        name="api_simplex_cancelar",
+    ),
+    path(
+        "api/simplex/<int:pk>/parametrico/",
+        SimplexParametricoAPIView.as_view(),
+        name="api_simplex_parametrico",
+    ),
+    path(
+        "api/simplex/lote/",
+        SimplexLoteAPIView.as_view(),
+        name="api_simplex_lote",
+    ),
+    path(
+        "api/simplex/cache/",
+        SimplexCacheAPIView.as_view(),
+        name="api_simplex_cache",
+    ),
     path(
         "api/simplex/<int:pk>/",
-        SimplexAPIDetailView.as_view(),
+        SimplexDetailAPIView.as_view(),
         name="api_simplex_detail",
     ),
     # vistas API - FALSA POSICION
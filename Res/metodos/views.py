@@ -1,19 +1,24 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import ListView, CreateView, DetailView, View, DeleteView
-from django.http import JsonResponse, HttpResponseForbidden
+from django.http import JsonResponse, HttpResponseForbidden, StreamingHttpResponse
 from django.urls import reverse_lazy
 from django.contrib import messages
 from django.shortcuts import redirect
 import json
+import time
 import warnings
 import logging
+from collections import deque
+from itertools import islice
 from django.shortcuts import get_object_or_404
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 
 import logging
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from .utils import (
     falsa_posicion,
     generar_grafica,
@@ -43,14 +48,21 @@ from .forms import (
 )
 
 from .serializers import (
+    CAMPOS_PROBLEMA,
     SimplexSerializer,
+    SimplexLoteSerializer,
+    SimplexLoteItemSerializer,
+    SimplexParametricoSerializer,
     FalsaPosicionSerializer,
     GaussEliminacionSerializer,
     GaussJordanSerializer,
     DiferenciacionFinitaSerializer,
     InterpolacionNewtonSerializer,
 )
-from .formula import resolver_simplex
+from .formula import barrido_simplex, cache_resultados, resolver_simplex
+from .lote_simplex import resolver_lote
+from .registro_pasos import es_registro, expandir_pasos, reconstruir_paso
+from .campos import a_listas
 from .chatgpt_utils import (
     generar_explicacion_simplex,
     FalsaPosicionChatbot,
@@ -93,6 +105,123 @@ class MetodoChatbotView(View):
             return JsonResponse({"error": str(e)}, status=500)
 
 
+def arranque_en_caliente(problema):
+    """
+    Base óptima guardada de un problema resuelto y las iteraciones que
+    habría costado resolverlo desde cero (las realizadas más las que ya se
+    habían evitado). Devuelve (None, None) si no hay base.
+    """
+    if problema.estado not in ("optimo", "advertencia") or not problema.solucion:
+        return None, None
+    try:
+        base = json.loads(problema.solucion).get("base")
+    except (json.JSONDecodeError, AttributeError):
+        return None, None
+    if not base:
+        return None, None
+    return base, problema.iteraciones_realizadas + problema.iteraciones_evitadas
+
+
+# Pasos que recibe el prompt de la explicación: los primeros y el último
+PASOS_EXPLICACION = 10
+
+
+def serializar_paso(paso):
+    return {
+        "titulo": paso.get("titulo", "Paso"),
+        "tabla": (
+            paso["tabla"].tolist()
+            if hasattr(paso["tabla"], "tolist")
+            else paso["tabla"]
+        ),
+        "explicacion": paso.get("explicacion", ""),
+        "variables_basicas": paso.get("variables_basicas", []),
+        "pivote": paso.get("pivote", {}),
+    }
+
+
+def preparar_pasos(resultado):
+    """
+    Pasos a guardar, tabla inicial y pasos para el prompt de la explicación.
+
+    El motor por tablas entrega un registro compacto de pivotes que se
+    guarda tal cual; para el prompt se reproduce de forma perezosa y solo se
+    conservan los primeros ``PASOS_EXPLICACION`` pasos y el último.
+    """
+    registro = resultado.get("registro_pasos")
+    if registro:
+        guardar = registro
+        tabla_inicial = registro["tabla_inicial"]
+        pasos = expandir_pasos(registro)
+    else:
+        guardar = [serializar_paso(paso) for paso in resultado.get("pasos", [])]
+        tabla_inicial = guardar[0]["tabla"] if guardar else None
+        pasos = iter(guardar)
+
+    prompt = list(islice(pasos, PASOS_EXPLICACION)) + list(deque(pasos, maxlen=1))
+    return guardar, tabla_inicial, [serializar_paso(paso) for paso in prompt]
+
+
+def datos_solucion(resultado):
+    """Resumen del resultado del solver que se guarda en ``ProblemaSimplex.solucion``."""
+    return {
+        "variables": resultado["solucion"],
+        "valor_optimo": resultado["valor_optimo"],
+        "optimalidad": resultado.get("optimalidad", "óptimo"),
+        "iteraciones": resultado["iteraciones"],
+        "variables_basicas_finales": resultado.get("variables_basicas", []),
+        "regla_pivoteo": resultado.get("regla_pivoteo"),
+        "pivotes_bland": resultado.get("pivotes_bland", 0),
+        "pivotes_estancados": resultado.get("pivotes_estancados", 0),
+        "perturbaciones": resultado.get("perturbaciones", 0),
+        "presolve": resultado.get("presolve"),
+        "escalado": resultado.get("escalado"),
+        "motor": resultado.get("motor"),
+        "punto_interior": resultado.get("punto_interior"),
+        "ramificacion": resultado.get("ramificacion"),
+        "reoptimizacion": resultado.get("reoptimizacion"),
+        "base": resultado.get("base"),
+        "sensibilidad": resultado.get("sensibilidad"),
+        "interrupcion": resultado.get("interrupcion"),
+        "crash": resultado.get("crash"),
+        "dualizacion": resultado.get("dualizacion"),
+        "region_factible": resultado.get("region_factible"),
+        "transporte": resultado.get("transporte"),
+    }
+
+
+class CancelacionProblema:
+    """
+    Token de cancelación de un problema guardado: la cancelación se pide
+    desde otra petición (otro hilo o proceso del servidor), así que se
+    consulta la base de datos, a lo sumo una vez cada ``INTERVALO`` segundos.
+
+    No hay cola: el problema se resuelve dentro de la misma petición que lo
+    crea o lo edita, de modo que solo se puede cancelar mientras esa
+    petición está pivoteando y el servidor atiende otras en paralelo.
+    """
+
+    INTERVALO = 0.25
+
+    def __init__(self, pk):
+        self.pk = pk
+        self._cancelado = False
+        self._ultima_consulta = None
+
+    @property
+    def cancelado(self) -> bool:
+        ahora = time.monotonic()
+        if not self._cancelado and (
+            self._ultima_consulta is None
+            or ahora - self._ultima_consulta >= self.INTERVALO
+        ):
+            self._ultima_consulta = ahora
+            self._cancelado = ProblemaSimplex.objects.filter(
+                pk=self.pk, cancelacion_solicitada=True
+            ).exists()
+        return self._cancelado
+
+
 class SimplexListView(LoginRequiredMixin, ListView):
     model = ProblemaSimplex
     template_name = "metodo/list_simplex.html"
@@ -118,7 +247,10 @@ class SimplexCreateView(LoginRequiredMixin, CreateView):
         try:
             with warnings.catch_warnings(record=True) as w:
                 warnings.simplefilter("always")
-                resultado = resolver_simplex(self.object)
+                # La vista didáctica muestra todas las tablas intermedias
+                resultado = resolver_simplex(
+                    self.object, registro="completo", sensibilidad=True
+                )
 
                 for warning in w:
                     messages.warning(self.request, str(warning.message))
@@ -129,25 +261,10 @@ class SimplexCreateView(LoginRequiredMixin, CreateView):
             if not resultado.get("solucion"):
                 raise ValueError("El solver no devolvió una solución válida")
 
-            # Procesamiento de pasos
-            pasos = resultado.get("pasos", [])
-            pasos_serializables = []
-            for paso in pasos:
-                paso_serializado = {
-                    "titulo": paso.get("titulo", "Paso"),
-                    "tabla": (
-                        paso["tabla"].tolist()
-                        if hasattr(paso["tabla"], "tolist")
-                        else paso["tabla"]
-                    ),
-                    "explicacion": paso.get("explicacion", ""),
-                    "variables_basicas": paso.get("variables_basicas", []),
-                    "pivote": paso.get("pivote", {}),
-                }
-                pasos_serializables.append(paso_serializado)
+            pasos, tabla_inicial, pasos_prompt = preparar_pasos(resultado)
 
             # Generación de explicación con ChatGPT (versión mejorada)
-            explicacion_ia = generar_explicacion_simplex(pasos_serializables)
+            explicacion_ia = generar_explicacion_simplex(pasos_prompt)
             if not explicacion_ia:
                 logger.warning(
                     "No se pudo generar explicación para el problema ID: %s",
@@ -156,23 +273,17 @@ class SimplexCreateView(LoginRequiredMixin, CreateView):
                 explicacion_ia = "No se pudo generar la explicación automática."
 
             # Guardar resultados
-            self.object.pasos = pasos_serializables
-            self.object.tabla_inicial = json.dumps(pasos[0]["tabla"]) if pasos else None
-            self.object.tabla_final = json.dumps(resultado["tabla_final"])
-
-            solucion_data = {
-                "variables": resultado["solucion"],
-                "valor_optimo": resultado["valor_optimo"],
-                "optimalidad": resultado.get("optimalidad", "óptimo"),
-                "iteraciones": resultado["iteraciones"],
-                "variables_basicas_finales": resultado.get("variables_basicas", []),
-            }
-            self.object.solucion = json.dumps(solucion_data)
+            self.object.pasos = pasos
+            self.object.tabla_inicial = tabla_inicial
+            self.object.tabla_final = resultado["tabla_final"]
+
+            self.object.solucion = json.dumps(datos_solucion(resultado))
             self.object.grafico_base64 = resultado.get("grafico")
             self.object.variables_holgura = (
                 len(resultado["solucion"]) - self.object.variables_decision
             )
             self.object.iteraciones_realizadas = resultado["iteraciones"]
+            self.object.tiempo_resolucion = resultado.get("tiempo_resolucion")
 
             # Manejo de estados
             if resultado.get("optimalidad") == "no acotado":
@@ -234,19 +345,25 @@ class SimplexDetailView(LoginRequiredMixin, DetailView):
                 )
                 solucion = None
 
-        # Procesamiento de pasos
-        pasos = problema.pasos if problema.pasos else []
+        # Procesamiento de pasos (el registro compacto se expande al renderizar)
+        # Las tablas se leen como arreglos NumPy; la plantilla recibe listas
+        tabla_inicial = a_listas(problema.tabla_inicial)
+        tabla_final = a_listas(problema.tabla_final)
+        if es_registro(problema.pasos):
+            pasos = expandir_pasos(problema.pasos)
+        else:
+            pasos = a_listas(problema.pasos) if problema.pasos else []
 
-        if not pasos and problema.tabla_inicial and problema.tabla_final:
+        if not pasos and tabla_inicial and tabla_final:
             pasos = [
                 {
                     "titulo": "Tabla Inicial",
-                    "tabla": json.loads(problema.tabla_inicial),
+                    "tabla": tabla_inicial,
                     "explicacion": "Tabla inicial del método Simplex",
                 },
                 {
                     "titulo": "Tabla Final",
-                    "tabla": json.loads(problema.tabla_final),
+                    "tabla": tabla_final,
                     "explicacion": "Tabla final con la solución óptima",
                 },
             ]
@@ -258,12 +375,8 @@ class SimplexDetailView(LoginRequiredMixin, DetailView):
             "es_2d": problema.variables_decision == 2,
             "estado": problema.estado,
             "iteraciones": problema.iteraciones_realizadas,
-            "tabla_inicial": (
-                json.loads(problema.tabla_inicial) if problema.tabla_inicial else None
-            ),
-            "tabla_final": (
-                json.loads(problema.tabla_final) if problema.tabla_final else None
-            ),
+            "tabla_inicial": tabla_inicial,
+            "tabla_final": tabla_final,
         }
 
         context["datos_completos"] = datos_completos
@@ -271,25 +384,40 @@ class SimplexDetailView(LoginRequiredMixin, DetailView):
         return context
 
 
-class SimplexListCreateView(ListCreateAPIView):
-    serializer_class = SimplexSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        return ProblemaSimplex.objects.filter(usuario=self.request.user).order_by(
-            "-creado"
-        )
-
-    def perform_create(self, serializer):
-        problema = serializer.save(usuario=self.request.user)
-
+class SimplexResolucionAPIMixin:
+    """
+    Resuelve un ProblemaSimplex desde la API y guarda el resultado. Con
+    ``?diagnostico=1`` se resuelve también sin escalar para informar los
+    pivotes que ahorra el escalado.
+    """
+
+    def diagnostico_solicitado(self) -> bool:
+        return self.request.query_params.get("diagnostico") in ("1", "true")
+
+    def resolver_y_guardar(
+        self, problema, base_anterior=None, iteraciones_en_frio=None
+    ):
+        """
+        ``base_anterior`` es la base óptima de otro problema (o de este
+        antes de editarlo) e ``iteraciones_en_frio`` lo que costó resolverlo
+        desde cero; con ambas se registran las iteraciones evitadas.
+        """
+        cancelacion = CancelacionProblema(problema.pk)
         try:
             with warnings.catch_warnings(record=True) as w:
                 warnings.simplefilter("always")
-                resultado = resolver_simplex(problema)
-                if w:
-                    problema.advertencias = [str(warn.message) for warn in w]
+                resultado = resolver_simplex(
+                    problema,
+                    registro="resumen",
+                    base_anterior=base_anterior,
+                    sensibilidad=True,
+                    cancelacion=cancelacion,
+                    medir_escalado=self.diagnostico_solicitado(),
+                )
+                # Al reoptimizar no deben quedar las advertencias anteriores
+                problema.advertencias = [str(warn.message) for warn in w] or None
 
+            problema.tiempo_resolucion = resultado.get("tiempo_resolucion")
             if resultado.get("error"):
                 problema.estado = "error"
                 problema.save()
@@ -300,25 +428,10 @@ class SimplexListCreateView(ListCreateAPIView):
                 problema.save()
                 raise ValueError("No se encontró solución válida")
 
-            # Procesamiento de pasos
-            pasos = resultado.get("pasos", [])
-            pasos_serializables = []
-            for paso in pasos:
-                paso_serializado = {
-                    "titulo": paso.get("titulo", "Paso"),
-                    "tabla": (
-                        paso["tabla"].tolist()
-                        if hasattr(paso["tabla"], "tolist")
-                        else paso["tabla"]
-                    ),
-                    "explicacion": paso.get("explicacion", ""),
-                    "variables_basicas": paso.get("variables_basicas", []),
-                    "pivote": paso.get("pivote", {}),
-                }
-                pasos_serializables.append(paso_serializado)
+            pasos, tabla_inicial, pasos_prompt = preparar_pasos(resultado)
 
             # Generación de explicación con ChatGPT (versión mejorada)
-            explicacion_ia = generar_explicacion_simplex(pasos_serializables)
+            explicacion_ia = generar_explicacion_simplex(pasos_prompt)
             if not explicacion_ia:
                 logger.warning(
                     "No se pudo generar explicación (API) para problema ID: %s",
@@ -326,27 +439,32 @@ class SimplexListCreateView(ListCreateAPIView):
                 )
                 explicacion_ia = "No se pudo generar la explicación automática."
 
-            problema.pasos = pasos_serializables
-            problema.tabla_inicial = json.dumps(pasos[0]["tabla"]) if pasos else None
-            problema.tabla_final = json.dumps(resultado["tabla_final"])
+            problema.pasos = pasos
+            problema.tabla_inicial = tabla_inicial
+            problema.tabla_final = resultado["tabla_final"]
 
-            solucion_data = {
-                "variables": resultado["solucion"],
-                "valor_optimo": resultado["valor_optimo"],
-                "optimalidad": resultado.get("optimalidad", "óptimo"),
-                "iteraciones": resultado["iteraciones"],
-                "variables_basicas_finales": resultado.get("variables_basicas", []),
-            }
-            problema.solucion = json.dumps(solucion_data)
+            problema.solucion = json.dumps(datos_solucion(resultado))
             problema.grafico_base64 = resultado.get("grafico")
             problema.variables_holgura = (
                 len(resultado["solucion"]) - problema.variables_decision
             )
             problema.iteraciones_realizadas = resultado["iteraciones"]
+            arranque = (resultado.get("reoptimizacion") or {}).get("arranque")
+            problema.iteraciones_evitadas = (
+                iteraciones_en_frio - resultado["iteraciones"]
+                if arranque and iteraciones_en_frio is not None
+                else 0
+            )
 
             # Manejo de estados
+            interrupcion = resultado.get("interrupcion") or {}
             if resultado.get("optimalidad") == "no acotado":
                 problema.estado = "no_acotado"
+            elif interrupcion.get("motivo") == "cancelado":
+                problema.estado = "cancelado"
+                problema.advertencias = (problema.advertencias or []) + [
+                    resultado["warning"]
+                ]
             elif resultado.get("warning"):
                 problema.estado = "advertencia"
                 problema.advertencias = (problema.advertencias or []) + [
@@ -370,6 +488,20 @@ class SimplexListCreateView(ListCreateAPIView):
             raise
 
 
+class SimplexListCreateView(SimplexResolucionAPIMixin, ListCreateAPIView):
+    serializer_class = SimplexSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return ProblemaSimplex.objects.filter(usuario=self.request.user).order_by(
+            "-creado"
+        )
+
+    def perform_create(self, serializer):
+        problema = serializer.save(usuario=self.request.user)
+        self.resolver_y_guardar(problema)
+
+
 class SimplexDeleteView(LoginRequiredMixin, DeleteView):
     model = ProblemaSimplex
     success_url = reverse_lazy("list_simplex")
@@ -382,13 +514,185 @@ class SimplexDeleteView(LoginRequiredMixin, DeleteView):
         return super().delete(request, *args, **kwargs)
 
 
-class SimplexDetailAPIView(RetrieveUpdateDestroyAPIView):
+class SimplexLoteAPIView(APIView):
+    """
+    Resuelve un lote de problemas Simplex en un pool de procesos.
+
+    La respuesta es NDJSON: una línea por problema en orden de finalización
+    (con su ``indice`` en el lote, ``estado`` y ``error``) y una línea final
+    con el resumen del lote.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        lote = SimplexLoteSerializer(data=request.data)
+        lote.is_valid(raise_exception=True)
+        datos = lote.validated_data
+
+        validos, indices, invalidos = [], [], []
+        for indice, problema in enumerate(datos["problemas"]):
+            item = SimplexLoteItemSerializer(data=problema)
+            if item.is_valid():
+                validos.append(dict(item.validated_data))
+                indices.append(indice)
+            else:
+                invalidos.append(
+                    {"indice": indice, "estado": "error", "error": item.errors}
+                )
+
+        def generar():
+            estados = {}
+            for item in invalidos:
+                estados["error"] = estados.get("error", 0) + 1
+                yield json.dumps(item) + "\n"
+            for item in resolver_lote(
+                validos, datos.get("trabajadores"), datos["incluir_pasos"]
+            ):
+                # Reexpresar el índice respecto al lote recibido
+                item["indice"] = indices[item["indice"]]
+                estados[item["estado"]] = estados.get(item["estado"], 0) + 1
+                yield json.dumps(item) + "\n"
+            yield json.dumps(
+                {"fin": True, "total": len(datos["problemas"]), "estados": estados}
+            ) + "\n"
+
+        return StreamingHttpResponse(generar(), content_type="application/x-ndjson")
+
+
+class SimplexPasosAPIView(APIView):
+    """
+    Pasos de un problema Simplex. Con ``?paso=n`` reconstruye solo la tabla
+    de ese paso a partir del registro de pivotes.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk, *args, **kwargs):
+        problema = get_object_or_404(ProblemaSimplex, pk=pk, usuario=request.user)
+        pasos = problema.pasos or []
+        indice = request.query_params.get("paso")
+
+        if indice is None:
+            pasos = list(expandir_pasos(pasos)) if es_registro(pasos) else pasos
+            return Response({"total": len(pasos), "pasos": a_listas(pasos)})
+
+        try:
+            indice = int(indice)
+            if es_registro(pasos):
+                return Response(reconstruir_paso(pasos, indice))
+            if not 0 <= indice < len(pasos):
+                raise ValueError(f"El paso {indice} no existe")
+            return Response(a_listas(pasos[indice]))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+
+
+class SimplexCacheAPIView(APIView):
+    """Estadísticas de la caché de resultados Simplex (DELETE la vacía)."""
+
+    def get_permissions(self):
+        if self.request.method == "DELETE":
+            return [IsAdminUser()]
+        return [IsAuthenticated()]
+
+    def get(self, request, *args, **kwargs):
+        return Response(cache_resultados.estadisticas())
+
+    def delete(self, request, *args, **kwargs):
+        cache_resultados.invalidar()
+        return Response(cache_resultados.estadisticas())
+
+
+class SimplexDetailAPIView(SimplexResolucionAPIMixin, RetrieveUpdateDestroyAPIView):
+    """
+    Al editar un problema ya resuelto se reoptimiza desde su base óptima
+    guardada (Simplex primal o dual según qué factibilidad se conserve) en
+    lugar de resolver desde cero.
+    """
+
     serializer_class = SimplexSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         return ProblemaSimplex.objects.filter(usuario=self.request.user)
 
+    def perform_update(self, serializer):
+        base, iteraciones_en_frio = arranque_en_caliente(serializer.instance)
+        problema = serializer.save(estado="procesando", cancelacion_solicitada=False)
+        self.resolver_y_guardar(problema, base, iteraciones_en_frio)
+
+
+class SimplexClonarAPIView(SimplexResolucionAPIMixin, APIView):
+    """
+    Clona un problema con modificaciones (los campos enviados reemplazan a
+    los del original) y lo resuelve partiendo de la base óptima del
+    original: Simplex primal si sigue siendo factible, dual si solo es dual
+    factible o Fase I desde la base reparada en otro caso.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk, *args, **kwargs):
+        origen = get_object_or_404(ProblemaSimplex, pk=pk, usuario=request.user)
+        datos = {campo: getattr(origen, campo) for campo in CAMPOS_PROBLEMA}
+        datos.update(request.data.items())
+        datos["usuario"] = request.user.pk
+
+        serializer = SimplexSerializer(data=datos)
+        serializer.is_valid(raise_exception=True)
+        base, iteraciones_en_frio = arranque_en_caliente(origen)
+        problema = serializer.save(usuario=request.user, problema_origen=origen)
+        try:
+            self.resolver_y_guardar(problema, base, iteraciones_en_frio)
+        except ValueError as e:
+            return Response({"id": problema.pk, "error": str(e)}, status=400)
+        return Response(SimplexSerializer(problema).data, status=201)
+
+
+class SimplexCancelarAPIView(APIView):
+    """
+    Pide cancelar la resolución en curso de un problema. El solver la
+    atiende en el siguiente pivote y guarda la mejor base encontrada con
+    estado "cancelado". La resolución es síncrona (ver
+    ``CancelacionProblema``): no existen problemas en espera de resolverse.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk, *args, **kwargs):
+        problema = get_object_or_404(ProblemaSimplex, pk=pk, usuario=request.user)
+        actualizados = ProblemaSimplex.objects.filter(
+            pk=problema.pk, estado="procesando"
+        ).update(cancelacion_solicitada=True)
+        if not actualizados:
+            return Response(
+                {"error": "El problema no se está resolviendo"},
+                status=409,
+            )
+        return Response({"id": problema.pk, "cancelacion_solicitada": True}, status=202)
+
+
+class SimplexParametricoAPIView(APIView):
+    """
+    Barrido paramétrico de un lado derecho o de un costo: tramos en los que
+    la base óptima no cambia y el valor óptimo en sus extremos, obtenidos
+    con cambios de base desde la base óptima guardada.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk, *args, **kwargs):
+        problema = get_object_or_404(ProblemaSimplex, pk=pk, usuario=request.user)
+        serializer = SimplexParametricoSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        base, _ = arranque_en_caliente(problema)
+        try:
+            barrido = barrido_simplex(problema, base=base, **serializer.validated_data)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+        return Response(barrido)
+
 
 class FalsaPosicionListView(LoginRequiredMixin, ListView):
     model = FalsaPosicion